@@ -1,5 +1,7 @@
 # bot.py
+import asyncio
 import logging
+import time
 import traceback
 from pathlib import Path
 import os
@@ -7,11 +9,24 @@ from dotenv import load_dotenv
 import discord
 from discord.ext import commands
 
+from core import lazy
+from core.command_sync import CommandSyncer
+from core.database import Database
+from core.guild_config import GuildConfigService
+from core.http import HTTPClient
+from core.loader import format_report, load_extensions
+from core.pipeline import MessagePipeline
+from core.reload import ExtensionReloader
+from core.scheduler import JobScheduler
+
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 PREFIX = os.getenv("PREFIX", "!")
 OWNER_ID = int(os.getenv("OWNER_ID", 0))
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID", 0)) or None  # optional fast sync while developing
+# discord.py's Message cache; cogs that track edits/deletes use raw events, so 0 (disabled) is safe
+MAX_MESSAGES = int(os.getenv("MAX_MESSAGES", 1000))
+AUTO_RELOAD = bool(int(os.getenv("AUTO_RELOAD", 0)))  # reload cogs when their files change (development)
 
 # Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
@@ -24,38 +39,83 @@ intents.guilds = True
 
 class DiscordBot(commands.Bot):
     def __init__(self):
-        super().__init__(command_prefix=PREFIX, intents=intents, help_command=None)
+        super().__init__(
+            command_prefix=PREFIX, intents=intents, help_command=None, max_messages=MAX_MESSAGES or None
+        )
         self.owner_id = OWNER_ID
+        # shared delayed-job scheduler (reminders, timers, ...); cogs register handlers on load
+        self.scheduler = JobScheduler(self)
+        # shared SQLite store (infractions, blacklist, guild settings)
+        self.db = Database()
+        # cached per-guild settings on top of the database
+        self.guild_config = GuildConfigService(self.db)
+        # shared aiohttp session for cogs calling external APIs
+        self.http_client = HTTPClient()
+        # one on_message dispatch shared by the auto-moderation detectors
+        self.pipeline = MessagePipeline()
+        self.add_listener(self.pipeline.dispatch, "on_message")
+        # application command sync, skipped when the tree hash is unchanged
+        self.command_sync = CommandSyncer(self, guild_id=DEV_GUILD_ID)
+        # owner-driven or file-watching hot reload of cogs
+        self.reloader = ExtensionReloader(self)
+        # per-extension load timings from the last startup (see core/loader.py)
+        self.startup_report = []
+        self.startup_ms = 0.0
+        self._warm_task = None
 
     async def setup_hook(self):
+        await self.db.open()
+        await self.guild_config.load()
+        await self.scheduler.start()
+        await self.http_client.start()
+
         logger.info("Auto-loading cogs...")
         base = Path("cogs")
         if not base.exists():
             logger.warning("No cogs directory found at %s", base.resolve())
 
-        # Load all python files under cogs (skip __init__.py)
-        for py in base.rglob("*.py"):
-            if py.name == "__init__.py":
-                continue
-            module = ".".join(py.with_suffix("").parts)  # e.g. cogs.fun.insult
-            try:
-                await self.load_extension(module)
-                logger.info("✅ Loaded: %s", module)
-            except Exception:
-                logger.exception("❌ Failed to load %s", module)
-
-        # Sync application commands (fast per-guild if DEV_GUILD_ID set)
+        # Dependencies are imported concurrently, then each extension is set up in order
+        started = time.perf_counter()
+        self.startup_report = await load_extensions(self, base)
+        self.startup_ms = (time.perf_counter() - started) * 1000
+        logger.info("Extension load times:\n%s", format_report(self.startup_report, self.startup_ms))
+
+        # Heavy modules deferred with lazy_import are pulled in while the gateway connects
+        self._warm_task = asyncio.create_task(lazy.warm())
+
+        # Sync application commands (fast per-guild if DEV_GUILD_ID set); only uploads
+        # when the serialized tree differs from the last sync recorded in data/
         try:
-            if DEV_GUILD_ID:
-                guild = discord.Object(id=DEV_GUILD_ID)
-                await self.tree.sync(guild=guild)
-                logger.info("✅ Synced app commands to dev guild %s", DEV_GUILD_ID)
-            else:
-                await self.tree.sync()
-                logger.info("✅ Synced global app commands")
+            await self.command_sync.sync()
         except Exception:
             logger.exception("❌ Slash command sync error")
 
+        if AUTO_RELOAD:
+            self.reloader.start_watching()
+
+    async def close(self):
+        try:
+            await self.reloader.stop_watching()
+        except Exception:
+            logger.exception("Failed to stop the cog watcher")
+        try:
+            await self.scheduler.close()
+        except Exception:
+            logger.exception("Failed to flush scheduled jobs")
+        try:
+            await self.http_client.close()
+        except Exception:
+            logger.exception("Failed to close HTTP client")
+        try:
+            await self.guild_config.close()
+        except Exception:
+            logger.exception("Failed to flush guild settings")
+        try:
+            await self.db.close()
+        except Exception:
+            logger.exception("Failed to close database")
+        await super().close()
+
     async def on_ready(self):
         logger.info("Bot is online as %s (ID: %s)", self.user, self.user.id)
         # Set presence to show prefix help
@@ -1,33 +1,62 @@
+import random
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
+
+from core.prefetch import PrefetchPool
+
+SEARCH_API = 'https://icanhazdadjoke.com/search'
+HEADERS = {'Accept': 'application/json'}
+POOL_SIZE = 30
+PAGE_SIZE = 30  # the search endpoint's maximum page size
 
 class DadJoke(commands.Cog):
     """Dad joke commands for fun"""
     
     def __init__(self, bot):
         self.bot = bot
+        # learned from the first search response; later batches pick a random page
+        self._total_pages = None
+        self.pool = PrefetchPool(
+            "dadjoke", self._fetch_jokes, key=lambda j: j['id'],
+            size=POOL_SIZE, low_water=POOL_SIZE // 3, batch=PAGE_SIZE,
+        )
+    
+    async def cog_load(self):
+        self.pool.start()
+    
+    def cog_unload(self):
+        self.pool.close()
+    
+    async def _fetch_jokes(self, count):
+        # one page of the search endpoint is a batch of up to 30 jokes
+        page = random.randint(1, self._total_pages) if self._total_pages else 1
+        params = {'limit': PAGE_SIZE, 'page': page}
+        async with self.bot.http_client.session.get(SEARCH_API, headers=HEADERS, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+        self._total_pages = data.get('total_pages') or self._total_pages
+        jokes = [j for j in data.get('results', []) if j.get('joke')]
+        random.shuffle(jokes)
+        return jokes
     
     @commands.hybrid_command(name="dadjoke", description="Get a random dad joke")
     async def dadjoke(self, ctx):
         """Get a random dad joke"""
-        async with aiohttp.ClientSession() as session:
-            headers = {'Accept': 'application/json'}
-            async with session.get('https://icanhazdadjoke.com/', headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    embed = discord.Embed(
-                        title="👨 Dad Joke",
-                        description=data['joke'],
-                        color=discord.Color.blue()
-                    )
-                    embed.set_footer(text="icanhazdadjoke.com")
-                    
-                    await ctx.send(embed=embed)
-                else:
-                    await ctx.send("Failed to fetch dad joke. Try again!")
+        data = await self.pool.get()
+        if data is None:
+            await ctx.send("Failed to fetch dad joke. Try again!")
+            return
+        
+        embed = discord.Embed(
+            title="👨 Dad Joke",
+            description=data['joke'],
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="icanhazdadjoke.com")
+        
+        await ctx.send(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(DadJoke(bot))
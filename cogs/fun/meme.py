@@ -1,32 +1,52 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
+
+from core.prefetch import PrefetchPool
+
+MEME_API = 'https://meme-api.com/gimme/{count}'
+POOL_SIZE = 30
+BATCH_SIZE = 15  # meme-api caps /gimme/{count} at 50
 
 class Meme(commands.Cog):
     """Meme commands for fun"""
     
     def __init__(self, bot):
         self.bot = bot
+        # memes are fetched in batches ahead of time and served from memory
+        self.pool = PrefetchPool(
+            "meme", self._fetch_memes, key=lambda m: m['postLink'],
+            size=POOL_SIZE, low_water=POOL_SIZE // 3, batch=BATCH_SIZE,
+        )
+    
+    async def cog_load(self):
+        self.pool.start()
+    
+    def cog_unload(self):
+        self.pool.close()
+    
+    async def _fetch_memes(self, count):
+        async with self.bot.http_client.session.get(MEME_API.format(count=count)) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return [m for m in data.get('memes', []) if m.get('url') and m.get('postLink')]
     
     @commands.hybrid_command(name="meme", description="Get a random meme")
     async def meme(self, ctx):
         """Get a random meme from Reddit"""
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://meme-api.com/gimme') as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    embed = discord.Embed(
-                        title=data['title'],
-                        color=discord.Color.random()
-                    )
-                    embed.set_image(url=data['url'])
-                    embed.set_footer(text=f"👍 {data['ups']} | r/{data['subreddit']}")
-                    
-                    await ctx.send(embed=embed)
-                else:
-                    await ctx.send("Failed to fetch meme. Try again!")
+        data = await self.pool.get()
+        if data is None:
+            await ctx.send("Failed to fetch meme. Try again!")
+            return
+        
+        embed = discord.Embed(
+            title=data['title'],
+            color=discord.Color.random()
+        )
+        embed.set_image(url=data['url'])
+        embed.set_footer(text=f"👍 {data['ups']} | r/{data['subreddit']}")
+        
+        await ctx.send(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(Meme(bot))
@@ -2,28 +2,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import datetime
-import json
-import os
 
 class AdvancedModeration(commands.Cog):
     """Advanced moderation commands (softban, prune, infractions, modlog, report, blacklist, whitelist)"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.warnings_file = "warnings.json"
-        self.blacklist_file = "blacklist.json"
-        self.warnings = self.load_json(self.warnings_file)
-        self.blacklist = self.load_json(self.blacklist_file)
-    
-    def load_json(self, filename):
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def save_json(self, filename, data):
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        # warnings and blacklist live in the shared SQLite store (core/database.py)
+        self.db = bot.db
     
     @commands.hybrid_command(
         name="softban",
@@ -104,10 +90,7 @@ class AdvancedModeration(commands.Cog):
     async def infractions(self, ctx, member: discord.Member):
         """Show member infractions"""
         
-        guild_key = str(ctx.guild.id)
-        user_key = str(member.id)
-        
-        warnings = self.warnings.get(guild_key, {}).get(user_key, [])
+        total, warnings = await self.db.get_infractions(ctx.guild.id, member.id, action="warn", limit=5)
         
         if not warnings:
             embed = discord.Embed(
@@ -123,7 +106,7 @@ class AdvancedModeration(commands.Cog):
             timestamp=datetime.datetime.now()
         )
         
-        for i, warning in enumerate(warnings[-5:], 1):  # Show last 5
+        for i, warning in enumerate(warnings, 1):  # Show last 5
             moderator = ctx.guild.get_member(warning['moderator_id'])
             mod_name = moderator.name if moderator else "Unknown"
             timestamp = warning['timestamp'][:10]  # Date only
@@ -133,7 +116,7 @@ class AdvancedModeration(commands.Cog):
                 inline=False
             )
         
-        embed.set_footer(text=f"Total warnings: {len(warnings)}")
+        embed.set_footer(text=f"Total warnings: {total}")
         await ctx.send(embed=embed)
     
     @commands.hybrid_command(
@@ -197,10 +180,7 @@ class AdvancedModeration(commands.Cog):
     async def blacklist(self, ctx, user_id: str):
         """Blacklist a user from bot usage"""
         
-        if not self.blacklist.get('users'):
-            self.blacklist['users'] = []
-        
-        if user_id in self.blacklist['users']:
+        if not await self.db.add_to_blacklist(user_id):
             embed = discord.Embed(
                 title="⚠️ Already Blacklisted",
                 description=f"User `{user_id}` is already blacklisted.",
@@ -208,9 +188,6 @@ class AdvancedModeration(commands.Cog):
             )
             return await ctx.send(embed=embed)
         
-        self.blacklist['users'].append(user_id)
-        self.save_json(self.blacklist_file, self.blacklist)
-        
         embed = discord.Embed(
             title="⛔ User Blacklisted",
             description=f"User `{user_id}` has been blacklisted from bot usage.",
@@ -230,7 +207,7 @@ class AdvancedModeration(commands.Cog):
     async def whitelist(self, ctx, user_id: str):
         """Whitelist a user for bot usage"""
         
-        if not self.blacklist.get('users') or user_id not in self.blacklist['users']:
+        if not await self.db.remove_from_blacklist(user_id):
             embed = discord.Embed(
                 title="⚠️ Not Blacklisted",
                 description=f"User `{user_id}` is not blacklisted.",
@@ -238,9 +215,6 @@ class AdvancedModeration(commands.Cog):
             )
             return await ctx.send(embed=embed)
         
-        self.blacklist['users'].remove(user_id)
-        self.save_json(self.blacklist_file, self.blacklist)
-        
         embed = discord.Embed(
             title="✅ User Whitelisted",
             description=f"User `{user_id}` has been removed from the blacklist.",
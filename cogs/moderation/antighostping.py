@@ -2,12 +2,58 @@
 
 Provides anti-ghost ping functionality to detect deleted pings.
 Supports both slash commands and prefix commands with multi-guild logic.
+
+Only messages that mention a user, a role or @everyone are remembered. They
+live in a per-guild LRU (capped at MAX_PINGS_PER_GUILD) and expire after
+PING_TTL seconds, so memory stays bounded no matter how busy the guild is.
+Raw gateway events are used so deletes and edits are caught even when the
+message has fallen out of discord.py's message cache.
 """
 
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from typing import Optional
+
+from core.pipeline import ParsedMessage
+
+PING_TTL = 600              # seconds a ping is watched after it is sent
+MAX_PINGS_PER_GUILD = 500   # LRU cap per guild
+MAX_SNIPPET = 200           # characters of content kept for the report
+PIPELINE_PRIORITY = 100     # after the filters, so pings they delete aren't reported
+
+
+@dataclass(frozen=True)
+class AntiGhostPingSettings:
+    """Per-guild anti-ghost ping settings (stored by the guild config service)."""
+
+    enabled: bool = False
+
+
+class _PingRecord:
+    """Compact snapshot of a message that pinged someone."""
+
+    __slots__ = ("author_id", "channel_id", "user_ids", "role_ids", "everyone", "content", "created")
+
+    def __init__(self, author_id: int, channel_id: int, user_ids: Tuple[int, ...],
+                 role_ids: Tuple[int, ...], everyone: bool, content: str):
+        self.author_id = author_id
+        self.channel_id = channel_id
+        self.user_ids = user_ids
+        self.role_ids = role_ids
+        self.everyone = everyone
+        self.content = content[:MAX_SNIPPET]
+        self.created = time.monotonic()
+
+    def targets(self) -> str:
+        parts = [f"<@{uid}>" for uid in self.user_ids] + [f"<@&{rid}>" for rid in self.role_ids]
+        if self.everyone:
+            parts.append("@everyone")
+        return ", ".join(parts)
 
 
 class AntiGhostPing(commands.Cog):
@@ -15,31 +61,197 @@ class AntiGhostPing(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        # Multi-guild configuration storage
-        self.guild_configs = {}
-        # Track recent messages with pings
-        self.recent_pings = {}
+        # Persistent multi-guild configuration
+        self.settings = bot.guild_config.register("antighostping", AntiGhostPingSettings)
+        # Track recent messages with pings: {guild_id: OrderedDict[message_id, _PingRecord]}
+        self.recent_pings: Dict[int, "OrderedDict[int, _PingRecord]"] = {}
+        self.sweep_expired.start()
+
+    async def cog_load(self):
+        self.bot.pipeline.register(
+            "antighostping", self.capture, priority=PIPELINE_PRIORITY, is_enabled=self._enabled
+        )
+
+    def cog_unload(self):
+        self.bot.pipeline.unregister("antighostping")
+        self.sweep_expired.cancel()
+
+    def export_state(self) -> dict:
+        """Watched pings as plain tuples, handed to the cog after a hot reload."""
+        return {
+            guild_id: [
+                (message_id, r.author_id, r.channel_id, r.user_ids, r.role_ids, r.everyone, r.content, r.created)
+                for message_id, r in cache.items()
+            ]
+            for guild_id, cache in self.recent_pings.items()
+        }
+
+    def import_state(self, state: dict):
+        for guild_id, records in state.items():
+            cache = self.recent_pings.setdefault(guild_id, OrderedDict())
+            for message_id, author_id, channel_id, user_ids, role_ids, everyone, content, created in records:
+                record = _PingRecord(author_id, channel_id, user_ids, role_ids, everyone, content)
+                record.created = created  # monotonic clock, so still valid in the same process
+                cache[message_id] = record
 
     @commands.hybrid_command(name="antighostping", description="Configure anti-ghost ping settings")
     @commands.has_permissions(manage_guild=True)
     async def antighostping(self, ctx, action: str):
         """Configure anti-ghost ping settings for the server.
-        
+
         Args:
             ctx: Command context
             action: Action to perform (enable/disable)
         """
         guild_id = ctx.guild.id
-        
+
         if action.lower() == "enable":
-            self.guild_configs[guild_id] = {"enabled": True}
+            self.settings.update(guild_id, enabled=True)
             await ctx.send("✅ Anti-ghost ping enabled")
         elif action.lower() == "disable":
-            self.guild_configs[guild_id] = {"enabled": False}
+            self.settings.update(guild_id, enabled=False)
+            self.recent_pings.pop(guild_id, None)
             await ctx.send("❌ Anti-ghost ping disabled")
         else:
             await ctx.send("Invalid action. Use: enable/disable")
 
+    def _enabled(self, guild_id: Optional[int]) -> bool:
+        return bool(guild_id) and self.settings.get(guild_id).enabled
+
+    def _pop_live(self, guild_id: int, message_id: int) -> Optional[_PingRecord]:
+        cache = self.recent_pings.get(guild_id)
+        if not cache:
+            return None
+        record = cache.pop(message_id, None)
+        if record is None or time.monotonic() - record.created > PING_TTL:
+            return None
+        return record
+
+    # --- capture ---
+    async def capture(self, parsed: ParsedMessage) -> bool:
+        """Pipeline stage: remember messages that ping someone. Never consumes."""
+        user_ids = parsed.user_mentions
+        role_ids = tuple(parsed.role_mentions)
+        if not (user_ids or role_ids or parsed.mentions_everyone):
+            return False
+
+        message = parsed.message
+        cache = self.recent_pings.setdefault(parsed.guild_id, OrderedDict())
+        cache[message.id] = _PingRecord(
+            parsed.author.id, message.channel.id, user_ids, role_ids,
+            parsed.mentions_everyone, parsed.content,
+        )
+        while len(cache) > MAX_PINGS_PER_GUILD:
+            cache.popitem(last=False)
+        return False
+
+    # --- detection ---
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if not self._enabled(payload.guild_id):
+            return
+        record = self._pop_live(payload.guild_id, payload.message_id)
+        if record is not None:
+            await self._announce([record], "deleted")
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """A purge is one pass over the deleted ids against the guild's cache."""
+        if not self._enabled(payload.guild_id):
+            return
+        cache = self.recent_pings.get(payload.guild_id)
+        if not cache:
+            return
+        now = time.monotonic()
+        hits = []
+        for message_id in payload.message_ids:
+            record = cache.pop(message_id, None)
+            if record is not None and now - record.created <= PING_TTL:
+                hits.append(record)
+        if hits:
+            await self._announce(hits, "deleted")
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        if not self._enabled(payload.guild_id) or "content" not in payload.data:
+            return
+        record = self._pop_live(payload.guild_id, payload.message_id)
+        if record is None:
+            return
+
+        data = payload.data
+        still_users = {int(u["id"]) for u in data.get("mentions", [])}
+        still_roles = {int(r) for r in data.get("mention_roles", [])}
+        still_everyone = bool(data.get("mention_everyone"))
+
+        removed = _PingRecord(
+            record.author_id, record.channel_id,
+            tuple(u for u in record.user_ids if u not in still_users),
+            tuple(r for r in record.role_ids if r not in still_roles),
+            record.everyone and not still_everyone,
+            record.content,
+        )
+        if removed.user_ids or removed.role_ids or removed.everyone:
+            await self._announce([removed], "edited out")
+
+        # keep watching whatever mentions remain, as a new watch: it goes to the end of
+        # the cache with a fresh timestamp, so the cache stays in creation order for the sweep
+        remaining = _PingRecord(
+            record.author_id, record.channel_id,
+            tuple(u for u in record.user_ids if u in still_users),
+            tuple(r for r in record.role_ids if r in still_roles),
+            record.everyone and still_everyone,
+            data.get("content", ""),
+        )
+        if remaining.user_ids or remaining.role_ids or remaining.everyone:
+            self.recent_pings.setdefault(payload.guild_id, OrderedDict())[payload.message_id] = remaining
+
+    async def _announce(self, records: List[_PingRecord], how: str):
+        # group by channel so a purge produces one report per channel
+        by_channel: Dict[int, List[_PingRecord]] = {}
+        for record in records:
+            by_channel.setdefault(record.channel_id, []).append(record)
+
+        for channel_id, group in by_channel.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            embed = discord.Embed(
+                title="👻 Ghost Ping Detected",
+                color=discord.Color.orange(),
+                timestamp=discord.utils.utcnow(),
+            )
+            for record in group[:10]:
+                embed.add_field(
+                    name=f"Ping {how}",
+                    value=(
+                        f"**Author:** <@{record.author_id}>\n"
+                        f"**Pinged:** {record.targets()}\n"
+                        f"**Message:** {record.content or '*No text*'}"
+                    )[:1024],
+                    inline=False,
+                )
+            if len(group) > 10:
+                embed.set_footer(text=f"+{len(group) - 10} more ghost ping(s)")
+            try:
+                await channel.send(embed=embed, allowed_mentions=discord.AllowedMentions.none())
+            except (discord.Forbidden, discord.HTTPException):
+                pass
+
+    @tasks.loop(seconds=60)
+    async def sweep_expired(self):
+        """Drop pings older than PING_TTL (caches are in creation order; lookups re-check the TTL)."""
+        cutoff = time.monotonic() - PING_TTL
+        for guild_id in list(self.recent_pings):
+            cache = self.recent_pings[guild_id]
+            while cache:
+                _, record = next(iter(cache.items()))
+                if record.created >= cutoff:
+                    break
+                cache.popitem(last=False)
+            if not cache:
+                del self.recent_pings[guild_id]
+
 
 async def setup(bot):
     """Load the AntiGhostPing cog."""
@@ -2,13 +2,72 @@
 
 Provides anti-link functionality to prevent unauthorized link posting.
 Supports both slash commands and prefix commands with multi-guild logic.
+
+Links are pulled out of a message once by the bot's MessagePipeline (plain
+URLs, Discord invites and masked markdown links, hosts lowercased and
+IDNA-normalized) and checked against a per-guild domain trie keyed on
+reversed labels, so a lookup costs O(labels in the host) no matter how long
+the whitelist is.
 """
 
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional
-import re
+
+from core.pipeline import ParsedMessage, normalize_host
+
+LATENCY_SAMPLES = 1024
+PIPELINE_PRIORITY = 20
+
+
+@dataclass(frozen=True)
+class AntiLinkSettings:
+    """Per-guild anti-link settings (stored by the guild config service)."""
+
+    enabled: bool = False
+    whitelist: Tuple[str, ...] = ()
+
+
+class DomainTrie:
+    """Whitelist of domains stored as a trie of reversed labels.
+
+    "example.com" allows example.com (and www.example.com); "*.example.com"
+    allows example.com and any subdomain of it.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: dict = {}
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str):
+        wildcard = domain.strip().startswith("*.")
+        host = normalize_host(domain.strip()[2:] if wildcard else domain)
+        if not host:
+            return
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.setdefault(label, {})
+        node["$"] = True
+        if wildcard:
+            node["*"] = True
+
+    def allows(self, host: str) -> bool:
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if "*" in node:
+                return True
+        return "$" in node
 
 
 class AntiLink(commands.Cog):
@@ -16,30 +75,124 @@ class AntiLink(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        # Multi-guild configuration storage
-        self.guild_configs = {}
-        self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+        # Persistent multi-guild configuration
+        self.settings = bot.guild_config.register("antilink", AntiLinkSettings)
+        # Compiled whitelist per guild, keyed by the whitelist it was built from
+        self._tries: Dict[int, Tuple[Tuple[str, ...], DomainTrie]] = {}
+        # Per-message check latency (ns) for the status command
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self.checked = 0
+        self.blocked = 0
+
+    async def cog_load(self):
+        self.bot.pipeline.register(
+            "antilink", self.check_message, priority=PIPELINE_PRIORITY, is_enabled=self._enabled
+        )
+
+    def cog_unload(self):
+        self.bot.pipeline.unregister("antilink")
+
+    def _enabled(self, guild_id: int) -> bool:
+        return self.settings.get(guild_id).enabled
 
     @commands.hybrid_command(name="antilink", description="Configure anti-link settings")
     @commands.has_permissions(manage_guild=True)
-    async def antilink(self, ctx, action: str, *whitelist: str):
+    async def antilink(self, ctx, action: str, *, domains: str = ""):
         """Configure anti-link settings for the server.
-        
+
         Args:
             ctx: Command context
-            action: Action to perform (enable/disable/whitelist)
-            whitelist: Domains to whitelist (optional)
+            action: Action to perform (enable/disable/allow/deny/status)
+            domains: Domains to whitelist, space or comma separated, e.g. example.com *.example.com (optional)
         """
         guild_id = ctx.guild.id
-        
-        if action.lower() == "enable":
-            self.guild_configs[guild_id] = {"enabled": True, "whitelist": list(whitelist)}
+        action = action.lower()
+        # hybrid commands can't take *args, so the domain list arrives as one string
+        whitelist = [d for d in domains.replace(",", " ").split() if d]
+        config = self.settings.get(guild_id)
+
+        if action == "enable":
+            self.settings.update(guild_id, enabled=True, whitelist=tuple(whitelist))
             await ctx.send(f"✅ Anti-link enabled with whitelist: {', '.join(whitelist) if whitelist else 'None'}")
-        elif action.lower() == "disable":
-            self.guild_configs[guild_id] = {"enabled": False}
+        elif action == "disable":
+            self.settings.update(guild_id, enabled=False)
+            self._tries.pop(guild_id, None)
             await ctx.send("❌ Anti-link disabled")
+        elif action in ("allow", "deny"):
+            if not config.enabled:
+                await ctx.send("❌ Enable anti-link first")
+                return
+            current = list(config.whitelist)
+            for domain in whitelist:
+                if action == "allow" and domain not in current:
+                    current.append(domain)
+                elif action == "deny" and domain in current:
+                    current.remove(domain)
+            self.settings.update(guild_id, whitelist=tuple(current))
+            await ctx.send(f"✅ Whitelist: {', '.join(current) if current else 'None'}")
+        elif action == "status":
+            if not config.enabled:
+                await ctx.send("Anti-link is disabled")
+                return
+            await ctx.send(
+                f"Anti-link enabled. Whitelist: {', '.join(config.whitelist) or 'None'}\n"
+                f"{self._latency_summary()}"
+            )
         else:
-            await ctx.send("Invalid action. Use: enable/disable")
+            await ctx.send("Invalid action. Use: enable/disable/allow/deny/status")
+
+    def _trie(self, guild_id: int) -> DomainTrie:
+        """Compiled whitelist for a guild, rebuilt only when the whitelist changed."""
+        whitelist = self.settings.get(guild_id).whitelist
+        cached = self._tries.get(guild_id)
+        if cached is None or cached[0] is not whitelist:
+            cached = self._tries[guild_id] = (whitelist, DomainTrie(whitelist))
+        return cached[1]
+
+    def _latency_summary(self) -> str:
+        if not self._latencies:
+            return "No messages checked yet."
+        samples = sorted(self._latencies)
+        p50 = samples[len(samples) // 2] / 1000
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] / 1000
+        return (
+            f"Checked {self.checked} messages, blocked {self.blocked}. "
+            f"Check latency p50 {p50:.1f}µs, p99 {p99:.1f}µs, max {samples[-1] / 1000:.1f}µs"
+        )
+
+    def find_violation(self, guild_id: int, links: Iterable[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+        """Return the first (kind, host) not allowed by the guild's whitelist."""
+        trie = self._trie(guild_id)
+        for kind, host in links:
+            if kind == "masked" or not trie.allows(host):
+                return kind, host
+        return None
+
+    async def check_message(self, parsed: ParsedMessage) -> bool:
+        """Pipeline stage. Returns True if the message was removed."""
+        if parsed.exempt or not parsed.content:
+            return False
+
+        started = time.perf_counter_ns()
+        violation = self.find_violation(parsed.guild_id, parsed.links)
+        self._latencies.append(time.perf_counter_ns() - started)
+        self.checked += 1
+        if violation is None:
+            return False
+
+        self.blocked += 1
+        kind, host = violation
+        message = parsed.message
+        try:
+            await message.delete()
+        except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            return False
+        what = {"invite": "Server invites", "masked": "Disguised links"}.get(kind, f"Links to `{host}`")
+        try:
+            await message.channel.send(f"🔗 {parsed.author.mention}, {what} are not allowed here.", delete_after=5)
+        except (discord.Forbidden, discord.HTTPException):
+            pass
+        return True
 
 
 async def setup(bot):
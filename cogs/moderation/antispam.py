@@ -2,12 +2,97 @@
 
 Provides anti-spam functionality with configurable thresholds and actions.
 Supports both slash commands and prefix commands with multi-guild logic.
+
+Messages arrive through the bot's shared MessagePipeline. Every message from
+a tracked member costs O(1): each (guild, user) pair owns a small slotted
+window of fixed-size ring buffers (message times, recent content hashes,
+mention counts). Windows idle for IDLE_TTL seconds are evicted, so
+memory is bounded by the number of currently active members.
 """
 
+import datetime
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from typing import Optional
+
+from core.pipeline import ParsedMessage
+
+# Defaults for a freshly enabled guild
+DEFAULT_THRESHOLD = 5      # messages ...
+DEFAULT_INTERVAL = 5       # ... within this many seconds
+DEFAULT_DUPLICATES = 3     # identical messages within the interval
+DEFAULT_MENTIONS = 8       # user/role mentions within the interval
+DEFAULT_TIMEOUT = 60       # seconds, for the "timeout" punishment
+
+PUNISHMENTS = ("delete", "timeout", "warn")
+DUPLICATE_TRACK = 8        # content hashes remembered per member
+IDLE_TTL = 300             # seconds without a message before a window is evicted
+PIPELINE_PRIORITY = 10     # runs before anti-link and ghost-ping capture
+
+
+@dataclass(frozen=True)
+class AntiSpamSettings:
+    """Per-guild anti-spam settings (stored by the guild config service)."""
+
+    enabled: bool = False
+    threshold: int = DEFAULT_THRESHOLD
+    interval: int = DEFAULT_INTERVAL
+    duplicates: int = DEFAULT_DUPLICATES
+    mentions: int = DEFAULT_MENTIONS
+    punishment: str = "delete"
+
+
+class _MemberWindow:
+    """Sliding-window state for one member in one guild."""
+
+    __slots__ = ("stamps", "hashes", "mentions", "mention_total", "last_seen", "cooldown_until")
+
+    def __init__(self, threshold: int):
+        self.stamps: deque = deque(maxlen=threshold)           # message times
+        self.hashes: deque = deque(maxlen=DUPLICATE_TRACK)     # (time, content hash)
+        self.mentions: deque = deque()                         # (time, count), trimmed to the interval
+        self.mention_total = 0
+        self.last_seen = 0.0
+        self.cooldown_until = 0.0
+
+    def record(self, now: float, interval: float, content_hash: Optional[int], mention_count: int,
+               max_duplicates: int, max_mentions: int) -> Optional[str]:
+        """Record a message and return the violated rule, if any."""
+        self.last_seen = now
+        cutoff = now - interval
+
+        self.stamps.append(now)
+        if len(self.stamps) == self.stamps.maxlen and self.stamps[0] >= cutoff:
+            return "message rate"
+
+        if content_hash is not None:
+            self.hashes.append((now, content_hash))
+            dupes = sum(1 for ts, h in self.hashes if h == content_hash and ts >= cutoff)
+            if dupes >= max_duplicates:
+                return "duplicate messages"
+
+        if mention_count:
+            self.mentions.append((now, mention_count))
+            self.mention_total += mention_count
+        while self.mentions and self.mentions[0][0] < cutoff:
+            self.mention_total -= self.mentions.popleft()[1]
+        if self.mention_total >= max_mentions:
+            return "mention flood"
+
+        return None
+
+
+# what the value means for each setting action, shown when it is missing
+SETTING_USAGE = {
+    "interval": "seconds in the detection window",
+    "duplicates": "identical messages allowed in the window",
+    "mentions": "mentions allowed within the window",
+}
 
 
 class AntiSpam(commands.Cog):
@@ -15,29 +100,158 @@ class AntiSpam(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        # Multi-guild configuration storage
-        self.guild_configs = {}
+        # Persistent multi-guild configuration
+        self.settings = bot.guild_config.register("antispam", AntiSpamSettings)
+        # Live sliding windows keyed by (guild_id, user_id)
+        self._windows: Dict[Tuple[int, int], _MemberWindow] = {}
+        self.evict_idle.start()
+
+    async def cog_load(self):
+        self.bot.pipeline.register(
+            "antispam", self.check_message, priority=PIPELINE_PRIORITY, is_enabled=self._enabled
+        )
+
+    def cog_unload(self):
+        self.bot.pipeline.unregister("antispam")
+        self.evict_idle.cancel()
+
+    def _enabled(self, guild_id: int) -> bool:
+        return self.settings.get(guild_id).enabled
 
     @commands.hybrid_command(name="antispam", description="Configure anti-spam settings")
+    @app_commands.describe(
+        action="enable / disable / status / interval / duplicates / mentions",
+        threshold="Message threshold (enable) or the value for interval/duplicates/mentions",
+        punishment="What to do with spammers: delete, timeout or warn",
+    )
     @commands.has_permissions(manage_guild=True)
-    async def antispam(self, ctx, action: str, threshold: Optional[int] = 5):
+    async def antispam(self, ctx, action: str, threshold: Optional[int] = None,
+                       punishment: Optional[str] = None):
         """Configure anti-spam settings for the server.
-        
+
         Args:
             ctx: Command context
-            action: Action to perform (enable/disable/configure)
-            threshold: Message threshold for spam detection
+            action: Action to perform (enable/disable/status/interval/duplicates/mentions)
+            threshold: Message threshold for spam detection (enable defaults to 5), or the value of the setting (required)
+            punishment: Action taken against spammers (delete/timeout/warn)
         """
         guild_id = ctx.guild.id
-        
-        if action.lower() == "enable":
-            self.guild_configs[guild_id] = {"enabled": True, "threshold": threshold}
-            await ctx.send(f"✅ Anti-spam enabled with threshold: {threshold}")
-        elif action.lower() == "disable":
-            self.guild_configs[guild_id] = {"enabled": False}
+        action = action.lower()
+        config = self.settings.get(guild_id)
+
+        if punishment is not None and punishment.lower() not in PUNISHMENTS:
+            await ctx.send(f"Invalid punishment. Use: {'/'.join(PUNISHMENTS)}")
+            return
+
+        if action == "enable":
+            if threshold is None:
+                threshold = DEFAULT_THRESHOLD
+            if threshold < 2:
+                await ctx.send("❌ Threshold must be at least 2 messages")
+                return
+            config = self.settings.update(
+                guild_id,
+                enabled=True,
+                threshold=threshold,
+                punishment=(punishment or config.punishment).lower(),
+            )
+            self._reset_guild(guild_id)
+            await ctx.send(
+                f"✅ Anti-spam enabled with threshold: {threshold} "
+                f"(punishment: {config.punishment})"
+            )
+        elif action == "disable":
+            self.settings.update(guild_id, enabled=False)
+            self._reset_guild(guild_id)
             await ctx.send("❌ Anti-spam disabled")
+        elif action in ("interval", "duplicates", "mentions"):
+            if not config.enabled:
+                await ctx.send("❌ Enable anti-spam first")
+                return
+            if threshold is None:
+                await ctx.send(f"❌ Missing value. Usage: `antispam {action} <{SETTING_USAGE[action]}>`")
+                return
+            if threshold < 1:
+                await ctx.send(f"❌ {action} must be a positive number")
+                return
+            self.settings.update(guild_id, **{action: threshold})
+            await ctx.send(f"✅ Anti-spam {action} set to {threshold}")
+        elif action == "status":
+            if not config.enabled:
+                await ctx.send("Anti-spam is disabled")
+                return
+            await ctx.send(
+                f"Anti-spam: {config.threshold} msgs / {config.interval}s, "
+                f"{config.duplicates} duplicates, {config.mentions} mentions → {config.punishment}"
+            )
         else:
-            await ctx.send("Invalid action. Use: enable/disable")
+            await ctx.send("Invalid action. Use: enable/disable/status/interval/duplicates/mentions")
+
+    def _reset_guild(self, guild_id: int):
+        """Drop live windows for a guild (their ring sizes depend on the threshold)."""
+        for key in [k for k in self._windows if k[0] == guild_id]:
+            del self._windows[key]
+
+    async def check_message(self, parsed: ParsedMessage) -> bool:
+        """Pipeline hot path: O(1) per message. Returns True if the message was removed."""
+        if parsed.exempt:
+            return False
+        config = self.settings.get(parsed.guild_id)
+
+        key = (parsed.guild_id, parsed.author.id)
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _MemberWindow(config.threshold)
+
+        now = time.monotonic()
+        violation = window.record(
+            now, config.interval, parsed.content_hash, parsed.mention_count,
+            config.duplicates, config.mentions,
+        )
+        if violation is None:
+            return False
+
+        await self._punish(parsed.message, config, window, now, violation)
+        return True
+
+    async def _punish(self, message: discord.Message, config: AntiSpamSettings, window: _MemberWindow,
+                      now: float, violation: str):
+        try:
+            await message.delete()
+        except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            pass
+
+        # Escalations run at most once per interval; further spam in that window is only deleted
+        if now < window.cooldown_until:
+            return
+        window.cooldown_until = now + config.interval
+
+        punishment = config.punishment
+        reason = f"Anti-spam: {violation}"
+        try:
+            if punishment == "timeout" and isinstance(message.author, discord.Member):
+                await message.author.timeout(datetime.timedelta(seconds=DEFAULT_TIMEOUT), reason=reason)
+            elif punishment == "warn":
+                await self.bot.db.add_infraction(
+                    message.guild.id, message.author.id, self.bot.user.id, reason, action="warn"
+                )
+        except (discord.Forbidden, discord.HTTPException):
+            pass
+
+        try:
+            await message.channel.send(
+                f"⚠️ {message.author.mention}, slow down ({violation}).", delete_after=5
+            )
+        except (discord.Forbidden, discord.HTTPException):
+            pass
+
+    @tasks.loop(seconds=60)
+    async def evict_idle(self):
+        """Drop windows of members who have gone quiet."""
+        cutoff = time.monotonic() - IDLE_TTL
+        stale = [key for key, window in self._windows.items() if window.last_seen < cutoff]
+        for key in stale:
+            del self._windows[key]
 
 
 async def setup(bot):
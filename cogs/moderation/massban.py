@@ -2,6 +2,11 @@
 
 Provides functionality to ban multiple members at once.
 Supports both slash commands and prefix commands with multi-guild logic.
+
+Members are banned through Discord's bulk-ban endpoint (up to 200 per
+request) when the installed discord.py supports it, with anything it rejects
+wholesale falling back to individual bans run with bounded concurrency.
+Progress is shown by editing a single status message.
 """
 
 import discord
@@ -9,6 +14,10 @@ from discord.ext import commands
 from discord import app_commands
 from typing import List
 
+from core.bulk import BulkExecutor
+
+BULK_BAN_LIMIT = 200  # users per bulk-ban request (Discord limit)
+
 
 class MassBan(commands.Cog):
     """Mass ban utilities."""
@@ -27,27 +36,45 @@ class MassBan(commands.Cog):
             members: List of members to ban
             reason: Reason for banning
         """
+        # de-duplicate while keeping order
+        members = list({member.id: member for member in members}.values())
         if not members:
             await ctx.send("❌ Please specify at least one member to ban")
             return
         
         await ctx.defer()
         
-        success_count = 0
-        fail_count = 0
+        audit_reason = f"{ctx.author} ({ctx.author.id}): {reason}" if reason else f"Mass ban by {ctx.author} ({ctx.author.id})"
+        status = await ctx.send(f"⏳ Banning {len(members)} member(s)…")
+        executor = BulkExecutor(len(members), status, verb="Banning")
+        async with executor:
+            leftovers = await self._bulk_ban(ctx.guild, members, audit_reason, executor)
+            await executor.map(leftovers, lambda member: ctx.guild.ban(member, reason=audit_reason))
         
-        for member in members:
+        try:
+            await status.edit(content=None, embed=executor.summary_embed("🔨 Mass Ban"))
+        except discord.HTTPException:
+            await ctx.send(embed=executor.summary_embed("🔨 Mass Ban"))
+
+    async def _bulk_ban(self, guild: discord.Guild, members: List[discord.Member], reason: str,
+                        executor: BulkExecutor) -> List[discord.Member]:
+        """Ban through the bulk endpoint; return members that still need an individual ban."""
+        if not hasattr(guild, "bulk_ban"):  # discord.py < 2.4
+            return members
+        leftovers: List[discord.Member] = []
+        for start in range(0, len(members), BULK_BAN_LIMIT):
+            chunk = members[start:start + BULK_BAN_LIMIT]
             try:
-                await ctx.guild.ban(member, reason=reason)
-                success_count += 1
-            except (discord.Forbidden, discord.HTTPException):
-                fail_count += 1
-        
-        result_msg = f"✅ Banned {success_count} member(s)"
-        if fail_count > 0:
-            result_msg += f" | Failed to ban {fail_count} member(s)"
-        
-        await ctx.send(result_msg)
+                result = await guild.bulk_ban(chunk, reason=reason)
+            except discord.HTTPException:
+                # e.g. missing Manage Server, which the bulk endpoint also requires
+                leftovers.extend(chunk)
+                continue
+            for user in result.banned:
+                executor.record_success(user.id)
+            for user in result.failed:
+                executor.record_failure(user.id, "rejected by Discord")
+        return leftovers
 
 
 async def setup(bot):
@@ -2,12 +2,158 @@
 
 Provides functionality to kick multiple members at once.
 Supports both slash commands and prefix commands with multi-guild logic.
+
+`raidkick` selects members with a filter set (explicit IDs/mentions, join
+window, account age, name pattern, no avatar). The filters are compiled into
+predicates and evaluated in a single pass over the guild's member cache; the
+match count is previewed and nothing happens until the moderator confirms.
+Kicks then run through the shared bulk executor with live progress and a
+stop button.
 """
 
+import re
+import asyncio
+import datetime
+from typing import Callable, List, Optional, Set
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import List
+
+from core.bulk import BulkExecutor
+
+MAX_TARGETS = 1000         # members one raidkick may act on
+CONFIRM_TIMEOUT = 120      # seconds the preview stays actionable
+MAX_PATTERN_LENGTH = 100
+PREVIEW_SAMPLE = 10
+
+_DURATION_RE = re.compile(r"(\d+)\s*([smhdw])")
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_ID_RE = re.compile(r"\d{15,21}")
+
+
+def _parse_duration(text: str) -> datetime.timedelta:
+    """Parse durations like 30m, 2h, 1d12h."""
+    parts = _DURATION_RE.findall(text.lower())
+    if not parts or _DURATION_RE.sub("", text.lower()).strip():
+        raise commands.BadArgument(f"Invalid duration `{text}`. Use e.g. 30m, 2h, 7d.")
+    return datetime.timedelta(seconds=sum(int(n) * _DURATION_UNITS[u] for n, u in parts))
+
+
+class RaidFilters(commands.FlagConverter, prefix="--", delimiter=" "):
+    """Member selection flags, e.g. `--joined 30m --name ^free.*nitro --reason raid`."""
+
+    ids: Optional[str] = commands.flag(default=None, description="User IDs or mentions, separated by spaces or commas")
+    joined: Optional[str] = commands.flag(default=None, description="Joined within this long, e.g. 30m or 2h")
+    age: Optional[str] = commands.flag(default=None, description="Account younger than this, e.g. 1d or 7d")
+    name: Optional[str] = commands.flag(default=None, description="Regex matched against username / display name")
+    no_avatar: bool = commands.flag(default=False, description="Only members without an avatar")
+    bots: bool = commands.flag(default=False, description="Include bot accounts")
+    reason: Optional[str] = commands.flag(default=None, description="Reason for kicking")
+
+
+def compile_selector(flags: RaidFilters) -> List[Callable[[discord.Member], bool]]:
+    """Turn the filters into a list of predicates that must all match."""
+    predicates: List[Callable[[discord.Member], bool]] = []
+    now = discord.utils.utcnow()
+
+    if flags.ids:
+        wanted: Set[int] = {int(i) for i in _ID_RE.findall(flags.ids)}
+        if not wanted:
+            raise commands.BadArgument("No valid user IDs found in `ids`.")
+        predicates.append(lambda m: m.id in wanted)
+    if flags.joined:
+        joined_after = now - _parse_duration(flags.joined)
+        predicates.append(lambda m: m.joined_at is not None and m.joined_at >= joined_after)
+    if flags.age:
+        created_after = now - _parse_duration(flags.age)
+        predicates.append(lambda m: m.created_at >= created_after)
+    if flags.name:
+        if len(flags.name) > MAX_PATTERN_LENGTH:
+            raise commands.BadArgument(f"Name pattern is too long (max {MAX_PATTERN_LENGTH} characters).")
+        try:
+            pattern = re.compile(flags.name, re.IGNORECASE)
+        except re.error as e:
+            raise commands.BadArgument(f"Invalid name pattern: {e}")
+        predicates.append(lambda m: bool(pattern.search(m.name) or pattern.search(m.display_name)))
+    if flags.no_avatar:
+        predicates.append(lambda m: m.avatar is None)
+    if not flags.bots:
+        predicates.append(lambda m: not m.bot)
+    return predicates
+
+
+def select_members(guild: discord.Guild, moderator: discord.Member,
+                   predicates: List[Callable[[discord.Member], bool]]) -> List[discord.Member]:
+    """Single pass over the member cache; skips members neither side may kick."""
+    me = guild.me
+    moderator_is_owner = moderator.id == guild.owner_id
+    matches = []
+    for member in guild.members:
+        if member.id in (guild.owner_id, moderator.id, me.id):
+            continue
+        if member.top_role >= me.top_role:
+            continue
+        if not moderator_is_owner and member.top_role >= moderator.top_role:
+            continue
+        if all(predicate(member) for predicate in predicates):
+            matches.append(member)
+    return matches
+
+
+class _ConfirmView(discord.ui.View):
+    """Confirm/cancel for the preview, then a stop button while kicking."""
+
+    def __init__(self, author_id: int):
+        # stays alive while kicking so the stop button keeps working; the
+        # confirmation window is enforced by wait_for_decision()
+        super().__init__(timeout=None)
+        self.author_id = author_id
+        self.confirmed: Optional[bool] = None
+        self.executor: Optional[BulkExecutor] = None
+        # Stop pressed after Kick; honoured even before the executor exists
+        self.stop_requested = False
+        self._decided = asyncio.Event()
+
+    async def wait_for_decision(self) -> Optional[bool]:
+        """True (kick), False (cancelled) or None (timed out)."""
+        try:
+            await asyncio.wait_for(self._decided.wait(), CONFIRM_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.stop()
+        return self.confirmed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("Only the moderator who ran the command can use this.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Kick", style=discord.ButtonStyle.danger, emoji="👢")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.executor is None and self.confirmed is None:
+            self.confirmed = True
+            self.remove_item(button)
+            self.cancel.label = "Stop"
+            await interaction.response.edit_message(view=self)
+            self._decided.set()
+        else:
+            await interaction.response.defer()
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="✖️")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.confirmed:
+            # acts as Stop once kicking was confirmed, whether or not it has started yet
+            self.stop_requested = True
+            if self.executor is not None:
+                self.executor.cancel()
+            button.disabled = True
+            await interaction.response.edit_message(view=self)
+            return
+        self.confirmed = False
+        await interaction.response.edit_message(view=None)
+        self._decided.set()
+        self.stop()
 
 
 class MassKick(commands.Cog):
@@ -27,27 +173,98 @@ class MassKick(commands.Cog):
             members: List of members to kick
             reason: Reason for kicking
         """
+        members = list({member.id: member for member in members}.values())
         if not members:
             await ctx.send("❌ Please specify at least one member to kick")
             return
         
         await ctx.defer()
         
-        success_count = 0
-        fail_count = 0
-        
-        for member in members:
-            try:
-                await ctx.guild.kick(member, reason=reason)
-                success_count += 1
-            except (discord.Forbidden, discord.HTTPException):
-                fail_count += 1
-        
-        result_msg = f"✅ Kicked {success_count} member(s)"
-        if fail_count > 0:
-            result_msg += f" | Failed to kick {fail_count} member(s)"
-        
-        await ctx.send(result_msg)
+        status = await ctx.send(f"⏳ Kicking {len(members)} member(s)…")
+        await self._run_kicks(ctx, members, reason, status)
+
+    @commands.hybrid_command(name="raidkick", description="Kick members selected by IDs, join time, account age or name")
+    @commands.has_permissions(kick_members=True)
+    @commands.bot_has_permissions(kick_members=True)
+    @commands.guild_only()
+    async def raidkick(self, ctx, *, filters: RaidFilters):
+        """Select members with filters, preview the matches, then kick them on confirmation.
+
+        Args:
+            ctx: Command context
+            filters: --ids, --joined, --age, --name, --no_avatar, --bots, --reason
+        """
+        if not any((filters.ids, filters.joined, filters.age, filters.name, filters.no_avatar)):
+            await ctx.send("❌ Give at least one filter: `--ids`, `--joined`, `--age`, `--name` or `--no_avatar`")
+            return
+        try:
+            predicates = compile_selector(filters)
+        except commands.BadArgument as e:
+            await ctx.send(f"❌ {e}")
+            return
+
+        matches = select_members(ctx.guild, ctx.author, predicates)
+        if not matches:
+            await ctx.send("✅ No kickable members match those filters.")
+            return
+        if len(matches) > MAX_TARGETS:
+            await ctx.send(f"❌ {len(matches)} members match; narrow the filters (max {MAX_TARGETS}).")
+            return
+
+        criteria = []
+        if filters.ids:
+            criteria.append(f"IDs: {len(set(_ID_RE.findall(filters.ids)))} given")
+        if filters.joined:
+            criteria.append(f"Joined within {filters.joined}")
+        if filters.age:
+            criteria.append(f"Account younger than {filters.age}")
+        if filters.name:
+            criteria.append(f"Name matches `{filters.name}`")
+        if filters.no_avatar:
+            criteria.append("No avatar")
+        criteria.append("Bots included" if filters.bots else "Bots excluded")
+
+        sample = "\n".join(f"{m.mention} `{m}`" for m in matches[:PREVIEW_SAMPLE])
+        if len(matches) > PREVIEW_SAMPLE:
+            sample += f"\n… and {len(matches) - PREVIEW_SAMPLE} more"
+        embed = discord.Embed(
+            title="👢 Raid Kick — Preview",
+            description=f"**{len(matches)}** member(s) match.",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Filters", value="\n".join(criteria), inline=False)
+        embed.add_field(name="Matches", value=sample[:1024], inline=False)
+        embed.set_footer(text=f"Requested by {ctx.author} · confirm within {CONFIRM_TIMEOUT}s")
+
+        view = _ConfirmView(ctx.author.id)
+        status = await ctx.send(embed=embed, view=view, allowed_mentions=discord.AllowedMentions.none())
+        confirmed = await view.wait_for_decision()
+        if not confirmed:
+            await status.edit(content="❌ Raid kick cancelled." if confirmed is False else "⌛ Raid kick timed out.",
+                              embed=None, view=None)
+            return
+
+        await self._run_kicks(ctx, matches, filters.reason, status, view)
+
+    async def _run_kicks(self, ctx, members: List[discord.Member], reason: Optional[str],
+                         status: discord.Message, view: Optional[_ConfirmView] = None):
+        audit_reason = f"{ctx.author} ({ctx.author.id}): {reason}" if reason else f"Mass kick by {ctx.author} ({ctx.author.id})"
+        executor = BulkExecutor(len(members), status, verb="Kicking")
+        if view is not None:
+            view.executor = executor
+            if view.stop_requested:
+                executor.cancel()  # Stop was pressed between confirming and starting
+        async with executor:
+            await executor.map(members, lambda member: ctx.guild.kick(member, reason=audit_reason))
+        if view is not None:
+            view.stop()
+
+        embed = executor.summary_embed("👢 Mass Kick")
+        try:
+            await status.edit(content=None, embed=embed, view=None)
+        except discord.HTTPException:
+            await ctx.send(embed=embed)
 
 
 async def setup(bot):
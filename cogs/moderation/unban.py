@@ -1,13 +1,87 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import datetime
+import re
+from typing import Dict, List, Optional
+
+from core.bulk import BulkExecutor
+
+MAX_SEARCH_RESULTS = 20
+_ID_RE = re.compile(r"\d{15,21}")
+
+
+class _BanRecord:
+    """What the ban cache keeps per banned user."""
+
+    __slots__ = ("user_id", "name", "reason")
+
+    def __init__(self, user_id: int, name: str, reason: Optional[str]):
+        self.user_id = user_id
+        self.name = name
+        self.reason = reason
+
 
 class Unban(commands.Cog):
     """Unban management commands with creative embed styling"""
     
     def __init__(self, bot):
         self.bot = bot
+        # Per-guild ban lists, fetched on first use by bansearch/massunban and
+        # then kept current from ban/unban gateway events
+        self._bans: Dict[int, Dict[int, _BanRecord]] = {}
+        self._loading: Dict[int, asyncio.Task] = {}
+        # ban/unban events seen while a guild's list is still being paged in
+        self._pending: Dict[int, List[tuple]] = {}
+
+    async def _ban_list(self, guild: discord.Guild) -> Dict[int, _BanRecord]:
+        """The guild's bans from memory, paging them in from the API only once."""
+        cached = self._bans.get(guild.id)
+        if cached is not None:
+            return cached
+        task = self._loading.get(guild.id)
+        if task is None:
+            task = self._loading[guild.id] = asyncio.create_task(self._load_bans(guild))
+        return await asyncio.shield(task)
+
+    async def _load_bans(self, guild: discord.Guild) -> Dict[int, _BanRecord]:
+        self._pending[guild.id] = []
+        try:
+            bans = {}
+            async for entry in guild.bans(limit=None):
+                bans[entry.user.id] = _BanRecord(entry.user.id, str(entry.user), entry.reason)
+            # replay events that raced with the paging, in order
+            for banned, user in self._pending[guild.id]:
+                if banned:
+                    bans.setdefault(user.id, _BanRecord(user.id, str(user), None))
+                else:
+                    bans.pop(user.id, None)
+            self._bans[guild.id] = bans
+            return bans
+        finally:
+            self._loading.pop(guild.id, None)
+            self._pending.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_ban(self, guild: discord.Guild, user: discord.User):
+        if guild.id in self._pending:
+            self._pending[guild.id].append((True, user))
+        bans = self._bans.get(guild.id)
+        if bans is not None:
+            bans[user.id] = _BanRecord(user.id, str(user), None)
+
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        if guild.id in self._pending:
+            self._pending[guild.id].append((False, user))
+        bans = self._bans.get(guild.id)
+        if bans is not None:
+            bans.pop(user.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._bans.pop(guild.id, None)
     
     @commands.hybrid_command(
         name="unban",
@@ -35,9 +109,11 @@ class Unban(commands.Cog):
             return await ctx.send(embed=embed, ephemeral=True)
         
         try:
-            # Get ban list
-            bans = [entry async for entry in ctx.guild.bans()]
-            ban_entry = next((ban for ban in bans if ban.user.id == user_id), None)
+            # Direct lookup by ID instead of paging through the whole ban list
+            try:
+                ban_entry = await ctx.guild.fetch_ban(discord.Object(id=user_id))
+            except discord.NotFound:
+                ban_entry = None
             
             if not ban_entry:
                 embed = discord.Embed(
@@ -53,7 +129,7 @@ class Unban(commands.Cog):
             
             # Unban the user
             await ctx.guild.unban(user, reason=f"{ctx.author} ({ctx.author.id}): {reason}")
-            
+                
             # Send success embed with creative styling
             embed = discord.Embed(
                 title="✅ User Unbanned",
@@ -87,5 +163,81 @@ class Unban(commands.Cog):
             embed.set_footer(text=f"Requested by {ctx.author}", icon_url=ctx.author.display_avatar.url)
             await ctx.send(embed=embed, ephemeral=True)
 
+    @commands.hybrid_command(
+        name="bansearch",
+        description="Search the server's bans by name or ID"
+    )
+    @app_commands.describe(query="Part of a username, or a user ID")
+    @commands.has_permissions(ban_members=True)
+    @commands.bot_has_permissions(ban_members=True)
+    async def bansearch(self, ctx, *, query: str):
+        """Search banned users by name or ID (served from the ban cache)"""
+        await ctx.defer()
+        bans = await self._ban_list(ctx.guild)
+        needle = query.strip().lower()
+        matches: List[_BanRecord] = []
+        for record in bans.values():
+            if needle in record.name.lower() or needle in str(record.user_id):
+                matches.append(record)
+                if len(matches) > MAX_SEARCH_RESULTS:
+                    break
+        
+        embed = discord.Embed(
+            title="🔎 Ban Search",
+            color=discord.Color.blurple() if matches else discord.Color.orange(),
+            timestamp=datetime.datetime.now()
+        )
+        if matches:
+            lines = [
+                f"`{r.user_id}` **{discord.utils.escape_markdown(r.name)}** — {(r.reason or 'No reason')[:60]}"
+                for r in matches[:MAX_SEARCH_RESULTS]
+            ]
+            if len(matches) > MAX_SEARCH_RESULTS:
+                lines.append(f"… more than {MAX_SEARCH_RESULTS} matches, refine the search")
+            embed.description = "\n".join(lines)[:4000]
+        else:
+            embed.description = f"No banned users match `{query}`."
+        embed.set_footer(text=f"{len(bans)} bans in {ctx.guild.name}", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(
+        name="massunban",
+        description="Unban several users at once by ID"
+    )
+    @app_commands.describe(
+        user_ids="User IDs separated by spaces or commas",
+        reason="Reason for unbanning"
+    )
+    @commands.has_permissions(ban_members=True)
+    @commands.bot_has_permissions(ban_members=True)
+    async def massunban(self, ctx, user_ids: str, *, reason: str = "No reason provided"):
+        """Unban many users; IDs that aren't banned are skipped without an API call"""
+        wanted = list(dict.fromkeys(int(i) for i in _ID_RE.findall(user_ids)))
+        if not wanted:
+            return await ctx.send("❌ Please provide at least one valid user ID.", ephemeral=True)
+        
+        await ctx.defer()
+        bans = await self._ban_list(ctx.guild)
+        targets = [discord.Object(id=uid) for uid in wanted if uid in bans]
+        not_banned = len(wanted) - len(targets)
+        if not targets:
+            return await ctx.send("❌ None of those users are banned from this server.")
+        
+        audit_reason = f"{ctx.author} ({ctx.author.id}): {reason}"
+        status = await ctx.send(f"⏳ Unbanning {len(targets)} user(s)…")
+        executor = BulkExecutor(len(targets), status, verb="Unbanning")
+        async with executor:
+            await executor.map(targets, lambda user: ctx.guild.unban(user, reason=audit_reason))
+        for uid in executor.succeeded:
+            bans.pop(uid, None)
+        
+        embed = executor.summary_embed("🔓 Mass Unban")
+        if not_banned:
+            embed.add_field(name="➖ Not banned", value=str(not_banned), inline=True)
+        try:
+            await status.edit(content=None, embed=embed)
+        except discord.HTTPException:
+            await ctx.send(embed=embed)
+
 async def setup(bot):
     await bot.add_cog(Unban(bot))
@@ -2,47 +2,16 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import datetime
-import json
-import os
 
 class Warn(commands.Cog):
     """Warning management commands with creative embed styling"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.warnings_file = "warnings.json"
-        self.warnings = self.load_warnings()
     
-    def load_warnings(self):
-        """Load warnings from JSON file"""
-        if os.path.exists(self.warnings_file):
-            with open(self.warnings_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def save_warnings(self):
-        """Save warnings to JSON file"""
-        with open(self.warnings_file, 'w') as f:
-            json.dump(self.warnings, f, indent=4)
-    
-    def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str):
-        """Add a warning to the database"""
-        guild_key = str(guild_id)
-        user_key = str(user_id)
-        
-        if guild_key not in self.warnings:
-            self.warnings[guild_key] = {}
-        if user_key not in self.warnings[guild_key]:
-            self.warnings[guild_key][user_key] = []
-        
-        warning = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "moderator_id": moderator_id,
-            "reason": reason
-        }
-        self.warnings[guild_key][user_key].append(warning)
-        self.save_warnings()
-        return len(self.warnings[guild_key][user_key])
+    async def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str):
+        """Add a warning to the database and return the member's warning count"""
+        return await self.bot.db.add_infraction(guild_id, user_id, moderator_id, reason, action="warn")
     
     @commands.hybrid_command(
         name="warn",
@@ -67,7 +36,7 @@ class Warn(commands.Cog):
             return await ctx.send(embed=embed, ephemeral=True)
         
         # Add warning
-        warning_count = self.add_warning(ctx.guild.id, member.id, ctx.author.id, reason)
+        warning_count = await self.add_warning(ctx.guild.id, member.id, ctx.author.id, reason)
         
         # Try to DM the user
         try:
@@ -0,0 +1,2 @@
+# Owner Cogs Package
+# This package contains bot-owner diagnostics and maintenance cogs
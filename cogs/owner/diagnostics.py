@@ -0,0 +1,83 @@
+"""Owner-only runtime diagnostics.
+
+Surfaces the counters kept by the bot-level services (message pipeline,
+shared HTTP client, extension loader, ...).
+"""
+
+import discord
+from discord.ext import commands
+
+from core.loader import format_report
+
+
+class Diagnostics(commands.Cog):
+    """Owner-only runtime counters."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="pipelinestats", description="Show per-stage timings of the message pipeline")
+    @commands.is_owner()
+    async def pipelinestats(self, ctx):
+        """Show call counts and timings for each message pipeline stage."""
+        pipeline = self.bot.pipeline
+        lines = []
+        for name, stage in pipeline.stats.items():
+            if not stage.calls:
+                lines.append(f"`{name:<14}` idle")
+                continue
+            avg_us = stage.total_ns / stage.calls / 1000
+            lines.append(
+                f"`{name:<14}` {stage.calls} calls · avg {avg_us:.1f}µs · "
+                f"max {stage.max_ns / 1000:.1f}µs · consumed {stage.consumed}"
+            )
+
+        embed = discord.Embed(
+            title="📈 Message Pipeline",
+            description="\n".join(lines) or "No stages registered.",
+            color=discord.Color.blurple(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Detectors (in order)", value=", ".join(pipeline.detectors) or "None", inline=False)
+        embed.add_field(name="Skipped early", value=str(pipeline.skipped), inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="httpstats", description="Show per-host counters of the shared HTTP client")
+    @commands.is_owner()
+    async def httpstats(self, ctx):
+        """Show requests, latency and connection reuse per external host."""
+        stats = self.bot.http_client.stats
+        lines = []
+        for host, host_stats in sorted(stats.items(), key=lambda item: -item[1].requests):
+            lines.append(
+                f"`{host}` {host_stats.requests} req · {host_stats.errors} err · "
+                f"avg {host_stats.avg_ms:.0f}ms · max {host_stats.max_ms:.0f}ms · "
+                f"conn new {host_stats.new_connections} / reused {host_stats.reused_connections}"
+            )
+
+        embed = discord.Embed(
+            title="🌐 HTTP Client",
+            description="\n".join(lines[:20]) or "No requests made yet.",
+            color=discord.Color.blurple(),
+            timestamp=discord.utils.utcnow()
+        )
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="startupstats", description="Show how long each extension took to load at startup")
+    @commands.is_owner()
+    async def startupstats(self, ctx):
+        """Show the slowest extensions from the last startup, import and setup separately."""
+        report = self.bot.startup_report
+        table = format_report(report, self.bot.startup_ms, limit=15) if report else "No startup report recorded."
+        embed = discord.Embed(
+            title="⏱️ Startup",
+            description=f"```{table}```",
+            color=discord.Color.blurple(),
+            timestamp=discord.utils.utcnow()
+        )
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    """Load the Diagnostics cog."""
+    await bot.add_cog(Diagnostics(bot))
@@ -0,0 +1,81 @@
+"""Owner-only hot reload of cogs.
+
+Front end for the bot's ExtensionReloader: reload named extensions (or all
+of them) without restarting the process, and switch the file watcher that
+reloads cogs as soon as they are saved.
+"""
+
+from typing import List, Literal
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+
+class Reload(commands.Cog):
+    """Owner-only extension reloading and file watching."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    def _resolve(self, names: List[str]) -> List[str]:
+        """Accept full names (cogs.fun.meme) or unambiguous short ones (meme, fun.meme); `all` for everything."""
+        if "all" in names:
+            return list(self.bot.extensions)
+        resolved = []
+        for raw in names:
+            name = raw.strip().replace("/", ".").removesuffix(".py")
+            if not name:
+                continue
+            if not name.startswith("cogs."):
+                matches = [ext for ext in self.bot.extensions if ext == f"cogs.{name}" or ext.endswith(f".{name}")]
+                name = matches[0] if len(matches) == 1 else f"cogs.{name}"
+            resolved.append(name)
+        return resolved
+
+    @commands.hybrid_command(name="reload", description="Reload cogs without restarting the bot")
+    @commands.is_owner()
+    @app_commands.describe(extensions="Space-separated cogs (e.g. meme moderation.ban), or 'all'")
+    async def reload(self, ctx, *, extensions: str):
+        """Reload the given extensions, keeping cog state; commands are re-synced only if they changed."""
+        names = self._resolve(extensions.split())
+        if not names:
+            await ctx.send("❌ Name at least one extension, or `all`.")
+            return
+        await ctx.defer()
+        result = await self.bot.reloader.reload(names)
+
+        if not result.failed:
+            title, color = "🔄 Reload", discord.Color.green()
+        elif result.reloaded or result.loaded or result.unloaded:
+            title, color = "⚠️ Reload finished with errors", discord.Color.orange()
+        else:
+            title, color = "❌ Reload failed", discord.Color.red()
+        embed = discord.Embed(title=title, color=color, timestamp=discord.utils.utcnow())
+        for label, group in (("Reloaded", result.reloaded), ("Loaded", result.loaded), ("Unloaded", result.unloaded)):
+            if group:
+                embed.add_field(name=f"{label} ({len(group)})", value=", ".join(f"`{n}`" for n in group)[:1024], inline=False)
+        if result.failed:
+            lines = "\n".join(f"`{n}` — {error}" for n, error in result.failed.items())
+            embed.add_field(name=f"Failed ({len(result.failed)})", value=lines[:1024], inline=False)
+        embed.set_footer(text="Commands re-synced" if result.synced else "Command tree unchanged, no sync needed")
+        await ctx.send(embed=embed)
+
+    @commands.hybrid_command(name="autoreload", description="Reload cogs automatically when their files change")
+    @commands.is_owner()
+    @app_commands.describe(mode="on / off / status")
+    async def autoreload(self, ctx, mode: Literal["on", "off", "status"] = "status"):
+        """Start or stop watching the cogs directory for changes."""
+        reloader = self.bot.reloader
+        if mode == "on":
+            reloader.start_watching()
+        elif mode == "off":
+            await reloader.stop_watching()
+
+        state = "watching" if reloader.watching else "not watching"
+        await ctx.send(f"👀 Auto-reload is **{state}** `{reloader.base}/` ({reloader.backend}).")
+
+
+async def setup(bot):
+    """Load the Reload cog."""
+    await bot.add_cog(Reload(bot))
@@ -0,0 +1,66 @@
+"""Owner-only application command sync.
+
+Wraps the bot's hash-gated CommandSyncer: upload only when the command tree
+changed, force an upload, or preview what would change without touching
+Discord.
+"""
+
+from typing import List, Literal
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+FIELD_LIMIT = 1024
+
+
+def _field(names: List[str]) -> str:
+    """Backticked, comma-separated names that fit in one embed field."""
+    text = ", ".join(f"`{name}`" for name in names)
+    if len(text) > FIELD_LIMIT:
+        text = text[:FIELD_LIMIT - 1].rsplit(",", 1)[0] + " …"
+    return text
+
+
+class Sync(commands.Cog):
+    """Owner-only command sync with change detection."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="sync", description="Sync application commands (skipped if nothing changed)")
+    @commands.is_owner()
+    @app_commands.describe(mode="auto: sync only if changed · force: always sync · dry: only show the diff")
+    async def sync(self, ctx, mode: Literal["auto", "force", "dry"] = "auto"):
+        """Sync the command tree; `force` skips the hash check, `dry` only shows the diff."""
+        syncer = self.bot.command_sync
+        await ctx.defer()
+        diff = await syncer.diff()
+
+        if mode == "dry":
+            title = "🔍 Sync preview" if diff else "🔍 Sync preview — nothing changed"
+            color = discord.Color.orange() if diff else discord.Color.green()
+        else:
+            try:
+                result = await syncer.sync(force=(mode == "force"))
+            except discord.HTTPException as e:
+                await ctx.send(f"❌ Sync failed: {e}")
+                return
+            if result.synced:
+                title = f"✅ Synced {result.count} commands"
+                color = discord.Color.green()
+            else:
+                title = f"⏭️ Skipped — {result.count} commands unchanged"
+                color = discord.Color.blurple()
+
+        embed = discord.Embed(title=title, color=color, timestamp=discord.utils.utcnow())
+        for name, names in (("Added", diff.added), ("Removed", diff.removed), ("Changed", diff.changed)):
+            if names:
+                embed.add_field(name=f"{name} ({len(names)})", value=_field(names), inline=False)
+        embed.set_footer(text=f"Scope: {syncer.scope} · compared with the last recorded sync")
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    """Load the Sync cog."""
+    await bot.add_cog(Sync(bot))
@@ -3,10 +3,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import platform
-import psutil
 import time
 from typing import Union
 
+from core.lazy import lazy_import
+
+# only needed once someone runs /botinfo; imported in the background after startup
+psutil = lazy_import("psutil")
+
 class BotInfo(commands.Cog):
     """Display bot information and statistics."""
 
@@ -14,8 +18,8 @@ class BotInfo(commands.Cog):
         self.bot = bot
         # record start time in seconds (monotonic-like)
         self.start_time = time.time()
-        # reuse process object for memory/cpu stats
-        self._proc = psutil.Process()
+        # process object for memory/cpu stats, created on first use and then reused
+        self._proc = None
 
     @commands.hybrid_command(name="botinfo", description="Display bot information and statistics")
     async def botinfo(self, ctx: commands.Context):
@@ -37,6 +41,8 @@ class BotInfo(commands.Cog):
             uptime_str = self._format_uptime(uptime_seconds)
 
             # memory (MB)
+            if self._proc is None:
+                self._proc = psutil.Process()
             memory_usage = self._proc.memory_info().rss / (1024 ** 2)
 
             # cpu percent: non-blocking short interval for a more accurate snapshot
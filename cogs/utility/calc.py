@@ -1,7 +1,10 @@
 # cogs/util/calc.py
 import ast
+import functools
+import math
 import operator
-from typing import Union
+import time
+from typing import Tuple, Union
 
 import discord
 from discord.ext import commands
@@ -25,12 +28,129 @@ ALLOWED_UNARYOPS = {
 MAX_EXPONENT = 10          # disallow x ** y where y > MAX_EXPONENT (absolute)
 MAX_RESULT = 1e12          # disallow extremely large results
 MAX_NODES = 200            # avoid very deep/large ASTs
+MAX_LENGTH = 500           # characters; longer input is rejected before parsing
+MAX_INTERMEDIATE = 1e100   # no step may produce (or be about to produce) more than this
+MAX_EVAL_SECONDS = 0.05    # wall-clock cap for running one compiled expression
+CACHE_SIZE = 512           # compiled expressions kept
+
+# Bytecode: a flat tuple of (opcode, arg) run on a value stack
+PUSH, UNARY, BINARY = range(3)
+
+_LOG_LIMIT = math.log10(MAX_INTERMEDIATE)
 
 
 class SafeCalcError(Exception):
     pass
 
 
+def _normalize(expression: str) -> str:
+    """Cache key: same expression modulo surrounding/repeated whitespace."""
+    return " ".join(expression.split())
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression: str) -> Tuple[Tuple[int, object], ...]:
+    """Validate an expression and compile it to stack bytecode (cached per expression)."""
+    if len(expression) > MAX_LENGTH:
+        raise SafeCalcError(f"Expression too long (max {MAX_LENGTH} characters).")
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except (SyntaxError, ValueError) as se:
+        raise SafeCalcError("Syntax error in expression.") from se
+    except (RecursionError, MemoryError) as e:
+        raise SafeCalcError("Expression too complex.") from e
+
+    code = []
+    # iterative post-order walk: operands are emitted before their operator
+    stack = [(tree.body, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if len(code) + len(stack) > MAX_NODES:
+            raise SafeCalcError("Expression too complex.")
+
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise SafeCalcError("Only numeric constants are allowed.")
+            code.append((PUSH, node.value))
+        elif isinstance(node, ast.UnaryOp):
+            op_type = type(node.op)
+            if op_type not in ALLOWED_UNARYOPS:
+                raise SafeCalcError("Unsupported unary operator.")
+            if expanded:
+                code.append((UNARY, ALLOWED_UNARYOPS[op_type]))
+            else:
+                stack.append((node, True))
+                stack.append((node.operand, False))
+        elif isinstance(node, ast.BinOp):
+            op_type = type(node.op)
+            if op_type not in ALLOWED_BINOPS:
+                raise SafeCalcError("Unsupported binary operator.")
+            if expanded:
+                code.append((BINARY, op_type))
+            else:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+        else:
+            # Reject any other node types explicitly (Name, Call, Attribute, Subscript, etc.)
+            raise SafeCalcError("Unsupported expression element detected (only numbers and basic operators allowed).")
+    return tuple(code)
+
+
+def _log10(value) -> float:
+    return math.log10(abs(value)) if value else -math.inf
+
+
+def _check_budget(op_type, left, right):
+    """Reject an operation before running it if its result would exceed the magnitude budget."""
+    if op_type is ast.Pow:
+        if isinstance(right, complex) or abs(right) > MAX_EXPONENT:
+            raise SafeCalcError(f"Exponent too large (max {MAX_EXPONENT}).")
+        if abs(left) > 1 and right > 0 and _log10(left) * right > _LOG_LIMIT:
+            raise SafeCalcError("Intermediate result too large.")
+    elif op_type is ast.Mult:
+        if _log10(left) + _log10(right) > _LOG_LIMIT:
+            raise SafeCalcError("Intermediate result too large.")
+    elif op_type in (ast.Div, ast.FloorDiv):
+        if right and _log10(left) - _log10(right) > _LOG_LIMIT:
+            raise SafeCalcError("Intermediate result too large.")
+
+
+def run_compiled(code: Tuple[Tuple[int, object], ...]):
+    """Execute bytecode with magnitude checks on every step and a wall-clock cap."""
+    deadline = time.perf_counter() + MAX_EVAL_SECONDS
+    stack = []
+    for steps, (opcode, arg) in enumerate(code):
+        if opcode == PUSH:
+            value = arg
+        elif opcode == UNARY:
+            value = arg(stack.pop())
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            _check_budget(arg, left, right)
+            try:
+                value = ALLOWED_BINOPS[arg](left, right)
+            except ZeroDivisionError:
+                raise SafeCalcError("Division by zero.")
+            except Exception:
+                raise SafeCalcError("Error evaluating expression.")
+
+        if isinstance(value, complex):
+            raise SafeCalcError("Result is not a real number.")
+        if not abs(value) <= MAX_INTERMEDIATE:  # also catches inf/nan
+            raise SafeCalcError("Intermediate result too large.")
+        if steps % 16 == 15 and time.perf_counter() > deadline:
+            raise SafeCalcError("Expression took too long to evaluate.")
+        stack.append(value)
+    return stack.pop()
+
+
+def evaluate(expression: str):
+    """Compile (or fetch from cache) and run an expression."""
+    return run_compiled(compile_expression(_normalize(expression)))
+
+
 class Calculator(commands.Cog):
     """Safe calculator with hybrid command (prefix + slash)."""
 
@@ -50,18 +170,8 @@ class Calculator(commands.Cog):
             if not expression:
                 raise SafeCalcError("Empty expression.")
 
-            # Parse to AST
-            try:
-                node = ast.parse(expression, mode="eval")
-            except SyntaxError as se:
-                raise SafeCalcError("Syntax error in expression.") from se
-
-            # Basic node count limit
-            all_nodes = list(ast.walk(node))
-            if len(all_nodes) > MAX_NODES:
-                raise SafeCalcError("Expression too complex.")
-
-            result = self._eval_node(node.body)
+            # Compiled once per distinct expression, then run under step budgets
+            result = evaluate(expression)
 
             # Enforce result magnitude limit
             if isinstance(result, (int, float)) and abs(result) > MAX_RESULT:
@@ -112,56 +222,6 @@ class Calculator(commands.Cog):
             else:
                 await ctx.send(embed=err_embed)
 
-    def _eval_node(self, node):
-        """Recursively evaluate a whitelisted AST node."""
-        # Numbers (Constant for py3.8+)
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, (int, float)):
-                return node.value
-            raise SafeCalcError("Only numeric constants are allowed.")
-
-        # Support legacy Num node (just in case)
-        if isinstance(node, ast.Num):
-            return node.n
-
-        # Parenthesis/grouping are represented by the sub-node already (no separate node)
-
-        # Unary ops
-        if isinstance(node, ast.UnaryOp):
-            op_type = type(node.op)
-            if op_type not in ALLOWED_UNARYOPS:
-                raise SafeCalcError("Unsupported unary operator.")
-            val = self._eval_node(node.operand)
-            return ALLOWED_UNARYOPS[op_type](val)
-
-        # Binary ops
-        if isinstance(node, ast.BinOp):
-            op_type = type(node.op)
-            if op_type not in ALLOWED_BINOPS:
-                raise SafeCalcError("Unsupported binary operator.")
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
-
-            # Exponent safety: limit exponent magnitude
-            if op_type is ast.Pow:
-                try:
-                    if abs(right) > MAX_EXPONENT:
-                        raise SafeCalcError(f"Exponent too large (max {MAX_EXPONENT}).")
-                except TypeError:
-                    raise SafeCalcError("Invalid exponent.")
-
-            try:
-                return ALLOWED_BINOPS[op_type](left, right)
-            except ZeroDivisionError:
-                raise SafeCalcError("Division by zero.")
-            except Exception:
-                raise SafeCalcError("Error evaluating expression.")
-
-        # Parenthesized expression or nested expression handled by AST structure
-
-        # Reject any other node types explicitly (Name, Call, Attribute, Subscript, etc.)
-        raise SafeCalcError("Unsupported expression element detected (only numbers and basic operators allowed).")
-
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Calculator(bot))
@@ -1,7 +1,8 @@
 # cogs/util/convert.py
+import io
 import re
 import math
-from typing import Union, Tuple, Optional
+from typing import Dict, List, Union, Tuple, Optional
 
 import discord
 from discord.ext import commands
@@ -127,6 +128,111 @@ def _convert_temperature(value: float, from_u: str, to_u: str) -> float:
     return c
 
 
+# --- batch mode ---
+# Every unit as an affine map onto its dimension's base unit: base = value * scale + offset
+_TEMP_AFFINE = {"c": (1.0, 0.0), "f": (5.0 / 9.0, -32 * 5.0 / 9.0), "k": (1.0, -273.15)}
+
+
+def _canonical_units() -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """dimension -> {canonical unit: (scale, offset)}; aliases sharing a factor collapse into one unit."""
+    units: Dict[str, Dict[str, Tuple[float, float]]] = {"length": {}, "mass": {}, "temp": dict(_TEMP_AFFINE)}
+    for dimension, table in (("length", _LENGTH_UNITS), ("mass", _MASS_UNITS)):
+        for name, factor in table.items():
+            if all(scale != factor for scale, _ in units[dimension].values()):
+                units[dimension][name] = (factor, 0.0)
+    return units
+
+
+_BASE_AFFINE = _canonical_units()
+
+# Precomputed (scale, offset) for every ordered pair of units within a dimension
+CONVERSION_MATRICES: Dict[str, Dict[Tuple[str, str], Tuple[float, float]]] = {
+    dimension: {
+        (src, dst): (a1 / a2, (b1 - b2) / a2)
+        for src, (a1, b1) in units.items()
+        for dst, (a2, b2) in units.items()
+    }
+    for dimension, units in _BASE_AFFINE.items()
+}
+
+
+def _canonical(u: str) -> Optional[Tuple[str, str]]:
+    """Map any accepted spelling of a unit to (dimension, canonical unit)."""
+    info = _identify_unit(u)
+    if not info:
+        return None
+    dimension, factor = info
+    if dimension == "temp":
+        return dimension, _TEMP_UNITS[_normalize_unit(u).replace("°", "")]
+    name = next(n for n, (scale, _) in _BASE_AFFINE[dimension].items() if scale == factor)
+    return dimension, name
+
+
+MAX_BATCH = 1000       # values per batch command
+TABLE_ROWS = 25        # larger batches are sent as a CSV attachment
+CSV_FLAG = re.compile(r"(?<!\S)--csv(?!\S)", re.IGNORECASE)  # forces the CSV attachment
+
+# "<from> to|in|-> <to>" is tried first so "10 mi in km" isn't read as inches
+_BATCH_UNITS_RE = (
+    re.compile(r"(?P<from_unit>[a-zA-Z°]+)\s*(?:\bto\b|\bin\b|->)\s*(?P<to_unit>[a-zA-Z°]+)\s*$", re.IGNORECASE),
+    re.compile(r"(?P<from_unit>[a-zA-Z°]+)\s+(?P<to_unit>[a-zA-Z°]+)\s*$", re.IGNORECASE),
+)
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_RANGE_RE = re.compile(rf"^(?P<start>{_NUMBER})\.\.(?P<stop>{_NUMBER})(?::(?P<step>{_NUMBER}))?$")
+_NUMBER_RE = re.compile(rf"^{_NUMBER}$")
+
+
+def _parse_values(spec: str) -> List[float]:
+    """Numbers separated by commas/whitespace/newlines, and ranges like 1..100 or 0..1:0.25."""
+    values: List[float] = []
+    for token in re.split(r"[\s,;]+", spec.strip()):
+        if not token:
+            continue
+        m = _RANGE_RE.match(token)
+        if m:
+            start, stop = float(m.group("start")), float(m.group("stop"))
+            step = abs(float(m.group("step") or 1))
+            if step == 0:
+                raise ValueError(f"Range `{token}` has a zero step.")
+            count = int(math.floor(abs(stop - start) / step + 1e-9)) + 1
+            if len(values) + count > MAX_BATCH:
+                raise ValueError(f"Too many values (max {MAX_BATCH}).")
+            step = step if stop >= start else -step
+            values.extend(start + i * step for i in range(count))
+        elif _NUMBER_RE.match(token):
+            values.append(float(token))
+        else:
+            raise ValueError(f"`{token[:30]}` is not a number or range.")
+        if len(values) > MAX_BATCH:
+            raise ValueError(f"Too many values (max {MAX_BATCH}).")
+    if not values:
+        raise ValueError("No values given.")
+    return values
+
+
+def _parse_batch(query: str) -> Tuple[List[float], str, str]:
+    """Split '<values> <from> to <to>' into its parts."""
+    matches = [m for m in (pattern.search(query) for pattern in _BATCH_UNITS_RE) if m]
+    # prefer a reading where both units are known; otherwise report the first one's units
+    m = next((m for m in matches if _identify_unit(m.group("from_unit")) and _identify_unit(m.group("to_unit"))),
+             matches[0] if matches else None)
+    if not m:
+        raise ValueError("End the query with the units, e.g. `1..100 km to mi`.")
+    return _parse_values(query[:m.start()]), m.group("from_unit"), m.group("to_unit")
+
+
+def convert_many(values: List[float], from_unit: str, to_unit: str) -> List[float]:
+    """Convert all values in one pass with a single precomputed (scale, offset) pair."""
+    src = _canonical(from_unit)
+    dst = _canonical(to_unit)
+    if not src or not dst:
+        raise ValueError(f"Could not recognize units `{from_unit}` or `{to_unit}`.")
+    if src[0] != dst[0]:
+        raise ValueError(f"Cannot convert from `{from_unit}` ({src[0]}) to `{to_unit}` ({dst[0]}).")
+    scale, offset = CONVERSION_MATRICES[src[0]][(src[1], dst[1])]
+    return [v * scale + offset for v in values]
+
+
 class Convert(commands.Cog):
     """Convert between length, mass, and temperature units. Supports hybrid command and free-form strings."""
 
@@ -294,6 +400,79 @@ class Convert(commands.Cog):
             else:
                 await ctx.send(embed=err)
 
+    @commands.hybrid_command(
+        name="convertbatch",
+        aliases=["convertmany"],
+        description="Convert many values at once. Example: /convertbatch query:\"1..100 km to mi\""
+    )
+    @app_commands.describe(
+        query="Values (list, column or range like 1..100 or 0..1:0.25) followed by units, e.g. '1, 5, 10 kg to lb'; add --csv for a file"
+    )
+    async def convertbatch(self, ctx: Union[commands.Context, discord.Interaction], *, query: str):
+        """
+        Usage examples:
+          - /convertbatch query:"1..100 km to mi"
+          - <prefix>convertbatch 0, 37, 100 C to F
+          - <prefix>convertbatch followed by a pasted column of numbers and then `lb to kg`
+          - <prefix>convertbatch --csv 1..10 kg to lb   (always attach a CSV)
+        """
+        is_interaction = isinstance(ctx, discord.Interaction)
+        requester = getattr(ctx.user if is_interaction else ctx.author, "display_name", "Unknown")
+
+        # `--csv` anywhere in the query forces a file; it is never mistaken for a value
+        query, flags = CSV_FLAG.subn(" ", query)
+        as_csv = flags > 0
+
+        try:
+            values, from_unit, to_unit = _parse_batch(query)
+            results = convert_many(values, from_unit, to_unit)
+        except ValueError as exc:
+            err = discord.Embed(
+                title="❌ Could not convert batch",
+                description=f"{exc}\nExamples: `1..100 km to mi`, `0, 37, 100 C to F`, `0..1:0.25 kg to lb`.",
+                color=discord.Color.red(),
+                timestamp=discord.utils.utcnow()
+            )
+            err.set_footer(text=f"Requested by {requester}")
+            if is_interaction:
+                await ctx.response.send_message(embed=err, ephemeral=True)
+            else:
+                await ctx.send(embed=err)
+            return
+
+        embed = discord.Embed(
+            title="🔄 Batch Conversion",
+            description=f"**{len(values)}** value(s): `{from_unit}` → `{to_unit}`",
+            color=discord.Color.teal(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.set_footer(text=f"Requested by {requester}")
+
+        file = None
+        if as_csv or len(values) > TABLE_ROWS:
+            lines = [f"{from_unit},{to_unit}"]
+            lines.extend(f"{v!r},{r!r}" for v, r in zip(values, results))
+            file = discord.File(io.BytesIO("\n".join(lines).encode()), filename="conversion.csv")
+            embed.add_field(name="Result", value="Attached as `conversion.csv`.", inline=False)
+        else:
+            left = [_format_number(v) for v in values]
+            right = [_format_number(r) for r in results]
+            width = max(len(from_unit), *(len(x) for x in left))
+            rows = [f"{from_unit:>{width}} │ {to_unit}", f"{'─' * width}─┼─{'─' * max(len(to_unit), 4)}"]
+            rows.extend(f"{a:>{width}} │ {b}" for a, b in zip(left, right))
+            embed.add_field(name="Result", value="```\n" + "\n".join(rows)[:1000] + "\n```", inline=False)
+
+        kwargs = {"embed": embed}
+        if file is not None:
+            kwargs["file"] = file
+        if is_interaction:
+            if not ctx.response.is_done():
+                await ctx.response.send_message(**kwargs)
+            else:
+                await ctx.followup.send(**kwargs)
+        else:
+            await ctx.send(**kwargs)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Convert(bot))
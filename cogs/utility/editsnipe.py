@@ -1,53 +1,260 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Deque, Optional, Tuple
+import time
+
+MAX_SNIPES_PER_CHANNEL = 10
+SNIPE_TTL = 3600                    # seconds a sniped message is kept
+MEMORY_BUDGET = 8 * 1024 * 1024     # approximate bytes of text kept across all channels
+RECORD_OVERHEAD = 120               # rough per-record cost on top of its text
+RECENT_PER_CHANNEL = 100            # recent message texts remembered per channel for raw edits
+RECENT_BUDGET = 16 * 1024 * 1024    # approximate bytes of recent message text across all channels
+
+EDIT = "edit"
+DELETE = "delete"
+
+
+class _SnipeRecord:
+    """Compact snapshot of an edited or deleted message (no discord objects kept alive)."""
+
+    __slots__ = ("author_id", "author_name", "before", "after", "created", "size")
+
+    def __init__(self, author_id: int, author_name: str, before: str, after: Optional[str]):
+        self.author_id = author_id
+        self.author_name = author_name
+        self.before = before
+        self.after = after
+        self.created = time.time()
+        self.size = RECORD_OVERHEAD + len(author_name) + len(before) + len(after or "")
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.created, timezone.utc)
+
+
+class SnipeStore:
+    """Fixed-size ring buffer per (kind, channel) under one global byte budget.
+
+    Channels are kept in LRU order; when the budget is exceeded the coldest
+    channel's buffer is dropped whole. Adding a record is O(1).
+    """
+
+    def __init__(self, per_channel: int = MAX_SNIPES_PER_CHANNEL, budget: int = MEMORY_BUDGET):
+        self.per_channel = per_channel
+        self.budget = budget
+        self.bytes = 0
+        self._rings: "OrderedDict[Tuple[str, int], Deque[_SnipeRecord]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def add(self, kind: str, channel_id: int, record: _SnipeRecord):
+        key = (kind, channel_id)
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = deque(maxlen=self.per_channel)
+        else:
+            self._rings.move_to_end(key)
+        if len(ring) == ring.maxlen:
+            self.bytes -= ring[0].size
+        ring.append(record)
+        self.bytes += record.size
+        while self.bytes > self.budget and len(self._rings) > 1:
+            _, cold = self._rings.popitem(last=False)
+            self.bytes -= sum(r.size for r in cold)
+
+    def get(self, kind: str, channel_id: int) -> Tuple[_SnipeRecord, ...]:
+        """Records for a channel, newest first."""
+        ring = self._rings.get((kind, channel_id))
+        if not ring:
+            return ()
+        self._rings.move_to_end((kind, channel_id))
+        return tuple(reversed(ring))
+
+    def sweep(self, ttl: float):
+        """Drop records older than `ttl` seconds (each ring is oldest-first)."""
+        cutoff = time.time() - ttl
+        for key in list(self._rings):
+            ring = self._rings[key]
+            while ring and ring[0].created < cutoff:
+                self.bytes -= ring.popleft().size
+            if not ring:
+                del self._rings[key]
+
+
+class RecentContent:
+    """Content-only cache of recent messages, so raw edit/delete events can
+    recover the old text without discord.py's full Message cache.
+
+    Per channel: the newest RECENT_PER_CHANNEL messages. Globally: channels in
+    LRU order under a byte budget.
+    """
+
+    def __init__(self, per_channel: int = RECENT_PER_CHANNEL, budget: int = RECENT_BUDGET):
+        self.per_channel = per_channel
+        self.budget = budget
+        self.bytes = 0
+        # channel_id -> OrderedDict[message_id, (author_id, author_name, content)]
+        self._channels: "OrderedDict[int, OrderedDict[int, Tuple[int, str, str]]]" = OrderedDict()
+
+    @staticmethod
+    def _size(entry: Tuple[int, str, str]) -> int:
+        return RECORD_OVERHEAD + len(entry[1]) + len(entry[2])
+
+    def put(self, channel_id: int, message_id: int, author_id: int, author_name: str, content: str):
+        messages = self._channels.get(channel_id)
+        if messages is None:
+            messages = self._channels[channel_id] = OrderedDict()
+        else:
+            self._channels.move_to_end(channel_id)
+        old = messages.pop(message_id, None)
+        if old is not None:
+            self.bytes -= self._size(old)
+        entry = (author_id, author_name, content)
+        messages[message_id] = entry
+        self.bytes += self._size(entry)
+        while len(messages) > self.per_channel:
+            self.bytes -= self._size(messages.popitem(last=False)[1])
+        while self.bytes > self.budget and len(self._channels) > 1:
+            _, cold = self._channels.popitem(last=False)
+            self.bytes -= sum(self._size(e) for e in cold.values())
+
+    def get(self, channel_id: int, message_id: int) -> Optional[Tuple[int, str, str]]:
+        messages = self._channels.get(channel_id)
+        return messages.get(message_id) if messages else None
+
+    def pop(self, channel_id: int, message_id: int) -> Optional[Tuple[int, str, str]]:
+        messages = self._channels.get(channel_id)
+        if not messages:
+            return None
+        entry = messages.pop(message_id, None)
+        if entry is not None:
+            self.bytes -= self._size(entry)
+            if not messages:
+                del self._channels[channel_id]
+        return entry
+
 
 class EditSnipe(commands.Cog):
-    """Track and display recently edited messages across guilds.
+    """Track and display recently edited and deleted messages across guilds.
     
-    This cog captures message edit events and allows users to view
-    the before/after content of recently edited messages in a channel.
-    Supports hybrid commands (prefix + slash) with multi-guild functionality.
+    This cog captures message edit and delete events and allows users to view
+    the before/after content of recently edited messages in a channel, or the
+    content of recently deleted ones. Storage is bounded per channel and by a
+    global memory budget. Supports hybrid commands (prefix + slash) with
+    multi-guild functionality.
+
+    Raw gateway events are used, so edits and deletes of messages that are
+    not (or no longer) in discord.py's message cache are still caught; the
+    old text comes from a small content-only cache of recent messages.
     """
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        # Store edited messages: {guild_id: {channel_id: [(before, after, author, timestamp)]}}
-        self.edit_snipes = {}
-        self.max_snipes_per_channel = 10
+        # Ring buffers of edits/deletes per channel (channel ids are globally unique)
+        self.store = SnipeStore()
+        # Text of recent messages, for reconstructing "before" from raw events
+        self.recent = RecentContent()
+        self.max_snipes_per_channel = MAX_SNIPES_PER_CHANNEL
+        self.sweep_expired.start()
+
+    def cog_unload(self):
+        self.sweep_expired.cancel()
+
+    def export_state(self) -> dict:
+        """Snipes and recent message text as plain tuples, handed to the cog after a hot reload."""
+        return {
+            "snipes": [
+                (kind, channel_id, [(r.author_id, r.author_name, r.before, r.after, r.created) for r in ring])
+                for (kind, channel_id), ring in self.store._rings.items()
+            ],
+            "recent": [(channel_id, list(messages.items())) for channel_id, messages in self.recent._channels.items()],
+        }
+
+    def import_state(self, state: dict):
+        for kind, channel_id, records in state.get("snipes", ()):
+            for author_id, author_name, before, after, created in records:
+                record = _SnipeRecord(author_id, author_name, before, after)
+                record.created = created
+                self.store.add(kind, channel_id, record)
+        for channel_id, messages in state.get("recent", ()):
+            for message_id, (author_id, author_name, content) in messages:
+                self.recent.put(channel_id, message_id, author_id, author_name, content)
+
+    @tasks.loop(minutes=5)
+    async def sweep_expired(self):
+        """Forget snipes older than SNIPE_TTL."""
+        self.store.sweep(SNIPE_TTL)
     
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        """Listener to capture message edits.
+    async def on_message(self, message: discord.Message):
+        """Remember the text of new messages for later edit/delete lookups."""
+        if message.author.bot or not message.content:
+            return
+        self.recent.put(message.channel.id, message.id, message.author.id, str(message.author), message.content)
+
+    def _previous(self, payload) -> Optional[Tuple[int, str, str]]:
+        """(author_id, author_name, content) before the event, from either cache."""
+        cached = payload.cached_message
+        if cached is not None:
+            if cached.author.bot:
+                return None
+            return cached.author.id, str(cached.author), cached.content
+        return self.recent.get(payload.channel_id, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        """Listener to capture message edits, cached or not.
         
         Args:
-            before: The message before editing
-            after: The message after editing
+            payload: The raw edit event
         """
-        # Ignore bot messages and messages without content changes
-        if before.author.bot or before.content == after.content:
+        # Embed unfurls and other updates without new content are not edits
+        data = payload.data
+        if "content" not in data or data.get("author", {}).get("bot"):
             return
         
-        guild_id = before.guild.id if before.guild else 0
-        channel_id = before.channel.id
+        previous = self._previous(payload)
+        after = data["content"]
+        if previous is None:
+            # never saw the original text; remember the new one for next time
+            author = data.get("author")
+            if author:
+                name = author.get("global_name") or author.get("username", "Unknown")
+                self.recent.put(payload.channel_id, payload.message_id, int(author["id"]), name, after)
+            return
         
-        # Initialize storage for this guild if needed
-        if guild_id not in self.edit_snipes:
-            self.edit_snipes[guild_id] = {}
+        author_id, author_name, before = previous
+        self.recent.put(payload.channel_id, payload.message_id, author_id, author_name, after)
+        # Ignore edits without content changes
+        if before == after:
+            return
         
-        # Initialize storage for this channel if needed
-        if channel_id not in self.edit_snipes[guild_id]:
-            self.edit_snipes[guild_id][channel_id] = []
+        self.store.add(EDIT, payload.channel_id, _SnipeRecord(author_id, author_name, before, after))
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Listener to capture deleted messages for the snipe command.
         
-        # Store the edit (before, after, author, timestamp)
-        edit_data = (before.content, after.content, before.author, datetime.now(timezone.utc))
-        self.edit_snipes[guild_id][channel_id].insert(0, edit_data)
+        Args:
+            payload: The raw delete event
+        """
+        previous = self._previous(payload)
+        self.recent.pop(payload.channel_id, payload.message_id)
+        if previous is None or not previous[2]:
+            return
         
-        # Keep only the most recent edits
-        if len(self.edit_snipes[guild_id][channel_id]) > self.max_snipes_per_channel:
-            self.edit_snipes[guild_id][channel_id].pop()
+        author_id, author_name, content = previous
+        self.store.add(DELETE, payload.channel_id, _SnipeRecord(author_id, author_name, content, None))
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """Purges aren't sniped; just forget the messages."""
+        for message_id in payload.message_ids:
+            self.recent.pop(payload.channel_id, message_id)
     
     @commands.hybrid_command(name="editsnipe", aliases=["es", "esnipe"])
     @app_commands.describe(index="The position of the edit to retrieve (1 = most recent)")
@@ -58,6 +265,21 @@ class EditSnipe(commands.Cog):
             ctx: The command context
             index: Which edit to show (1-10, default 1 for most recent)
         """
+        await self._send_snipe(ctx, EDIT, index)
+
+    @commands.hybrid_command(name="snipe", aliases=["s"])
+    @app_commands.describe(index="The position of the deleted message to retrieve (1 = most recent)")
+    async def snipe(self, ctx: commands.Context, index: Optional[int] = 1):
+        """Display recently deleted messages in the current channel.
+        
+        Args:
+            ctx: The command context
+            index: Which deleted message to show (1-10, default 1 for most recent)
+        """
+        await self._send_snipe(ctx, DELETE, index)
+
+    async def _send_snipe(self, ctx: commands.Context, kind: str, index: int):
+        noun = "edit" if kind == EDIT else "deleted message"
         # Validate index range
         if index < 1 or index > self.max_snipes_per_channel:
             embed = discord.Embed(
@@ -70,16 +292,15 @@ class EditSnipe(commands.Cog):
             await ctx.send(embed=embed, ephemeral=True)
             return
         
-        guild_id = ctx.guild.id if ctx.guild else 0
-        channel_id = ctx.channel.id
-        
-        # Check if we have any edits for this channel
-        if (guild_id not in self.edit_snipes or 
-            channel_id not in self.edit_snipes[guild_id] or 
-            not self.edit_snipes[guild_id][channel_id]):
+        # Check if we have any snipes for this channel
+        records = self.store.get(kind, ctx.channel.id)
+        if not records:
             embed = discord.Embed(
-                title="🔍 No Edits Found",
-                description="No recently edited messages in this channel.",
+                title="🔍 No Edits Found" if kind == EDIT else "🔍 Nothing to Snipe",
+                description=(
+                    "No recently edited messages in this channel." if kind == EDIT
+                    else "No recently deleted messages in this channel."
+                ),
                 color=discord.Color.orange(),
                 timestamp=datetime.now(timezone.utc)
             )
@@ -88,11 +309,10 @@ class EditSnipe(commands.Cog):
             return
         
         # Check if the requested index exists
-        edits = self.edit_snipes[guild_id][channel_id]
-        if index > len(edits):
+        if index > len(records):
             embed = discord.Embed(
                 title="❌ Index Out of Range",
-                description=f"Only {len(edits)} edit(s) available in this channel.",
+                description=f"Only {len(records)} {noun}(s) available in this channel.",
                 color=discord.Color.red(),
                 timestamp=datetime.now(timezone.utc)
             )
@@ -100,50 +320,59 @@ class EditSnipe(commands.Cog):
             await ctx.send(embed=embed, ephemeral=True)
             return
         
-        # Get the requested edit (convert to 0-based index)
-        before_content, after_content, author, timestamp = edits[index - 1]
+        # Get the requested record (convert to 0-based index)
+        record = records[index - 1]
+        mention = f"<@{record.author_id}>"
         
         # Create master embed design
         embed = discord.Embed(
-            title="📝 Edit Sniped",
-            description=f"Message edited by {author.mention} in {ctx.channel.mention}",
-            color=discord.Color.blue(),
-            timestamp=timestamp
-        )
-        
-        # Add before content
-        before_text = before_content[:1024] if before_content else "*Empty message*"
-        embed.add_field(
-            name="📤 Before",
-            value=before_text,
-            inline=False
+            title="📝 Edit Sniped" if kind == EDIT else "🗑️ Message Sniped",
+            description=f"Message {'edited' if kind == EDIT else 'deleted'} by {mention} in {ctx.channel.mention}",
+            color=discord.Color.blue() if kind == EDIT else discord.Color.dark_red(),
+            timestamp=record.timestamp
         )
         
-        # Add after content
-        after_text = after_content[:1024] if after_content else "*Empty message*"
-        embed.add_field(
-            name="📥 After",
-            value=after_text,
-            inline=False
-        )
+        if kind == EDIT:
+            # Add before content
+            before_text = record.before[:1024] if record.before else "*Empty message*"
+            embed.add_field(
+                name="📤 Before",
+                value=before_text,
+                inline=False
+            )
+            
+            # Add after content
+            after_text = record.after[:1024] if record.after else "*Empty message*"
+            embed.add_field(
+                name="📥 After",
+                value=after_text,
+                inline=False
+            )
+        else:
+            embed.add_field(
+                name="💬 Content",
+                value=record.before[:1024] if record.before else "*Empty message*",
+                inline=False
+            )
         
         # Add metadata
         embed.add_field(
             name="👤 Author",
-            value=f"{author.mention} (`{author.id}`)",
+            value=f"{mention} (`{record.author_id}`)",
             inline=True
         )
         embed.add_field(
-            name="📊 Edit Number",
-            value=f"{index}/{len(edits)}",
+            name="📊 Edit Number" if kind == EDIT else "📊 Snipe Number",
+            value=f"{index}/{len(records)}",
             inline=True
         )
         
-        # Set author and footer
-        embed.set_author(name=str(author), icon_url=author.display_avatar.url)
+        # Set author and footer (avatar only if the user is still cached)
+        author = self.bot.get_user(record.author_id)
+        embed.set_author(name=record.author_name, icon_url=author.display_avatar.url if author else None)
         embed.set_footer(text=f"Requested by {ctx.author}", icon_url=ctx.author.display_avatar.url)
         
-        await ctx.send(embed=embed)
+        await ctx.send(embed=embed, allowed_mentions=discord.AllowedMentions.none())
 
 async def setup(bot: commands.Bot):
     """Load the EditSnipe cog."""
@@ -2,25 +2,171 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+from abc import ABC, abstractmethod
 from datetime import datetime
-import re
+from pathlib import Path
 import base64
 import binascii
-from typing import Union
+import tempfile
+from typing import Optional, Union
 
-# Simple regexes
-BINARY_RE = re.compile(r"^[01\s]+$")
-HEX_RE = re.compile(r"^[0-9a-fA-F\s]+$")
-BASE64_RE = re.compile(r"^[A-Za-z0-9+/=\s]+$")
+import aiohttp
+
+# Character classes used for detection (checked on a prefix sample only)
+WHITESPACE = frozenset(" \t\r\n")
+BINARY_CHARS = frozenset("01") | WHITESPACE
+HEX_CHARS = frozenset("0123456789abcdefABCDEF") | WHITESPACE
+BASE64_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=") | WHITESPACE
+SAMPLE_CHARS = 4096
 
 # Output length guard
 MAX_OUTPUT_CHARS = 3800
 
+# Attachment streaming
+CHUNK_SIZE = 64 * 1024                   # bytes read per step
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024  # Discord's default upload limit
+# no total cap (25 MB on a slow link can take minutes); only a stalled read aborts
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+
+_WS_TABLE = bytes.maketrans(b"", b"")
+_WS_BYTES = b" \t\r\n"
+_BYTE_TO_BITS = [format(i, "08b").encode() for i in range(256)]
+
 def _truncate(s: str, limit: int = MAX_OUTPUT_CHARS) -> str:
     if len(s) > limit:
         return s[:limit] + "\n… *(truncated)*"
     return s
 
+def _detect(sample: str, complete: bool = True) -> Optional[str]:
+    """Guess which encoding `sample` is in from its character set.
+
+    Only a prefix of the input is inspected. When the sample is the complete
+    input the length must also fit the encoding (8 bits, 2 hex digits, 4
+    base64 chars); for a streamed input the codec reports leftovers at the end.
+    """
+    if len(sample) > SAMPLE_CHARS:
+        sample, complete = sample[:SAMPLE_CHARS], False
+    chars = set(sample)
+    if not chars - WHITESPACE:
+        return None
+    packed = len(sample) - sum(sample.count(c) for c in WHITESPACE) if complete else 0
+    if chars <= BINARY_CHARS and packed % 8 == 0:
+        return "binary"
+    if chars <= HEX_CHARS and packed % 2 == 0:
+        return "hex"
+    if chars <= BASE64_CHARS and (not complete or len(sample) % 4 == 0):
+        return "base64"
+    return None
+
+
+class _Codec(ABC):
+    """Incremental codec: feed() chunks of any size, then finish()."""
+
+    @abstractmethod
+    def feed(self, data: bytes) -> bytes:
+        """Consume a chunk and return whatever output is complete so far."""
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _Base64Encoder(_Codec):
+    def __init__(self):
+        self._rest = b""
+
+    def feed(self, data: bytes) -> bytes:
+        data = self._rest + data
+        cut = len(data) - len(data) % 3
+        self._rest = data[cut:]
+        return base64.b64encode(data[:cut])
+
+    def finish(self) -> bytes:
+        return base64.b64encode(self._rest)
+
+
+class _Base64Decoder(_Codec):
+    def __init__(self):
+        self._rest = b""
+
+    def feed(self, data: bytes) -> bytes:
+        data = self._rest + data.translate(_WS_TABLE, _WS_BYTES)
+        cut = len(data) - len(data) % 4
+        self._rest = data[cut:]
+        try:
+            return base64.b64decode(data[:cut], validate=True)
+        except binascii.Error:
+            raise ValueError("Invalid base64 input.")
+
+    def finish(self) -> bytes:
+        if self._rest:
+            raise ValueError("Invalid base64 input (incomplete final block).")
+        return b""
+
+
+class _HexEncoder(_Codec):
+    def feed(self, data: bytes) -> bytes:
+        return binascii.hexlify(data)
+
+
+class _HexDecoder(_Codec):
+    def __init__(self):
+        self._rest = b""
+
+    def feed(self, data: bytes) -> bytes:
+        data = self._rest + data.translate(_WS_TABLE, _WS_BYTES)
+        cut = len(data) - len(data) % 2
+        self._rest = data[cut:]
+        try:
+            return binascii.unhexlify(data[:cut])
+        except binascii.Error:
+            raise ValueError("Invalid hex input.")
+
+    def finish(self) -> bytes:
+        if self._rest:
+            raise ValueError("Invalid hex input (odd number of digits).")
+        return b""
+
+
+class _BinaryEncoder(_Codec):
+    def __init__(self):
+        self._first = True
+
+    def feed(self, data: bytes) -> bytes:
+        if not data:
+            return b""
+        out = b" ".join(_BYTE_TO_BITS[byte] for byte in data)
+        if not self._first:
+            out = b" " + out
+        self._first = False
+        return out
+
+
+class _BinaryDecoder(_Codec):
+    def __init__(self):
+        self._rest = b""
+
+    def feed(self, data: bytes) -> bytes:
+        data = self._rest + data.translate(_WS_TABLE, _WS_BYTES)
+        cut = len(data) - len(data) % 8
+        self._rest = data[cut:]
+        if not cut:
+            return b""
+        try:
+            return int(data[:cut], 2).to_bytes(cut // 8, "big")
+        except ValueError:
+            raise ValueError("Invalid binary input.")
+
+    def finish(self) -> bytes:
+        if self._rest:
+            raise ValueError("Invalid binary input (bit count is not a multiple of 8).")
+        return b""
+
+
+ENCODERS = {"base64": _Base64Encoder, "hex": _HexEncoder, "binary": _BinaryEncoder}
+DECODERS = {"base64": _Base64Decoder, "hex": _HexDecoder, "binary": _BinaryDecoder}
+TARGET_ALIASES = {"hex": "hex", "h": "hex", "base64": "base64", "b64": "base64", "binary": "binary", "bin": "binary"}
+OUTPUT_SUFFIX = {"base64": "b64", "hex": "hex", "binary": "bits"}
+
 class Encodings(commands.Cog):
     """Convert between text, binary, hex, and base64. Hybrid command."""
     def __init__(self, bot: commands.Bot):
@@ -32,22 +178,25 @@ class Encodings(commands.Cog):
         description="Encode/decode between text, binary, hex, and base64. Auto-detects when mode not provided."
     )
     @app_commands.describe(
-        text="Input text or encoded string",
+        text="Input text or encoded string (optional when a file is attached)",
         mode="Force mode: encode/decode (optional). If encoding, specify target via 'to' argument.",
-        to="Target encoding when encoding: binary|hex|base64 (optional, defaults to hex)"
+        to="Target encoding when encoding: binary|hex|base64 (optional, defaults to hex)",
+        file="File to encode/decode in chunks; the result is sent back as a file"
     )
     async def encode(
         self,
         ctx: Union[commands.Context, discord.Interaction],
-        text: str,
+        text: str = None,
         mode: str = None,
-        to: str = None
+        to: str = None,
+        file: Optional[discord.Attachment] = None
     ):
         """
         Examples:
           - /encode text:"hello" to:base64        -> encodes text to base64
           - /encode text:"aGVsbG8=" mode:decode    -> decodes base64 to text (auto-detected)
           - !encode 01001000 01100101               -> auto-detects binary -> decodes to text
+          - /encode file:<data.txt> to:base64       -> streams the file, returns data.txt.b64.txt
         """
         is_interaction = isinstance(ctx, discord.Interaction)
         requester = getattr(ctx.user if is_interaction else ctx.author, "display_name", "Unknown")
@@ -55,39 +204,47 @@ class Encodings(commands.Cog):
         to = (to or "").lower().strip()
 
         # Normalize input
-        s = text.strip()
+        s = (text or "").strip()
 
         # Helper send
-        async def send(embed: discord.Embed, ephemeral_error=False):
+        async def send(embed: discord.Embed, ephemeral_error=False, file: discord.File = None):
+            kwargs = {"embed": embed}
+            if file is not None:
+                kwargs["file"] = file
             if is_interaction:
-                if ephemeral_error:
+                if ephemeral_error and not ctx.response.is_done():
                     await ctx.response.send_message(embed=embed, ephemeral=True)
+                elif ephemeral_error:
+                    # the response was deferred publicly, so the follow-up can't be ephemeral
+                    await ctx.followup.send(embed=embed)
                 else:
                     if not ctx.response.is_done():
-                        await ctx.response.send_message(embed=embed)
+                        await ctx.response.send_message(**kwargs)
                     else:
-                        await ctx.followup.send(embed=embed)
+                        await ctx.followup.send(**kwargs)
             else:
-                await ctx.send(embed=embed)
+                await ctx.send(**kwargs)
+
+        if file is not None:
+            return await self._convert_attachment(ctx, file, mode, to, requester, send)
+
+        if not s:
+            err = discord.Embed(title="❌ Conversion error", description="Provide some text or attach a file.", color=discord.Color.red(), timestamp=discord.utils.utcnow())
+            err.set_footer(text=f"Requested by {requester}")
+            return await send(err, ephemeral_error=True)
+
+        # Detect from a prefix sample instead of matching the whole input
+        detected = _detect(s)
 
         # Auto-detect mode if not provided
         if not mode:
             # If input looks like encoded (binary/hex/base64) prefer decode
-            if BINARY_RE.fullmatch(s) and len(s.replace(" ", "")) % 8 == 0:
-                mode = "decode"
-            elif HEX_RE.fullmatch(s) and len(s.replace(" ", "")) % 2 == 0:
-                # even-length hex -> likely decode
-                mode = "decode"
-            elif BASE64_RE.fullmatch(s) and len(s) % 4 == 0:
-                # plausible base64
-                mode = "decode"
-            else:
-                mode = "encode"
+            mode = "decode" if detected else "encode"
 
         try:
             if mode.startswith("dec"):
                 # Attempt decode: try binary -> hex -> base64 order by detection
-                if BINARY_RE.fullmatch(s) and len(s.replace(" ", "")) % 8 == 0:
+                if detected == "binary":
                     # binary -> text
                     bits = s.split()
                     try:
@@ -100,8 +257,8 @@ class Encodings(commands.Cog):
                     return await send(embed)
 
                 # Hex decode?
-                if HEX_RE.fullmatch(s) and len(s.replace(" ", "")) % 2 == 0:
-                    raw = s.replace(" ", "")
+                if detected == "hex":
+                    raw = "".join(s.split())
                     try:
                         b = binascii.unhexlify(raw)
                         decoded = b.decode("utf-8", errors="replace")
@@ -114,9 +271,9 @@ class Encodings(commands.Cog):
                     return await send(embed)
 
                 # Base64 decode?
-                if BASE64_RE.fullmatch(s):
+                if detected == "base64" or set(s[:SAMPLE_CHARS]) <= BASE64_CHARS:
                     try:
-                        raw_b = base64.b64decode(s, validate=True)
+                        raw_b = base64.b64decode("".join(s.split()), validate=True)
                         decoded = raw_b.decode("utf-8", errors="replace")
                         hexed = binascii.hexlify(raw_b).decode()
                     except Exception:
@@ -134,21 +291,22 @@ class Encodings(commands.Cog):
                     to = "hex"  # default target
 
                 # Text -> target
-                if to in ("hex", "h"):
+                to = TARGET_ALIASES.get(to, to)
+                if to == "hex":
                     b = s.encode("utf-8")
                     hexed = binascii.hexlify(b).decode()
                     embed = discord.Embed(title="📝 Text → Hex", description=_truncate(f"**Input:** {s}\n**Hex:** `{hexed}`"), color=discord.Color.teal(), timestamp=discord.utils.utcnow())
                     embed.set_footer(text=f"Requested by {requester}")
                     return await send(embed)
 
-                if to in ("base64", "b64"):
+                if to == "base64":
                     b = s.encode("utf-8")
                     b64 = base64.b64encode(b).decode()
                     embed = discord.Embed(title="📝 Text → Base64", description=_truncate(f"**Input:** {s}\n**Base64:** `{b64}`"), color=discord.Color.green(), timestamp=discord.utils.utcnow())
                     embed.set_footer(text=f"Requested by {requester}")
                     return await send(embed)
 
-                if to in ("binary", "bin"):
+                if to == "binary":
                     b = s.encode("utf-8")
                     bits = " ".join(format(byte, "08b") for byte in b)
                     embed = discord.Embed(title="📝 Text → Binary", description=_truncate(f"**Input:** {s}\n**Binary:** `{bits}`"), color=discord.Color.blurple(), timestamp=discord.utils.utcnow())
@@ -171,5 +329,85 @@ class Encodings(commands.Cog):
             # Log internally if you have logging (not added here)
             return await send(err, ephemeral_error=True)
 
+    async def _convert_attachment(self, ctx, attachment: discord.Attachment, mode: str, to: str, requester: str, send):
+        """Stream an attachment through an incremental codec into a file; memory stays O(chunk)."""
+        limit = min(MAX_ATTACHMENT_BYTES, getattr(ctx.guild, "filesize_limit", MAX_ATTACHMENT_BYTES))
+
+        def fail(message: str) -> discord.Embed:
+            err = discord.Embed(title="❌ Conversion error", description=message, color=discord.Color.red(), timestamp=discord.utils.utcnow())
+            err.set_footer(text=f"Requested by {requester}")
+            return err
+
+        if attachment.size > limit:
+            return await send(fail(f"Attachment is too large (max {limit // (1024 * 1024)} MB)."), ephemeral_error=True)
+
+        # downloading and transcoding can outlast the 3s interaction window
+        if isinstance(ctx, discord.Interaction):
+            await ctx.response.defer()
+        else:
+            await ctx.defer()
+
+        # a real temporary file: discord.File needs an io.IOBase, which
+        # SpooledTemporaryFile is not before Python 3.11
+        out = tempfile.TemporaryFile()
+        written = 0
+        codec: Optional[_Codec] = None
+        try:
+            async with self.bot.http_client.session.get(attachment.url, timeout=DOWNLOAD_TIMEOUT) as resp:
+                if resp.status != 200:
+                    raise ValueError(f"Could not download the attachment (HTTP {resp.status}).")
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    if codec is None:
+                        # first chunk decides the codec, from a prefix sample only
+                        detected = _detect(chunk[:SAMPLE_CHARS].decode("ascii", errors="replace"), complete=False)
+                        if not mode:
+                            mode = "decode" if detected else "encode"
+                        if mode.startswith("dec"):
+                            if not detected:
+                                raise ValueError("Could not detect binary/hex/base64 in the attachment.")
+                            source, target = detected, "bytes"
+                            codec = DECODERS[detected]()
+                        elif mode.startswith("enc"):
+                            target = TARGET_ALIASES.get(to or "hex")
+                            if target is None:
+                                raise ValueError("Unknown target encoding for encode. Use `to` = binary | hex | base64.")
+                            source = "bytes"
+                            codec = ENCODERS[target]()
+                        else:
+                            raise ValueError("Unknown mode. Use `mode=encode` or `mode=decode` (or omit to auto-detect).")
+                    piece = codec.feed(chunk)
+                    written += len(piece)
+                    if written > limit:
+                        raise ValueError(f"Result would exceed the {limit // (1024 * 1024)} MB upload limit.")
+                    out.write(piece)
+            if codec is None:
+                raise ValueError("The attachment is empty.")
+            piece = codec.finish()
+            written += len(piece)
+            if written > limit:
+                raise ValueError(f"Result would exceed the {limit // (1024 * 1024)} MB upload limit.")
+            out.write(piece)
+        except ValueError as ve:
+            out.close()
+            return await send(fail(str(ve)), ephemeral_error=True)
+        except Exception:
+            out.close()
+            return await send(fail("An unexpected error occurred while converting the attachment."), ephemeral_error=True)
+
+        out.seek(0)
+        stem = Path(attachment.filename).name
+        filename = f"{stem}.decoded.bin" if target == "bytes" else f"{stem}.{OUTPUT_SUFFIX[target]}.txt"
+        embed = discord.Embed(
+            title=f"📎 {source.title()} → {target.title()}",
+            description=f"**Input:** `{attachment.filename}` ({attachment.size:,} bytes)\n**Output:** `{filename}` ({written:,} bytes)",
+            color=discord.Color.teal(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.set_footer(text=f"Requested by {requester}")
+        try:
+            await send(embed, file=discord.File(out, filename=filename))
+        finally:
+            out.close()
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Encodings(bot))
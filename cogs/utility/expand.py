@@ -45,20 +45,10 @@ class Expand(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._session: Optional[aiohttp.ClientSession] = None
         # configuration
         self._timeout = aiohttp.ClientTimeout(total=12)  # seconds
         self._max_redirects = 10
 
-    async def cog_load(self) -> None:
-        # create session when cog loads
-        self._session = aiohttp.ClientSession(timeout=self._timeout)
-
-    async def cog_unload(self) -> None:
-        # close session cleanly
-        if self._session and not self._session.closed:
-            await self._session.close()
-
     @commands.hybrid_command(name="expand", description="Expand a shortened URL and show redirect chain. Example: /expand url:https://bit.ly/...")
     @app_commands.describe(url="The shortened URL to expand (with or without scheme).", follow="If true, fetch full content when HEAD isn't supported.")
     async def expand(self, ctx: Union[commands.Context, discord.Interaction], url: str, follow: bool = True):
@@ -104,9 +94,8 @@ class Expand(commands.Cog):
             # resolution failed; continue but do not block user unnecessarily
             pass
 
-        # ensure we have a session
-        if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+        # shared bot-wide session
+        session = self.bot.http_client.session
 
         try:
             redirect_chain = []
@@ -118,7 +107,7 @@ class Expand(commands.Cog):
             # First try HEAD (less data). If server returns 405/501 or doesn't support HEAD well, optionally fall back to GET.
             while remaining > 0:
                 remaining -= 1
-                async with self._session.request("HEAD", current_url, allow_redirects=False) as resp:
+                async with session.request("HEAD", current_url, allow_redirects=False, timeout=self._timeout) as resp:
                     status = resp.status
                     headers = resp.headers
                     location = headers.get("Location")
@@ -139,7 +128,7 @@ class Expand(commands.Cog):
             # Some services only perform redirects on GET; check for common redirect-statuss or if content info missing and follow allowed
             if follow and (status in (405, 501) or (not content_type and status < 400)):
                 try:
-                    async with self._session.get(final_url, allow_redirects=True, max_redirects=self._max_redirects) as gres:
+                    async with session.get(final_url, allow_redirects=True, max_redirects=self._max_redirects, timeout=self._timeout) as gres:
                         # get final url and history
                         content_type = gres.headers.get("Content-Type")
                         content_length = gres.headers.get("Content-Length")
@@ -206,3 +195,6 @@ class Expand(commands.Cog):
             else:
                 await ctx.send(embed=err)
 
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Expand(bot))
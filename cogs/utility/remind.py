@@ -1,125 +1,89 @@
 # cogs/util/remind.py
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 import asyncio
+import hashlib
 import re
 from datetime import datetime, timedelta, timezone
-import os
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+
+from core.scheduler import Job
 
 DATA_DIR = Path("data")
-REMINDERS_FILE = DATA_DIR / "reminders.json"
+# pre-scheduler storage, migrated into the shared job store on first load
+LEGACY_REMINDERS_FILE = DATA_DIR / "reminders.json"
+
+JOB_TYPE = "reminder"
+MAX_LATE = 31_536_000  # drop reminders that are more than a year overdue
 
 
 class Remind(commands.Cog):
-    """Set reminders that persist to data/reminders.json."""
+    """Set reminders that persist through the bot's shared job scheduler."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.reminders: List[Dict[str, Any]] = []  # each: {user_id, channel_id, message, remind_at}
-        self._lock = asyncio.Lock()
-        # ensure data dir exists and load reminders asynchronously
-        self._boot_task = asyncio.create_task(self._boot_and_start())
-
-    def cog_unload(self):
-        """Stop background loop and save reminders on unload."""
-        self.check_reminders.cancel()
-        # attempt to save synchronously via event loop task
-        try:
-            asyncio.create_task(self._save_reminders())
-        except Exception:
-            pass
+        self.scheduler = bot.scheduler
 
-    # --- boot sequence ---
-    async def _boot_and_start(self):
-        await self.bot.wait_until_ready()
-        await self._ensure_datafile()
-        await self._load_reminders()
-        # start background loop
-        if not self.check_reminders.is_running():
-            self.check_reminders.start()
+    async def cog_load(self):
+        await self._migrate_legacy()
+        self.scheduler.register(JOB_TYPE, self._deliver, max_late=MAX_LATE)
 
-    async def _ensure_datafile(self):
-        """Ensure data directory and file exists."""
-        try:
-            DATA_DIR.mkdir(parents=True, exist_ok=True)
-            if not REMINDERS_FILE.exists():
-                # create empty list file
-                REMINDERS_FILE.write_text("[]", encoding="utf-8")
-        except Exception:
-            # If file creation fails, just continue; load will handle errors
-            pass
+    def cog_unload(self):
+        """Stop receiving reminder jobs; pending ones stay in the scheduler."""
+        self.scheduler.unregister(JOB_TYPE)
 
-    async def _load_reminders(self):
-        """Load reminders from JSON file (run in executor)."""
+    async def _migrate_legacy(self):
+        """Move reminders from the old data/reminders.json into the scheduler once."""
         loop = asyncio.get_running_loop()
-        try:
-            def read_file():
-                try:
-                    with REMINDERS_FILE.open("r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        # validate structure: list of dicts
-                        if not isinstance(data, list):
-                            return []
-                        return data
-                except Exception:
-                    return []
 
-            data = await loop.run_in_executor(None, read_file)
-            # normalize to expected keys and types
-            valid: List[Dict[str, Any]] = []
-            now_ts = int(datetime.now(timezone.utc).timestamp())
-            for item in data:
-                try:
-                    uid = int(item.get("user_id"))
-                    cid = item.get("channel_id")
-                    cid = int(cid) if cid is not None else None
-                    msg = str(item.get("message", ""))
-                    remind_at = int(item.get("remind_at", 0))
-                    # ignore reminders in the past by a huge margin (>1 year) or malformed
-                    if remind_at <= 0:
-                        continue
-                    # keep reminders that are reasonable
-                    if remind_at < now_ts - 31536000:  # older than a year ago -> skip
-                        continue
-                    valid.append({"user_id": uid, "channel_id": cid, "message": msg, "remind_at": remind_at})
-                except Exception:
-                    continue
-            async with self._lock:
-                self.reminders = valid
-        except Exception:
-            # fallback: empty list
-            async with self._lock:
-                self.reminders = []
-
-    async def _save_reminders(self):
-        """Save reminders to JSON file (run in executor). Uses atomic write."""
-        loop = asyncio.get_running_loop()
+        def read_legacy():
+            if not LEGACY_REMINDERS_FILE.exists():
+                return None
+            try:
+                with LEGACY_REMINDERS_FILE.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+                return data if isinstance(data, list) else []
+            except Exception:
+                return None
 
-        async with self._lock:
-            data = list(self.reminders)  # shallow copy
+        def retire():
+            try:
+                LEGACY_REMINDERS_FILE.replace(LEGACY_REMINDERS_FILE.with_suffix(".json.migrated"))
+            except Exception:
+                pass  # retried next start; already-imported reminders are skipped
 
-        def write_file(payload):
-            tmp = REMINDERS_FILE.with_suffix(".tmp")
+        data = await loop.run_in_executor(None, read_legacy)
+        if data is None:
+            return
+        for item in data:
             try:
-                with tmp.open("w", encoding="utf-8") as f:
-                    json.dump(payload, f, ensure_ascii=False, indent=2)
-                # atomic replace
-                tmp.replace(REMINDERS_FILE)
-                return True
+                cid = item.get("channel_id")
+                remind_at = int(item.get("remind_at", 0))
+                if remind_at <= 0:
+                    continue
+                user_id = int(item.get("user_id"))
+                message = str(item.get("message", ""))
+                # id derived from the reminder itself, so re-running an interrupted migration is a no-op
+                key = f"{user_id}:{cid}:{remind_at}:{message}".encode()
+                job_id = "legacy-" + hashlib.blake2b(key, digest_size=8).hexdigest()
+                if self.scheduler.get(job_id) is not None:
+                    continue
+                self.scheduler.schedule(
+                    JOB_TYPE,
+                    remind_at,
+                    user_id=user_id,
+                    channel_id=int(cid) if cid is not None else None,
+                    job_id=job_id,
+                    message=message,
+                )
             except Exception:
-                # cleanup tmp if exists
-                try:
-                    if tmp.exists():
-                        tmp.unlink()
-                except Exception:
-                    pass
-                return False
+                continue
 
-        await loop.run_in_executor(None, write_file, data)
+        # only retire the old file once the imported reminders are safely on disk
+        if await self.scheduler.persist():
+            await loop.run_in_executor(None, retire)
 
     # --- COMMAND ---
     @commands.hybrid_command(
@@ -142,18 +106,14 @@ class Remind(commands.Cog):
             remind_at_dt = datetime.now(timezone.utc) + timedelta(seconds=seconds)
             remind_at_ts = int(remind_at_dt.timestamp())
 
-            entry = {
-                "user_id": user.id,
-                "channel_id": ctx.channel.id if not is_interaction else (ctx.channel.id if ctx.channel else None),
-                "message": reminder,
-                "remind_at": remind_at_ts,
-            }
-
-            # add and persist
-            async with self._lock:
-                self.reminders.append(entry)
-            # save in background
-            asyncio.create_task(self._save_reminders())
+            # scheduled and persisted by the shared scheduler
+            self.scheduler.schedule(
+                JOB_TYPE,
+                remind_at_ts,
+                user_id=user.id,
+                channel_id=ctx.channel.id if not is_interaction else (ctx.channel.id if ctx.channel else None),
+                message=reminder,
+            )
 
             embed = discord.Embed(
                 title="⏰ Reminder Set",
@@ -189,67 +149,46 @@ class Remind(commands.Cog):
             else:
                 await ctx.send(embed=err)
 
-    # --- BACKGROUND TASK ---
-    @tasks.loop(seconds=30)
-    async def check_reminders(self):
-        """Check pending reminders every 30 seconds and deliver them."""
-        now_ts = int(datetime.now(timezone.utc).timestamp())
-        to_send: List[Dict[str, Any]] = []
-
-        async with self._lock:
-            # collect due reminders
-            for r in list(self.reminders):
-                if r.get("remind_at", 0) <= now_ts:
-                    to_send.append(r)
-
-            # remove them from the main list
-            if to_send:
-                self.reminders = [r for r in self.reminders if r not in to_send]
-                # persist removal
-                asyncio.create_task(self._save_reminders())
-
-        for r in to_send:
-            try:
-                user = self.bot.get_user(r["user_id"]) or await self.bot.fetch_user(r["user_id"])
-                if not user:
-                    continue
-
-                channel_obj = None
-                if r.get("channel_id") is not None:
-                    channel_obj = self.bot.get_channel(r["channel_id"])
+    # --- DELIVERY ---
+    async def _deliver(self, job: Job):
+        """Send a single due reminder to its channel, falling back to DM."""
+        try:
+            user = self.bot.get_user(job["user_id"]) or await self.bot.fetch_user(job["user_id"])
+            if not user:
+                return
 
-                embed = discord.Embed(
-                    title="🔔 Reminder!",
-                    description=r.get("message", ""),
-                    color=discord.Color.gold(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.set_footer(text="Reminder")
+            channel_obj = None
+            if job.get("channel_id") is not None:
+                channel_obj = self.bot.get_channel(job["channel_id"])
 
-                sent = False
-                if channel_obj and isinstance(channel_obj, discord.TextChannel):
-                    try:
-                        await channel_obj.send(f"{user.mention}", embed=embed)
-                        sent = True
-                    except discord.Forbidden:
-                        sent = False
-                    except Exception:
-                        sent = False
+            embed = discord.Embed(
+                title="🔔 Reminder!",
+                description=job["data"].get("message", ""),
+                color=discord.Color.gold(),
+                timestamp=discord.utils.utcnow()
+            )
+            embed.set_footer(text="Reminder")
 
-                if not sent:
-                    try:
-                        await user.send(embed=embed)
-                        sent = True
-                    except Exception:
-                        sent = False
+            sent = False
+            if channel_obj and isinstance(channel_obj, discord.TextChannel):
+                try:
+                    await channel_obj.send(f"{user.mention}", embed=embed)
+                    sent = True
+                except discord.Forbidden:
+                    sent = False
+                except Exception:
+                    sent = False
 
-            except Exception:
-                # per-reminder error shouldn't stop others
-                continue
+            if not sent:
+                try:
+                    await user.send(embed=embed)
+                    sent = True
+                except Exception:
+                    sent = False
 
-    @check_reminders.before_loop
-    async def before_check_reminders(self):
-        await self.bot.wait_until_ready()
+        except Exception:
+            # per-reminder error shouldn't stop others
+            return
 
     # --- HELPERS ---
     def _parse_time(self, time_str: str) -> int:
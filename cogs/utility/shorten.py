@@ -30,16 +30,8 @@ class Shorten(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._session: Optional[aiohttp.ClientSession] = None
         self._timeout = DEFAULT_TIMEOUT
 
-    async def cog_load(self) -> None:
-        self._session = aiohttp.ClientSession(timeout=self._timeout)
-
-    async def cog_unload(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
-
     @commands.hybrid_command(name="shorten", aliases=["short"], description="Shorten a URL (uses cleanuri.com by default)")
     @app_commands.describe(url="The URL to shorten (you can omit https://)")
     async def shorten(self, ctx: Union[commands.Context, discord.Interaction], url: str):
@@ -61,11 +53,8 @@ class Shorten(commands.Cog):
                 await ctx.send(embed=err)
             return
 
-        if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
-
         try:
-            async with self._session.post(CLEANURI_API, data={"url": normalized}) as resp:
+            async with self.bot.http_client.session.post(CLEANURI_API, data={"url": normalized}, timeout=self._timeout) as resp:
                 # safe parsing and error handling
                 text = await resp.text()
                 if resp.status != 200:
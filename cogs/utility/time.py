@@ -4,6 +4,10 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime, timezone as dt_timezone
 from typing import Optional, List
+import functools
+
+from core.autocomplete import AutocompleteIndex
+from core.lazy import register_warmup
 
 # Prefer zoneinfo if available, fall back to pytz
 try:
@@ -43,16 +47,20 @@ def _all_timezones_list() -> List[str]:
     # fallback small list
     return ["UTC", "America/New_York", "Europe/London", "Europe/Paris", "Asia/Kolkata", "Asia/Tokyo"]
 
+@register_warmup
+@functools.lru_cache(maxsize=None)
+def _tz_index() -> AutocompleteIndex:
+    """Enumerate the timezone database once (after startup); short aliases (PST, EST...) are extra keys."""
+    aliases_for = {}
+    for alias, tz in ALIASES.items():
+        aliases_for.setdefault(tz, []).append(alias)
+    return AutocompleteIndex(
+        (tz, aliases_for.get(tz, []), app_commands.Choice(name=tz, value=tz)) for tz in _all_timezones_list()
+    )
+
 async def _tz_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    """Autocomplete provider for slash command - filters timezones by substring."""
-    cur = (current or "").lower()
-    choices = []
-    for tz in _all_timezones_list():
-        if not cur or cur in tz.lower():
-            choices.append(app_commands.Choice(name=tz, value=tz))
-            if len(choices) >= 25:
-                break
-    return choices
+    """Autocomplete provider for slash command - prefix matches first, then substrings."""
+    return _tz_index().search(current)
 
 class TimeCog(commands.Cog):
     """Time utilities: show current time in a timezone (hybrid command)."""
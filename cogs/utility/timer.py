@@ -1,106 +1,87 @@
 # cogs/util/timer.py
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 import asyncio
 import re
-import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import json
-from typing import Any, Dict, List, Optional
+from typing import Optional
+
+from core.scheduler import Job
 
 DATA_DIR = Path("data")
-TIMERS_FILE = DATA_DIR / "timers.json"
+# pre-scheduler storage, migrated into the shared job store on first load
+LEGACY_TIMERS_FILE = DATA_DIR / "timers.json"
+
+JOB_TYPE = "timer"
+MAX_LATE = 86400  # drop timers that ended more than a day ago to avoid spam on restart
 
 
 class Timer(commands.Cog):
-    """Persistent countdown timers saved to data/timers.json."""
+    """Persistent countdown timers backed by the bot's shared job scheduler."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._lock = asyncio.Lock()
-        self.timers: List[Dict[str, Any]] = []  # entries: {id, user_id, channel_id, label, end_ts}
-        self._boot_task = asyncio.create_task(self._boot_and_start())
+        self.scheduler = bot.scheduler
+
+    async def cog_load(self):
+        await self._migrate_legacy()
+        self.scheduler.register(JOB_TYPE, self._fire, max_late=MAX_LATE)
 
     def cog_unload(self):
-        self.check_timers.cancel()
-        try:
-            asyncio.create_task(self._save_timers())
-        except Exception:
-            pass
-
-    # ---------- Boot / persistence ----------
-    async def _boot_and_start(self):
-        await self.bot.wait_until_ready()
-        await self._ensure_datafile()
-        await self._load_timers()
-        if not self.check_timers.is_running():
-            self.check_timers.start()
-
-    async def _ensure_datafile(self):
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        if not TIMERS_FILE.exists():
-            TIMERS_FILE.write_text("[]", encoding="utf-8")
-
-    async def _load_timers(self):
+        self.scheduler.unregister(JOB_TYPE)
+
+    # ---------- Migration ----------
+    async def _migrate_legacy(self):
+        """Move timers from the old data/timers.json into the scheduler once."""
         loop = asyncio.get_running_loop()
 
-        def read_file():
+        def read_legacy():
+            if not LEGACY_TIMERS_FILE.exists():
+                return None
             try:
-                with TIMERS_FILE.open("r", encoding="utf-8") as f:
+                with LEGACY_TIMERS_FILE.open("r", encoding="utf-8") as f:
                     data = json.load(f)
-                if not isinstance(data, list):
-                    return []
-                return data
+                return data if isinstance(data, list) else []
             except Exception:
-                return []
+                return None
 
-        data = await loop.run_in_executor(None, read_file)
+        def retire():
+            try:
+                LEGACY_TIMERS_FILE.replace(LEGACY_TIMERS_FILE.with_suffix(".json.migrated"))
+            except Exception:
+                pass  # retried next start; already-imported timers are skipped
 
-        valid: List[Dict[str, Any]] = []
-        now_ts = int(datetime.now(timezone.utc).timestamp())
+        data = await loop.run_in_executor(None, read_legacy)
+        if data is None:
+            return
         for item in data:
             try:
-                tid = str(item.get("id", ""))
-                uid = int(item.get("user_id"))
                 cid = item.get("channel_id")
-                cid = int(cid) if cid is not None else None
-                label = str(item.get("label", ""))[:200]
                 end_ts = int(item.get("end_ts", 0))
-                # ignore timers that ended long ago (> 1 day) to avoid spam on restart
-                if end_ts <= now_ts - 86400:
-                    continue
                 if end_ts <= 0:
                     continue
-                valid.append({"id": tid, "user_id": uid, "channel_id": cid, "label": label, "end_ts": end_ts})
+                # keep the old id users may know; if it is already scheduled, an
+                # earlier migration got this far before the file was retired
+                legacy_id = str(item.get("id", "")) or None
+                if legacy_id is not None and self.scheduler.get(legacy_id) is not None:
+                    continue
+                self.scheduler.schedule(
+                    JOB_TYPE,
+                    end_ts,
+                    user_id=int(item.get("user_id")),
+                    channel_id=int(cid) if cid is not None else None,
+                    job_id=legacy_id,
+                    label=str(item.get("label", ""))[:200],
+                )
             except Exception:
                 continue
 
-        async with self._lock:
-            self.timers = valid
-
-    async def _save_timers(self):
-        loop = asyncio.get_running_loop()
-        async with self._lock:
-            payload = list(self.timers)
-
-        def write_file(payload):
-            tmp = TIMERS_FILE.with_suffix(".tmp")
-            try:
-                with tmp.open("w", encoding="utf-8") as f:
-                    json.dump(payload, f, ensure_ascii=False, indent=2)
-                tmp.replace(TIMERS_FILE)
-                return True
-            except Exception:
-                try:
-                    if tmp.exists():
-                        tmp.unlink()
-                except Exception:
-                    pass
-                return False
-
-        await loop.run_in_executor(None, write_file, payload)
+        # only retire the old file once the imported timers are safely on disk
+        if await self.scheduler.persist():
+            await loop.run_in_executor(None, retire)
 
     # ---------- Commands ----------
     @commands.hybrid_command(
@@ -110,7 +91,7 @@ class Timer(commands.Cog):
     @app_commands.describe(duration="Duration like 10s, 5m, 1h, 1h30m", label="Optional label shown when the timer finishes")
     async def timer(self, ctx: commands.Context, duration: str, *, label: Optional[str] = ""):
         """
-        Start a persistent timer. Stores timer in data/timers.json so it survives restarts.
+        Start a persistent timer. Stored by the shared scheduler so it survives restarts.
         """
         is_interaction = isinstance(ctx, discord.Interaction)
         user = ctx.user if is_interaction else ctx.author
@@ -122,15 +103,16 @@ class Timer(commands.Cog):
                 raise ValueError("Duration cannot exceed 24 hours.")
 
             end_ts = int((datetime.now(timezone.utc) + timedelta(seconds=seconds)).timestamp())
-            # generate id (timestamp + random suffix)
-            tid = f"{end_ts}-{user.id}-{int(time.time() * 1000) % 1000}"
 
-            entry = {"id": tid, "user_id": user.id, "channel_id": ctx.channel.id if not is_interaction else (ctx.channel.id if ctx.channel else None), "label": label or "", "end_ts": end_ts}
-
-            async with self._lock:
-                self.timers.append(entry)
-            # persist in background
-            asyncio.create_task(self._save_timers())
+            # scheduled and persisted by the shared scheduler, which assigns a unique random id
+            job = self.scheduler.schedule(
+                JOB_TYPE,
+                end_ts,
+                user_id=user.id,
+                channel_id=ctx.channel.id if not is_interaction else (ctx.channel.id if ctx.channel else None),
+                label=label or "",
+            )
+            tid = job["id"]
 
             embed = discord.Embed(
                 title="⏱️ Timer Started",
@@ -167,8 +149,7 @@ class Timer(commands.Cog):
         is_interaction = isinstance(ctx, discord.Interaction)
         user = ctx.user if is_interaction else ctx.author
         now_ts = int(datetime.now(timezone.utc).timestamp())
-        async with self._lock:
-            user_timers = [t for t in self.timers if t["user_id"] == user.id]
+        user_timers = self.scheduler.jobs_for(JOB_TYPE, user.id)
         if not user_timers:
             m = discord.Embed(title="No active timers", description="You have no timers set.", color=discord.Color.green(), timestamp=discord.utils.utcnow())
             if is_interaction:
@@ -178,10 +159,10 @@ class Timer(commands.Cog):
             return
 
         lines = []
-        for t in sorted(user_timers, key=lambda x: x["end_ts"]):
-            seconds = max(0, t["end_ts"] - now_ts)
-            label = t.get("label", "") or "(no label)"
-            lines.append(f"`{t['id'][:12]}` — {label} — ends <t:{t['end_ts']}:R>")
+        for t in user_timers:
+            seconds = max(0, t["run_at"] - now_ts)
+            label = t["data"].get("label", "") or "(no label)"
+            lines.append(f"`{t['id']}` — {label} — ends <t:{t['run_at']}:R>")
 
         embed = discord.Embed(title="Your timers", description="\n".join(lines), color=discord.Color.teal(), timestamp=discord.utils.utcnow())
         embed.set_footer(text=f"{len(lines)} active timer(s)")
@@ -194,17 +175,18 @@ class Timer(commands.Cog):
     async def cancel_timer(self, ctx: commands.Context, id_prefix: str):
         is_interaction = isinstance(ctx, discord.Interaction)
         user = ctx.user if is_interaction else ctx.author
-        removed = False
-        async with self._lock:
-            for t in list(self.timers):
-                if t["user_id"] == user.id and t["id"].startswith(id_prefix):
-                    self.timers.remove(t)
-                    removed = True
-            if removed:
-                asyncio.create_task(self._save_timers())
+        matches = [t["id"] for t in self.scheduler.jobs_for(JOB_TYPE, user.id) if t["id"].startswith(id_prefix)]
+        if len(matches) > 1:
+            msg = discord.Embed(title="❓ Ambiguous ID", description=f"`{id_prefix}` matches {len(matches)} timers. Use more of the ID shown by `timers`.", color=discord.Color.orange(), timestamp=discord.utils.utcnow())
+            if is_interaction:
+                await ctx.response.send_message(embed=msg, ephemeral=True)
+            else:
+                await ctx.send(embed=msg)
+            return
+        removed = bool(matches) and self.scheduler.cancel(matches[0])
 
         if removed:
-            msg = discord.Embed(title="✅ Timer cancelled", description=f"Cancelled timers starting with `{id_prefix}`", color=discord.Color.green(), timestamp=discord.utils.utcnow())
+            msg = discord.Embed(title="✅ Timer cancelled", description=f"Cancelled timer `{matches[0]}`", color=discord.Color.green(), timestamp=discord.utils.utcnow())
             if is_interaction:
                 await ctx.response.send_message(embed=msg, ephemeral=True)
             else:
@@ -216,52 +198,36 @@ class Timer(commands.Cog):
             else:
                 await ctx.send(embed=msg)
 
-    # ---------- Background checker ----------
-    @tasks.loop(seconds=10)
-    async def check_timers(self):
-        now_ts = int(datetime.now(timezone.utc).timestamp())
-        to_fire: List[Dict[str, Any]] = []
-        async with self._lock:
-            for t in list(self.timers):
-                if t.get("end_ts", 0) <= now_ts:
-                    to_fire.append(t)
-            if to_fire:
-                # remove fired
-                self.timers = [t for t in self.timers if t not in to_fire]
-                asyncio.create_task(self._save_timers())
-
-        for t in to_fire:
-            try:
-                user = self.bot.get_user(t["user_id"]) or await self.bot.fetch_user(t["user_id"])
-                if not user:
-                    continue
+    # ---------- Delivery ----------
+    async def _fire(self, t: Job):
+        """Announce a finished timer in its channel, falling back to DM."""
+        try:
+            user = self.bot.get_user(t["user_id"]) or await self.bot.fetch_user(t["user_id"])
+            if not user:
+                return
 
-                channel = None
-                if t.get("channel_id") is not None:
-                    channel = self.bot.get_channel(t["channel_id"])
-
-                label = t.get("label", "") or "Timer finished"
-                embed = discord.Embed(title="⏰ Timer Complete!", description=label, color=discord.Color.green(), timestamp=discord.utils.utcnow())
-                embed.add_field(name="Timer ID", value=t["id"], inline=False)
-
-                sent = False
-                if channel and isinstance(channel, discord.TextChannel):
-                    try:
-                        await channel.send(f"{user.mention}", embed=embed)
-                        sent = True
-                    except Exception:
-                        sent = False
-                if not sent:
-                    try:
-                        await user.send(embed=embed)
-                    except Exception:
-                        pass
-            except Exception:
-                continue
+            channel = None
+            if t.get("channel_id") is not None:
+                channel = self.bot.get_channel(t["channel_id"])
+
+            label = t["data"].get("label", "") or "Timer finished"
+            embed = discord.Embed(title="⏰ Timer Complete!", description=label, color=discord.Color.green(), timestamp=discord.utils.utcnow())
+            embed.add_field(name="Timer ID", value=t["id"], inline=False)
 
-    @check_timers.before_loop
-    async def before_check_timers(self):
-        await self.bot.wait_until_ready()
+            sent = False
+            if channel and isinstance(channel, discord.TextChannel):
+                try:
+                    await channel.send(f"{user.mention}", embed=embed)
+                    sent = True
+                except Exception:
+                    sent = False
+            if not sent:
+                try:
+                    await user.send(embed=embed)
+                except Exception:
+                    pass
+        except Exception:
+            return
 
     # ---------- Helpers ----------
     def _parse_duration(self, duration: str) -> int:
@@ -3,38 +3,119 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
-from typing import Union, List
+from typing import Dict, Union, List, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
+import hashlib
+import threading
 
-# googletrans (community) -- blocking API, we'll run it in executor
-from googletrans import Translator, LANGUAGES
+from core.autocomplete import AutocompleteIndex
+from core.lazy import lazy_import, register_warmup
 
-# Build lookup: both code -> name and name -> code (lowercased)
-CODE_TO_NAME = {k.lower(): v.title() for k, v in LANGUAGES.items()}
-NAME_TO_CODE = {v.lower(): k for k, v in LANGUAGES.items()}
+# googletrans (community) -- blocking API, run on the cog's own worker pool.
+# It pulls in a whole HTTP stack, so it is imported after startup, not at load.
+googletrans = lazy_import("googletrans")
 
-# Prepare list for autocomplete (limit 25 handled by autocomplete function)
-LANG_CHOICES = sorted([(code, name) for code, name in CODE_TO_NAME.items()], key=lambda t: t[1].lower())
+# Translation runs on its own small pool so bursts can't starve the default executor
+MAX_WORKERS = 2
+MAX_PENDING = 16        # queued + running translations before new ones are refused
+CACHE_SIZE = 1024       # translations kept, keyed by (text hash, dest)
+
+
+class TranslatorBusy(Exception):
+    """Raised when the translation queue is full."""
+
+
+class Segment(NamedTuple):
+    text: str
+    src: str
+    pronunciation: Optional[str]
+
+
+class Languages(NamedTuple):
+    code_to_name: Dict[str, str]
+    name_to_code: Dict[str, str]
+    index: AutocompleteIndex
+
+
+@register_warmup
+@functools.lru_cache(maxsize=None)
+def languages() -> Languages:
+    """Language lookups and autocomplete index, built once on first use."""
+    # Build lookup: both code -> name and name -> code (lowercased)
+    code_to_name = {k.lower(): v.title() for k, v in googletrans.LANGUAGES.items()}
+    name_to_code = {v.lower(): k for k, v in googletrans.LANGUAGES.items()}
+    # Index built once; each keystroke is a trie/n-gram lookup, not a scan
+    choices = sorted(code_to_name.items(), key=lambda t: t[1].lower())
+    index = AutocompleteIndex(
+        (name, [code], app_commands.Choice(name=f"{name} ({code})", value=code)) for code, name in choices
+    )
+    return Languages(code_to_name, name_to_code, index)
 
 
 async def _lang_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    cur = (current or "").lower()
-    choices = []
-    for code, name in LANG_CHOICES:
-        if not cur or cur in name.lower() or cur in code:
-            choices.append(app_commands.Choice(name=f"{name} ({code})", value=code))
-            if len(choices) >= 25:
-                break
-    return choices
+    return languages().index.search(current)
 
 
 class TranslateCog(commands.Cog):
-    """Translate text between languages using googletrans (runs translation in executor)."""
+    """Translate text between languages using googletrans (runs translation on a dedicated worker pool)."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        # Keep one translator instance (thread-safe enough for small bots)
-        self._translator = Translator()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="translate")
+        # googletrans keeps an HTTP client per Translator, so each worker thread gets its own
+        self._local = threading.local()
+        self._pending = 0
+        self._cache: "OrderedDict[Tuple[bytes, str], Segment]" = OrderedDict()
+
+    def cog_unload(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def export_state(self) -> dict:
+        """Cached translations as plain tuples, handed to the cog after a hot reload."""
+        return {"cache": [(key, tuple(segment)) for key, segment in self._cache.items()]}
+
+    def import_state(self, state: dict):
+        for key, segment in state.get("cache", ()):
+            self._cache[key] = Segment(*segment)
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _translator(self) -> "googletrans.Translator":
+        translator = getattr(self._local, "translator", None)
+        if translator is None:
+            translator = self._local.translator = googletrans.Translator()
+        return translator
+
+    def _translate_blocking(self, text: str, dest: str) -> Segment:
+        """Blocking; runs on the translate pool. One upstream call for the whole text."""
+        r = self._translator().translate(text, dest=dest)
+        return Segment(r.text, (getattr(r, "src", "") or "auto").lower(), getattr(r, "pronunciation", None))
+
+    async def _translate(self, text: str, dest: str) -> Segment:
+        """Translate the full text (keeping cross-line context), cached by (text hash, dest)."""
+        if not text.strip():
+            raise ValueError("Nothing to translate.")
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), dest)
+        segment = self._cache.get(key)
+        if segment is not None:
+            self._cache.move_to_end(key)
+            return segment
+
+        if self._pending >= MAX_PENDING:
+            raise TranslatorBusy()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            segment = await loop.run_in_executor(self._executor, self._translate_blocking, text, dest)
+        finally:
+            self._pending -= 1
+        self._cache[key] = segment
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return segment
 
     @commands.hybrid_command(
         name="translate",
@@ -66,14 +147,15 @@ class TranslateCog(commands.Cog):
             return
 
         # If user provided a language name, map to code if possible
+        langs = languages()
         dest_code = None
-        if dest_raw in CODE_TO_NAME:
+        if dest_raw in langs.code_to_name:
             dest_code = dest_raw
-        elif dest_raw in NAME_TO_CODE:
-            dest_code = NAME_TO_CODE[dest_raw]
+        elif dest_raw in langs.name_to_code:
+            dest_code = langs.name_to_code[dest_raw]
         else:
             # Try fuzzy: look for substring in language names
-            match = next((code for code, name in CODE_TO_NAME.items() if dest_raw in name.lower()), None)
+            match = next((code for code, name in langs.code_to_name.items() if dest_raw in name.lower()), None)
             if match:
                 dest_code = match
 
@@ -87,10 +169,17 @@ class TranslateCog(commands.Cog):
                 await ctx.send(embed=err)
             return
 
-        # Run translation in executor to avoid blocking
-        loop = asyncio.get_running_loop()
+        # Run translation on the dedicated pool (cached segments skip it entirely)
         try:
-            result = await loop.run_in_executor(None, lambda: self._translator.translate(text, dest=dest_code))
+            result = await self._translate(text, dest_code)
+        except TranslatorBusy:
+            err = discord.Embed(title="⏳ Translator busy", description="Too many translations are queued right now. Try again in a few seconds.", color=discord.Color.orange(), timestamp=discord.utils.utcnow())
+            err.set_footer(text=f"Requested by {requester}")
+            if is_interaction:
+                await ctx.response.send_message(embed=err, ephemeral=True)
+            else:
+                await ctx.send(embed=err)
+            return
         except Exception as exc:
             err = discord.Embed(title="⚠️ Translation failed", description="An error occurred while translating. Try again later.", color=discord.Color.red(), timestamp=discord.utils.utcnow())
             err.add_field(name="Details", value=str(exc)[:800], inline=False)
@@ -102,9 +191,9 @@ class TranslateCog(commands.Cog):
             return
 
         # Build response embed (truncate fields safely)
-        src_code = getattr(result, "src", "").lower() or "auto"
-        src_name = CODE_TO_NAME.get(src_code, src_code.upper())
-        dest_name = CODE_TO_NAME.get(dest_code, dest_code.upper())
+        src_code = result.src
+        src_name = langs.code_to_name.get(src_code, src_code.upper())
+        dest_name = langs.code_to_name.get(dest_code, dest_code.upper())
 
         orig = (text[:1000] + "…") if len(text) > 1000 else text
         trans_text = (result.text[:1000] + "…") if len(result.text) > 1000 else result.text
@@ -113,7 +202,7 @@ class TranslateCog(commands.Cog):
         embed.add_field(name=f"From — {src_name} ({src_code})", value=f"```{orig}```", inline=False)
         embed.add_field(name=f"To — {dest_name} ({dest_code})", value=f"```{trans_text}```", inline=False)
         # optional: show pronunciation if present
-        if getattr(result, "pronunciation", None):
+        if result.pronunciation:
             pron = result.pronunciation
             if len(pron) > 800:
                 pron = pron[:800] + "…"
@@ -128,3 +217,7 @@ class TranslateCog(commands.Cog):
                 await ctx.followup.send(embed=embed)
         else:
             await ctx.send(embed=embed)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(TranslateCog(bot))
@@ -3,8 +3,25 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import aiohttp
+import asyncio
+import os
+import re
 from datetime import datetime
 from typing import Union
+from urllib.parse import quote
+
+from core.cache import AsyncTTLCache
+
+WTTR_API = "https://wttr.in/{location}?format=j1"
+# seconds a lookup is fresh, and how much longer it may be served while refreshing
+CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", 600))
+CACHE_STALE_TTL = int(os.getenv("WEATHER_CACHE_STALE_TTL", 1800))
+CACHE_SIZE = 512
+
+
+def _normalize_location(location: str) -> str:
+    """Cache key for a location: 'New  York ' and 'new york' share one entry."""
+    return re.sub(r"\s+", " ", location).strip(" ,.").lower()
 
 
 class Weather(commands.Cog):
@@ -12,16 +29,16 @@ class Weather(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._session: aiohttp.ClientSession | None = None
+        self._timeout = aiohttp.ClientTimeout(total=10)
+        # one upstream request per location per TTL, shared by concurrent askers
+        self._cache = AsyncTTLCache(self._fetch, ttl=CACHE_TTL, stale_ttl=CACHE_STALE_TTL, maxsize=CACHE_SIZE)
 
-    async def cog_load(self):
-        """Create aiohttp session on load."""
-        self._session = aiohttp.ClientSession()
-
-    async def cog_unload(self):
-        """Close aiohttp session on unload."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+    async def _fetch(self, key: str) -> dict:
+        url = WTTR_API.format(location=quote(key))
+        async with self.bot.http_client.session.get(url, timeout=self._timeout) as resp:
+            if resp.status != 200:
+                raise ValueError(f"API returned {resp.status}")
+            return await resp.json()
 
     @commands.hybrid_command(name="weather", description="Get current weather for a location.")
     @app_commands.describe(location="City or place to check (e.g. London, Tokyo, New York)")
@@ -30,18 +47,9 @@ class Weather(commands.Cog):
         is_interaction = isinstance(ctx, discord.Interaction)
         requester = getattr(ctx.user if is_interaction else ctx.author, "display_name", "User")
 
-        # Make sure session exists
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-
-        # Basic wttr.in text API (no key needed)
-        url = f"https://wttr.in/{location}?format=j1"
-
         try:
-            async with self._session.get(url, timeout=10) as resp:
-                if resp.status != 200:
-                    raise ValueError(f"API returned {resp.status}")
-                data = await resp.json()
+            # Basic wttr.in JSON API (no key needed), cached per normalized location
+            data = await self._cache.get(_normalize_location(location))
 
             # Parse data
             current = data["current_condition"][0]
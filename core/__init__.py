@@ -0,0 +1,3 @@
+# Core Package
+# Shared bot-level services (scheduling, storage, ...) used by the cogs.
+# Lives outside cogs/ so the extension auto-loader does not pick it up.
@@ -0,0 +1,127 @@
+# core/autocomplete.py
+"""Precomputed index for slash-command autocomplete.
+
+Built once at import from a fixed list of entries; every keystroke is then a
+handful of dict lookups instead of a scan over the whole list.
+
+- exact matches of any key rank first;
+- then prefix matches of the primary key, then of any alias or trailing run
+  of words, served from a trie whose nodes already hold their first `limit`
+  results;
+- then substring matches of the primary key, found by intersecting n-gram
+  postings (1-3 characters) and verifying the few candidates left.
+
+    index = AutocompleteIndex([("english", ["en"], choice), ...])
+    index.search("eng")   # -> [choice, ...], at most 25
+"""
+import re
+from typing import Dict, Generic, Iterable, List, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 25   # Discord shows at most 25 choices
+GRAM = 3
+WORD_SPLIT = re.compile(r"[\s/_\-().,]+")
+
+
+class AutocompleteIndex(Generic[T]):
+    """Ranked prefix/substring lookup over (primary key, aliases, payload) entries."""
+
+    def __init__(self, entries: Iterable[Tuple[str, Sequence[str], T]], limit: int = DEFAULT_LIMIT):
+        self.limit = limit
+        self._payloads: List[T] = []
+        self._primary: List[str] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._trie: dict = {}
+        self._grams: Dict[str, List[int]] = {}
+
+        secondary: List[Tuple[int, str]] = []
+        for i, (primary, aliases, payload) in enumerate(entries):
+            primary = primary.lower()
+            self._payloads.append(payload)
+            self._primary.append(primary)
+            keys = {primary, *(a.lower() for a in aliases)}
+            # every word-suffix, so "york", "new york" and "new_york" all find America/New_York
+            words = [w for w in WORD_SPLIT.split(primary) if w]
+            keys.update(" ".join(words[k:]) for k in range(len(words)))
+            for key in keys:
+                self._exact.setdefault(key, []).append(i)
+                if key != primary:
+                    secondary.append((i, key))
+            for gram in self._ngrams(primary):
+                postings = self._grams.setdefault(gram, [])
+                if not postings or postings[-1] != i:
+                    postings.append(i)
+
+        # primary keys first so they own the head of every node's result list
+        for i, key in enumerate(self._primary):
+            self._insert(key, i)
+        for i, key in secondary:
+            self._insert(key, i)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    @staticmethod
+    def _ngrams(text: str) -> Set[str]:
+        return {text[j:j + n] for n in range(1, GRAM + 1) for j in range(len(text) - n + 1)}
+
+    def _insert(self, key: str, i: int):
+        node = self._trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+            top = node.setdefault("", [])
+            if len(top) < self.limit and i not in top:
+                top.append(i)
+
+    def search(self, query: str, limit: int = None) -> List[T]:
+        limit = min(limit or self.limit, self.limit)
+        query = (query or "").strip().lower()
+        if not query:
+            return self._payloads[:limit]
+        spaced = " ".join(w for w in WORD_SPLIT.split(query) if w)
+
+        ranked: List[int] = []
+        seen: Set[int] = set()
+
+        def take(ids: Iterable[int]) -> bool:
+            for i in ids:
+                if i not in seen:
+                    seen.add(i)
+                    ranked.append(i)
+                    if len(ranked) >= limit:
+                        return True
+            return False
+
+        if take(self._exact.get(query, ())):
+            return [self._payloads[i] for i in ranked]
+
+        for prefix in dict.fromkeys((query, spaced)):
+            node = self._trie
+            for ch in prefix:
+                node = node.get(ch)
+                if node is None:
+                    break
+            else:
+                if take(node.get("", ())):
+                    return [self._payloads[i] for i in ranked]
+
+        take(self._substring(query))
+        return [self._payloads[i] for i in ranked]
+
+    def _substring(self, query: str) -> Iterable[int]:
+        if len(query) <= GRAM:
+            return self._grams.get(query, ())
+        postings = []
+        for j in range(len(query) - GRAM + 1):
+            ids = self._grams.get(query[j:j + GRAM])
+            if not ids:
+                return ()
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return ()
+        return (i for i in sorted(candidates) if query in self._primary[i])
@@ -0,0 +1,152 @@
+# core/bulk.py
+"""Bounded-concurrency executor for bulk moderation actions.
+
+Runs one coroutine per target with at most `concurrency` in flight and keeps
+a single status message up to date (edited at most every PROGRESS_INTERVAL
+seconds). Rate limits are discord.py's job: its HTTP client waits on each
+route's bucket and retries 429s, so the executor only has to keep the number
+of concurrent requests small enough not to pile up behind one bucket.
+
+    executor = BulkExecutor(len(members), status, verb="Banning")
+    async with executor:
+        await executor.map(members, lambda m: guild.ban(m, reason=reason))
+    await status.edit(content=None, embed=executor.summary_embed("Mass ban"))
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import discord
+
+logger = logging.getLogger("bot.bulk")
+
+DEFAULT_CONCURRENCY = 4
+PROGRESS_INTERVAL = 2.0   # seconds between status message edits
+BAR_WIDTH = 20
+MAX_LISTED_FAILURES = 15
+
+
+def failure_reason(exc: Exception) -> str:
+    """Short, user-facing reason for a failed moderation call."""
+    if isinstance(exc, discord.Forbidden):
+        return "missing permissions / role hierarchy"
+    if isinstance(exc, discord.NotFound):
+        return "not found"
+    if isinstance(exc, discord.HTTPException):
+        return f"HTTP {exc.status}"
+    return type(exc).__name__
+
+
+class BulkExecutor:
+    """Runs a moderation action over many targets and reports progress."""
+
+    def __init__(self, total: int, status: Optional[discord.Message] = None, *, verb: str = "Processing",
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        self.total = total
+        self.status = status
+        self.verb = verb
+        self.concurrency = concurrency
+        self.succeeded: List[int] = []
+        self.failed: Dict[int, str] = {}
+        self._cancel = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._ticker: Optional[asyncio.Task] = None
+
+    # --- lifecycle ---
+    async def __aenter__(self) -> "BulkExecutor":
+        if self.status is not None:
+            self._ticker = asyncio.create_task(self._tick())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+
+    def cancel(self):
+        """Stop starting new actions; ones already in flight finish."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> int:
+        return len(self.succeeded) + len(self.failed)
+
+    # --- recording ---
+    def record_success(self, target_id: int):
+        self.succeeded.append(target_id)
+        self._changed.set()
+
+    def record_failure(self, target_id: int, reason: str):
+        self.failed[target_id] = reason
+        self._changed.set()
+
+    # --- execution ---
+    async def map(self, targets: Iterable[discord.abc.Snowflake],
+                  action: Callable[[discord.abc.Snowflake], Awaitable[object]]):
+        """Run `action` for every target with bounded concurrency."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for target in targets:
+            queue.put_nowait(target)
+
+        async def worker():
+            while not self._cancel.is_set():
+                try:
+                    target = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await action(target)
+                except Exception as exc:
+                    self.record_failure(target.id, failure_reason(exc))
+                else:
+                    self.record_success(target.id)
+
+        workers = min(self.concurrency, queue.qsize())
+        if workers:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+    # --- reporting ---
+    def progress_text(self) -> str:
+        filled = int(BAR_WIDTH * self.done / self.total) if self.total else BAR_WIDTH
+        bar = "█" * filled + "░" * (BAR_WIDTH - filled)
+        state = "Cancelling" if self.cancelled else self.verb
+        return (
+            f"⏳ {state}… `{bar}` {self.done}/{self.total} "
+            f"(✅ {len(self.succeeded)} · ❌ {len(self.failed)})"
+        )
+
+    async def _tick(self):
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            try:
+                await self.status.edit(content=self.progress_text())
+            except discord.HTTPException:
+                pass
+            await asyncio.sleep(PROGRESS_INTERVAL)
+
+    def summary_embed(self, title: str) -> discord.Embed:
+        """Final per-target breakdown."""
+        if self.failed or self.cancelled:
+            color = discord.Color.orange()
+        else:
+            color = discord.Color.green()
+        embed = discord.Embed(title=title, color=color, timestamp=discord.utils.utcnow())
+        embed.add_field(name="✅ Succeeded", value=str(len(self.succeeded)), inline=True)
+        embed.add_field(name="❌ Failed", value=str(len(self.failed)), inline=True)
+        skipped = self.total - self.done
+        if skipped:
+            embed.add_field(name="⏭️ Skipped (cancelled)", value=str(skipped), inline=True)
+        if self.failed:
+            lines = [f"<@{uid}> — {reason}" for uid, reason in list(self.failed.items())[:MAX_LISTED_FAILURES]]
+            if len(self.failed) > MAX_LISTED_FAILURES:
+                lines.append(f"… and {len(self.failed) - MAX_LISTED_FAILURES} more")
+            embed.add_field(name="Failures", value="\n".join(lines)[:1024], inline=False)
+        return embed
@@ -0,0 +1,100 @@
+# core/cache.py
+"""Async TTL cache with LRU eviction, single-flight loads and stale-while-revalidate.
+
+    cache = AsyncTTLCache(fetch_weather, ttl=600, stale_ttl=1800, maxsize=256)
+    data = await cache.get("london")
+
+- a fresh entry (younger than `ttl`) is returned straight from memory;
+- a stale entry (younger than `ttl + stale_ttl`) is returned immediately while
+  a background refresh replaces it;
+- on a miss, concurrent callers for the same key share one load.
+
+Failed loads are never cached; every waiter of that load gets the exception.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("bot.cache")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """Size-bounded async cache in front of a coroutine loader."""
+
+    def __init__(self, loader: Callable[[K], Awaitable[V]], *, ttl: float, stale_ttl: float = 0.0,
+                 maxsize: int = 256):
+        self._loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        # key -> (value, loaded_at); order is least to most recently used
+        self._entries: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._inflight: Dict[K, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: K) -> V:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, loaded_at = entry
+            age = time.monotonic() - loaded_at
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._load(key)
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        # shielded: a cancelled caller must not abort a load others are waiting on
+        return await asyncio.shield(self._load(key))
+
+    def peek(self, key: K) -> Optional[V]:
+        """Cached value regardless of age, without touching recency or loading."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def invalidate(self, key: K):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _load(self, key: K) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._run_load(key))
+            task.add_done_callback(self._log_background_failure)
+        return task
+
+    async def _run_load(self, key: K) -> V:
+        try:
+            self.loads += 1
+            value = await self._loader(key)
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task):
+        # retrieving the exception keeps asyncio from warning about refreshes nobody awaited
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Cache load failed: %s", task.exception())
@@ -0,0 +1,153 @@
+# core/command_sync.py
+"""Application command sync that only talks to Discord when something changed.
+
+The local command tree is serialized to the same payloads tree.sync() would
+upload. Those payloads are hashed, and the hash and payloads from the last
+successful sync are kept in data/command_sync.json, one entry per scope
+("global" or a guild id). A boot or reload with an unchanged tree skips the
+API round trip entirely. The stored payloads double as the baseline for a
+dry-run diff of added/removed/changed commands.
+
+    syncer = CommandSyncer(bot, guild_id=DEV_GUILD_ID)
+    await syncer.sync()              # no-op unless the tree changed
+    await syncer.sync(force=True)    # always upload
+    diff = await syncer.diff()       # what a sync would change
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import discord
+
+DATA_DIR = Path("data")
+SYNC_FILE = DATA_DIR / "command_sync.json"
+
+logger = logging.getLogger("bot.command_sync")
+
+Payload = Dict[str, Any]
+
+
+class CommandDiff(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class SyncResult(NamedTuple):
+    synced: bool      # False when the hash matched and no API call was made
+    digest: str
+    count: int
+
+
+def _key(payload: Payload) -> str:
+    """Unique per scope: slash, user and message commands may share a name."""
+    kind = {1: "/", 2: "user:", 3: "message:"}.get(payload.get("type", 1), "")
+    return f"{kind}{payload['name']}"
+
+
+class CommandSyncer:
+    """Hash-gated wrapper around tree.sync() for one scope (global or a single guild)."""
+
+    def __init__(self, bot, guild_id: Optional[int] = None, path: Path = SYNC_FILE):
+        self.bot = bot
+        self.guild_id = guild_id
+        self.path = path
+        self.scope = str(guild_id) if guild_id else "global"
+        self._lock = asyncio.Lock()
+        # contents of the sync file, loaded on first use and updated after each sync
+        self._state: Optional[Dict[str, Any]] = None
+
+    # --- local tree ---
+    def payloads(self) -> Dict[str, Payload]:
+        """Current command payloads for this scope, keyed by command type and name."""
+        tree = self.bot.tree
+        guild = discord.Object(id=self.guild_id) if self.guild_id else None
+        result = {}
+        for command in tree.get_commands(guild=guild):
+            try:
+                payload = command.to_dict(tree)  # discord.py >= 2.4
+            except TypeError:
+                payload = command.to_dict()
+            result[_key(payload)] = payload
+        return dict(sorted(result.items()))
+
+    @staticmethod
+    def digest(payloads: Dict[str, Payload]) -> str:
+        """Stable hash: key order and whitespace don't matter, option order does."""
+        blob = json.dumps(payloads, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    # --- persisted state ---
+    def _read_all(self) -> Dict[str, Any]:
+        """Blocking; runs in the executor once per process."""
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.warning("Unreadable %s; next sync will upload", self.path)
+            return {}
+
+    async def _stored(self) -> Dict[str, Any]:
+        """Last recorded sync for this scope; the file is read once, then kept in memory."""
+        if self._state is None:
+            state = await asyncio.get_running_loop().run_in_executor(None, self._read_all)
+            if self._state is None:
+                self._state = state
+        return self._state.get(self.scope) or {}
+
+    def _write(self, data: Dict[str, Any]):
+        """Blocking; runs in the executor."""
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp.replace(self.path)
+        except Exception:
+            logger.exception("Failed to save command sync state to %s", self.path)
+            try:
+                if tmp.exists():
+                    tmp.unlink()
+            except Exception:
+                pass
+
+    # --- public API ---
+    async def diff(self) -> CommandDiff:
+        """Commands added, removed or changed since the last recorded sync."""
+        current = self.payloads()
+        previous = (await self._stored()).get("commands") or {}
+        return CommandDiff(
+            added=sorted(set(current) - set(previous)),
+            removed=sorted(set(previous) - set(current)),
+            changed=sorted(k for k in set(current) & set(previous) if current[k] != previous[k]),
+        )
+
+    async def is_stale(self) -> bool:
+        """True if the local tree differs from what was last uploaded."""
+        return self.digest(self.payloads()) != (await self._stored()).get("hash")
+
+    async def sync(self, *, force: bool = False) -> SyncResult:
+        """Upload the tree if its hash changed (or `force`); record the new hash on success."""
+        async with self._lock:
+            payloads = self.payloads()
+            digest = self.digest(payloads)
+            if not force and digest == (await self._stored()).get("hash"):
+                logger.info("Command tree unchanged for %s (%s), skipping sync", self.scope, digest[:12])
+                return SyncResult(False, digest, len(payloads))
+
+            guild = discord.Object(id=self.guild_id) if self.guild_id else None
+            await self.bot.tree.sync(guild=guild)
+            self._state[self.scope] = {"hash": digest, "commands": payloads}
+            snapshot = dict(self._state)
+            await asyncio.get_running_loop().run_in_executor(None, self._write, snapshot)
+            logger.info("✅ Synced %d app commands to %s (%s)", len(payloads), self.scope, digest[:12])
+            return SyncResult(True, digest, len(payloads))
@@ -0,0 +1,209 @@
+# core/database.py
+"""SQLite storage shared by the cogs (infractions, blacklist, guild settings).
+
+The database runs in WAL mode on a single dedicated worker thread, so every
+query is off the event loop and the connection is never used concurrently.
+"""
+import asyncio
+import datetime
+import json
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DATA_DIR = Path("data")
+DB_FILE = DATA_DIR / "bot.db"
+
+# pre-database storage, imported once and renamed to *.migrated
+LEGACY_WARNINGS_FILE = Path("warnings.json")
+LEGACY_BLACKLIST_FILE = Path("blacklist.json")
+
+logger = logging.getLogger("bot.database")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS infractions (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id     INTEGER NOT NULL,
+    user_id      INTEGER NOT NULL,
+    moderator_id INTEGER,
+    action       TEXT    NOT NULL,
+    reason       TEXT,
+    timestamp    TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_infractions_member
+    ON infractions (guild_id, user_id, timestamp);
+
+CREATE TABLE IF NOT EXISTS blacklist (
+    user_id  TEXT PRIMARY KEY,
+    added_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id  INTEGER NOT NULL,
+    namespace TEXT    NOT NULL,
+    data      TEXT    NOT NULL,
+    PRIMARY KEY (guild_id, namespace)
+);
+"""
+
+
+class Database:
+    """Async facade over one sqlite3 connection owned by a single worker thread."""
+
+    def __init__(self, path: Path = DB_FILE):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # --- lifecycle ---
+    async def open(self):
+        await self._run(self._open_sync)
+
+    async def close(self):
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
+
+    def _open_sync(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        self._conn = conn
+        self._migrate_legacy()
+
+    def _migrate_legacy(self):
+        """Import the old warnings.json / blacklist.json files once."""
+        conn = self._conn
+        if LEGACY_WARNINGS_FILE.exists():
+            try:
+                data = json.loads(LEGACY_WARNINGS_FILE.read_text(encoding="utf-8")) or {}
+                rows = [
+                    (int(gid), int(uid), w.get("moderator_id"), "warn", w.get("reason"), w.get("timestamp") or "")
+                    for gid, users in data.items()
+                    for uid, warns in users.items()
+                    for w in warns
+                ]
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO infractions (guild_id, user_id, moderator_id, action, reason, timestamp) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                LEGACY_WARNINGS_FILE.replace(LEGACY_WARNINGS_FILE.with_suffix(".json.migrated"))
+                logger.info("Migrated %d warnings from %s", len(rows), LEGACY_WARNINGS_FILE)
+            except Exception:
+                logger.exception("Failed to migrate %s", LEGACY_WARNINGS_FILE)
+
+        if LEGACY_BLACKLIST_FILE.exists():
+            try:
+                data = json.loads(LEGACY_BLACKLIST_FILE.read_text(encoding="utf-8")) or {}
+                now = datetime.datetime.now().isoformat()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO blacklist (user_id, added_at) VALUES (?, ?)",
+                        [(str(u), now) for u in data.get("users", [])],
+                    )
+                LEGACY_BLACKLIST_FILE.replace(LEGACY_BLACKLIST_FILE.with_suffix(".json.migrated"))
+            except Exception:
+                logger.exception("Failed to migrate %s", LEGACY_BLACKLIST_FILE)
+
+    # --- infractions ---
+    async def add_infraction(self, guild_id: int, user_id: int, moderator_id: Optional[int],
+                             reason: str, action: str = "warn") -> int:
+        """Record an infraction and return the member's total for that action."""
+        def op():
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO infractions (guild_id, user_id, moderator_id, action, reason, timestamp) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (guild_id, user_id, moderator_id, action, reason, datetime.datetime.now().isoformat()),
+                )
+            return self._count_sync(guild_id, user_id, action)
+        return await self._run(op)
+
+    async def get_infractions(self, guild_id: int, user_id: int, action: Optional[str] = None,
+                              limit: int = 5) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return (total, most recent `limit` infractions oldest-first)."""
+        def op():
+            total = self._count_sync(guild_id, user_id, action)
+            sql = "SELECT moderator_id, action, reason, timestamp FROM infractions WHERE guild_id = ? AND user_id = ?"
+            params: list = [guild_id, user_id]
+            if action is not None:
+                sql += " AND action = ?"
+                params.append(action)
+            sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+            params.append(limit)
+            rows = [dict(r) for r in self._conn.execute(sql, params)]
+            rows.reverse()
+            return total, rows
+        return await self._run(op)
+
+    def _count_sync(self, guild_id: int, user_id: int, action: Optional[str]) -> int:
+        if action is None:
+            cur = self._conn.execute(
+                "SELECT COUNT(*) FROM infractions WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+        else:
+            cur = self._conn.execute(
+                "SELECT COUNT(*) FROM infractions WHERE guild_id = ? AND user_id = ? AND action = ?",
+                (guild_id, user_id, action))
+        return cur.fetchone()[0]
+
+    # --- blacklist ---
+    async def is_blacklisted(self, user_id: str) -> bool:
+        def op():
+            cur = self._conn.execute("SELECT 1 FROM blacklist WHERE user_id = ?", (str(user_id),))
+            return cur.fetchone() is not None
+        return await self._run(op)
+
+    async def add_to_blacklist(self, user_id: str) -> bool:
+        """Returns False if the user was already blacklisted."""
+        def op():
+            with self._conn:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO blacklist (user_id, added_at) VALUES (?, ?)",
+                    (str(user_id), datetime.datetime.now().isoformat()),
+                )
+            return cur.rowcount > 0
+        return await self._run(op)
+
+    async def remove_from_blacklist(self, user_id: str) -> bool:
+        """Returns False if the user was not blacklisted."""
+        def op():
+            with self._conn:
+                cur = self._conn.execute("DELETE FROM blacklist WHERE user_id = ?", (str(user_id),))
+            return cur.rowcount > 0
+        return await self._run(op)
+
+    # --- guild settings ---
+    async def load_guild_settings(self) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """Every stored (guild_id, namespace, settings) row."""
+        def op():
+            rows = []
+            for r in self._conn.execute("SELECT guild_id, namespace, data FROM guild_settings"):
+                try:
+                    rows.append((r["guild_id"], r["namespace"], json.loads(r["data"])))
+                except ValueError:
+                    continue
+            return rows
+        return await self._run(op)
+
+    async def save_guild_settings(self, rows: List[Tuple[int, str, Dict[str, Any]]]):
+        """Upsert many (guild_id, namespace, settings) rows in one transaction."""
+        def op():
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO guild_settings (guild_id, namespace, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT (guild_id, namespace) DO UPDATE SET data = excluded.data",
+                    [(gid, ns, json.dumps(data)) for gid, ns, data in rows],
+                )
+        await self._run(op)
@@ -0,0 +1,133 @@
+# core/guild_config.py
+"""Per-guild settings with an in-memory cache in front of the SQLite store.
+
+Every stored row is loaded once at startup, so reads are plain dict hits and
+never touch disk. Writes update the cache immediately and are flushed to the
+database in batches shortly afterwards (write-behind).
+
+Cogs describe their settings as a frozen dataclass and register it under a
+namespace to get a typed accessor:
+
+    self.settings = bot.guild_config.register("antispam", AntiSpamSettings)
+    cfg = self.settings.get(guild.id)          # AntiSpamSettings instance
+    self.settings.update(guild.id, enabled=True)
+"""
+import asyncio
+import contextlib
+import dataclasses
+import logging
+from typing import Any, Dict, Generic, Optional, Set, Tuple, Type, TypeVar
+
+logger = logging.getLogger("bot.guild_config")
+
+FLUSH_DELAY = 2.0  # seconds to batch writes before flushing
+
+T = TypeVar("T")
+
+
+class GuildSettings(Generic[T]):
+    """Typed view of one namespace of the guild config service."""
+
+    def __init__(self, service: "GuildConfigService", namespace: str, schema: Type[T]):
+        self._service = service
+        self.namespace = namespace
+        self.schema = schema
+        self._cache: Dict[int, T] = {}
+
+    def get(self, guild_id: int) -> T:
+        """Current settings for a guild (defaults if never configured). O(1), no I/O."""
+        settings = self._cache.get(guild_id)
+        if settings is None:
+            settings = self._cache[guild_id] = self._build(self._service.raw(guild_id, self.namespace))
+        return settings
+
+    def update(self, guild_id: int, **changes: Any) -> T:
+        """Apply changes, cache the new value and queue it for the next flush."""
+        settings = dataclasses.replace(self.get(guild_id), **changes)
+        self._cache[guild_id] = settings
+        self._service._stage(guild_id, self.namespace, _to_json(settings))
+        return settings
+
+    def _build(self, raw: Dict[str, Any]) -> T:
+        known = {f.name: f for f in dataclasses.fields(self.schema)}
+        values = {}
+        for key, value in raw.items():
+            field = known.get(key)
+            if field is None:
+                continue
+            # JSON has no tuples; restore them so frozen settings stay hashable
+            if isinstance(value, list):
+                value = tuple(value)
+            values[key] = value
+        try:
+            return self.schema(**values)
+        except TypeError:
+            logger.warning("Discarding malformed %s settings", self.namespace)
+            return self.schema()
+
+
+def _to_json(settings: Any) -> Dict[str, Any]:
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in dataclasses.asdict(settings).items()}
+
+
+class GuildConfigService:
+    """Owns the raw settings rows and the write-behind flush to the database."""
+
+    def __init__(self, db):
+        self.db = db
+        self._raw: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._namespaces: Dict[str, GuildSettings] = {}
+        self._dirty: Set[Tuple[int, str]] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load(self):
+        for guild_id, namespace, data in await self.db.load_guild_settings():
+            self._raw[(guild_id, namespace)] = data
+
+    def register(self, namespace: str, schema: Type[T]) -> GuildSettings[T]:
+        """Get the typed accessor for a namespace (re-registering returns a fresh view)."""
+        view = GuildSettings(self, namespace, schema)
+        self._namespaces[namespace] = view
+        return view
+
+    def raw(self, guild_id: int, namespace: str) -> Dict[str, Any]:
+        """Stored JSON for one guild and namespace ({} if never configured)."""
+        return self._raw.get((guild_id, namespace), {})
+
+    def _stage(self, guild_id: int, namespace: str, data: Dict[str, Any]):
+        self._raw[(guild_id, namespace)] = data
+        self._dirty.add((guild_id, namespace))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_DELAY)
+        await self.flush()
+        # rows staged while the write was in flight (or re-queued after a failed
+        # write) found this task still running and scheduled nothing themselves
+        if self._dirty:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self):
+        """Write every dirty row in one transaction."""
+        if not self._dirty:
+            return
+        batch, self._dirty = self._dirty, set()
+        rows = [(gid, ns, self._raw[(gid, ns)]) for gid, ns in batch]
+        try:
+            await self.db.save_guild_settings(rows)
+        except asyncio.CancelledError:
+            self._dirty |= batch  # upserts are idempotent; close() writes them again
+            raise
+        except Exception:
+            logger.exception("Failed to flush %d guild setting(s)", len(rows))
+            self._dirty |= batch
+
+    async def close(self):
+        task = self._flush_task
+        if task and not task.done():
+            task.cancel()
+            # let a cancelled mid-write flush re-queue its batch before the final flush
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
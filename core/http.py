@@ -0,0 +1,114 @@
+# core/http.py
+"""Bot-wide aiohttp client shared by every cog that calls external APIs.
+
+One ClientSession over one tuned TCPConnector means keep-alive connections,
+TLS sessions and DNS lookups are reused across commands and cogs. Request
+tracing keeps per-host counters (requests, errors, latency, fresh vs reused
+connections) for the owner diagnostics command.
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger("bot.http")
+
+# Connector tuning
+TOTAL_CONNECTIONS = 100
+CONNECTIONS_PER_HOST = 10
+DNS_CACHE_TTL = 300        # seconds
+KEEPALIVE_TIMEOUT = 30     # seconds an idle connection is kept for reuse
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+
+class HostStats:
+    __slots__ = ("requests", "errors", "total_ms", "max_ms", "new_connections", "reused_connections")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.requests if self.requests else 0.0
+
+
+class HTTPClient:
+    """Owns the shared aiohttp session; created in setup_hook, closed on shutdown."""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.stats: Dict[str, HostStats] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # only reached if a cog runs before setup_hook or after close()
+            self._session = self._create_session()
+        return self._session
+
+    async def start(self):
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=TOTAL_CONNECTIONS,
+            limit_per_host=CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=DEFAULT_TIMEOUT,
+            trace_configs=[self._trace_config()],
+        )
+
+    # --- tracing ---
+    def _host(self, url) -> HostStats:
+        host = url.host or "?"
+        stats = self.stats.get(host)
+        if stats is None:
+            stats = self.stats[host] = HostStats()
+        return stats
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.started = time.perf_counter()
+            ctx.new_connection = False
+
+        async def on_connection_create_end(session, ctx, params):
+            ctx.new_connection = True
+
+        async def on_request_end(session, ctx, params):
+            elapsed_ms = (time.perf_counter() - ctx.started) * 1000
+            stats = self._host(params.url)
+            stats.requests += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            if ctx.new_connection:
+                stats.new_connections += 1
+            else:
+                stats.reused_connections += 1
+
+        async def on_request_exception(session, ctx, params):
+            stats = self._host(params.url)
+            stats.requests += 1
+            stats.errors += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
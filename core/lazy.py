@@ -0,0 +1,91 @@
+# core/lazy.py
+"""Deferred imports for heavyweight third-party modules.
+
+`lazy_import(name)` returns a stand-in module that imports the real one on
+first attribute access, so a cog can declare the dependency at the top of
+the file without paying for it while the bot is starting up. Every stand-in
+is registered, and `warm()` imports all of them on worker threads once the
+bot is up, so the first command usually finds the module already loaded.
+Expensive module-level tables can be deferred the same way with a cached
+builder passed to `register_warmup()`.
+
+    googletrans = lazy_import("googletrans")
+    translator = googletrans.Translator()   # real import happens here (or in warm())
+"""
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+from typing import Callable, Dict
+
+logger = logging.getLogger("bot.lazy")
+
+_registry: Dict[str, "LazyModule"] = {}
+# blocking, idempotent builders (usually lru_cached) keyed by qualified name
+_warmups: Dict[str, Callable[[], object]] = {}
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports `name` the first time one of its attributes is read."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lock"] = threading.Lock()
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_module"] = module
+                    logger.info("Imported %s in %.0fms", self.__name__, (time.perf_counter() - started) * 1000)
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return the (shared) lazy stand-in for module `name`."""
+    proxy = _registry.get(name)
+    if proxy is None:
+        proxy = _registry[name] = LazyModule(name)
+        if name in sys.modules:
+            proxy.__dict__["_module"] = sys.modules[name]
+    return proxy
+
+
+def register_warmup(builder: Callable[[], object]) -> Callable[[], object]:
+    """Have `warm()` call `builder` in the background; returns it, so usable as a decorator."""
+    _warmups[f"{builder.__module__}.{builder.__qualname__}"] = builder
+    return builder
+
+
+async def warm():
+    """Import every registered lazy module, then run the warm-up builders, on worker threads.
+
+    Failures are logged, not raised; the work is retried (and the error
+    surfaces) on first real use.
+    """
+    pending = {proxy.__name__: proxy._load for proxy in _registry.values() if not proxy.loaded}
+    for stage in (pending, dict(_warmups)):
+        if not stage:
+            continue
+        results = await asyncio.gather(*(asyncio.to_thread(fn) for fn in stage.values()), return_exceptions=True)
+        for name, result in zip(stage, results):
+            if isinstance(result, BaseException):
+                logger.warning("Background warm-up of %s failed: %r", name, result)
@@ -0,0 +1,222 @@
+# core/pipeline.py
+"""Single on_message dispatch for the auto-moderation cogs.
+
+The bot owns one MessagePipeline. Each gateway message is skipped early when
+it comes from a bot/DM or when no detector is enabled for the guild;
+otherwise it is wrapped in a ParsedMessage (mentions, links, content hash and
+attachments, each computed at most once) and handed to the registered
+detectors in priority order. A detector returns True when it consumed the
+message (e.g. deleted it), which stops the remaining detectors.
+"""
+import logging
+import re
+import time
+import zlib
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import discord
+
+logger = logging.getLogger("bot.pipeline")
+
+# One pass over the message: masked links first so their target isn't matched twice
+LINK_RE = re.compile(
+    r"""
+    \[(?P<label>[^\]]*)\]\(\s*<?(?P<masked>https?://[^\s)>]+)>?\s*\)
+    | (?P<invite>(?:https?://)?(?:www\.)?(?:discord\.gg|discord(?:app)?\.com/invite)/[\w-]+)
+    | (?P<url>https?://[^\s<>()\[\]]+)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+# Something in a masked link's label that looks like a domain
+LABEL_HOST_RE = re.compile(r"(?:https?://)?((?:[\w-]+\.)+[a-z]{2,})", re.IGNORECASE)
+INVITE_HOST = "discord.gg"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_UNSET = object()
+
+
+def normalize_host(host: str) -> Optional[str]:
+    """Lowercase, IDNA-encode and strip a leading www. / trailing dot."""
+    host = (host or "").strip().rstrip(".").lower()
+    if not host:
+        return None
+    try:
+        host = host.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def _host_of(url: str) -> Optional[str]:
+    try:
+        return normalize_host(urlsplit(url).hostname or "")
+    except ValueError:
+        return None
+
+
+def extract_links(content: str) -> List[Tuple[str, str]]:
+    """Return (kind, host) for every link in the text; kind is url, invite or masked."""
+    links: List[Tuple[str, str]] = []
+    for m in LINK_RE.finditer(content):
+        if m.group("masked"):
+            host = _host_of(m.group("masked"))
+            if host:
+                label_host = LABEL_HOST_RE.search(m.group("label") or "")
+                # a label that names a different site than the target is deceptive
+                if label_host and normalize_host(label_host.group(1)) != host:
+                    links.append(("masked", host))
+                else:
+                    links.append(("url", host))
+        elif m.group("invite"):
+            links.append(("invite", INVITE_HOST))
+        else:
+            host = _host_of(m.group("url"))
+            if host:
+                links.append(("url", host))
+    return links
+
+
+def content_hash(content: str) -> int:
+    """Hash of case/whitespace-normalized content, so trivial variations still match."""
+    normalized = _WHITESPACE_RE.sub(" ", content.casefold()).strip()
+    return zlib.crc32(normalized.encode("utf-8"))
+
+
+class ParsedMessage:
+    """A guild message plus everything detectors derive from it, computed once."""
+
+    __slots__ = ("message", "guild_id", "author", "content", "exempt",
+                 "_user_mentions", "_links", "_hash")
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.guild_id: int = message.guild.id
+        self.author = message.author
+        self.content: str = message.content or ""
+        # moderators are exempt from the rate/link filters
+        self.exempt: bool = isinstance(message.author, discord.Member) and \
+            message.author.guild_permissions.manage_messages
+        self._user_mentions = _UNSET
+        self._links = _UNSET
+        self._hash = _UNSET
+
+    @property
+    def user_mentions(self) -> Tuple[int, ...]:
+        """Distinct users mentioned, excluding the author."""
+        if self._user_mentions is _UNSET:
+            author_id = self.author.id
+            self._user_mentions = tuple(
+                uid for uid in dict.fromkeys(self.message.raw_mentions) if uid != author_id
+            )
+        return self._user_mentions
+
+    @property
+    def role_mentions(self) -> List[int]:
+        return self.message.raw_role_mentions
+
+    @property
+    def mentions_everyone(self) -> bool:
+        return self.message.mention_everyone
+
+    @property
+    def mention_count(self) -> int:
+        return len(self.message.raw_mentions) + len(self.message.raw_role_mentions)
+
+    @property
+    def links(self) -> List[Tuple[str, str]]:
+        if self._links is _UNSET:
+            self._links = extract_links(self.content) if self.content else []
+        return self._links
+
+    @property
+    def content_hash(self) -> Optional[int]:
+        if self._hash is _UNSET:
+            self._hash = content_hash(self.content) if self.content else None
+        return self._hash
+
+    @property
+    def attachments(self) -> List[discord.Attachment]:
+        return self.message.attachments
+
+
+DetectorHandler = Callable[[ParsedMessage], Awaitable[bool]]
+GuildFilter = Callable[[int], bool]
+
+
+class _Detector:
+    __slots__ = ("name", "priority", "handler", "is_enabled")
+
+    def __init__(self, name: str, priority: int, handler: DetectorHandler, is_enabled: GuildFilter):
+        self.name = name
+        self.priority = priority
+        self.handler = handler
+        self.is_enabled = is_enabled
+
+
+class StageStats:
+    __slots__ = ("calls", "total_ns", "max_ns", "consumed")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.consumed = 0
+
+    def add(self, elapsed_ns: int):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+class MessagePipeline:
+    """Priority-ordered fan-out of guild messages to auto-moderation detectors."""
+
+    def __init__(self):
+        self._detectors: List[_Detector] = []
+        self.stats: Dict[str, StageStats] = {"dispatch": StageStats()}
+        self.skipped = 0
+
+    def register(self, name: str, handler: DetectorHandler, *, priority: int = 100,
+                 is_enabled: GuildFilter = lambda guild_id: True):
+        """Add (or replace) a detector. Lower priority runs first."""
+        self.unregister(name)
+        self._detectors.append(_Detector(name, priority, handler, is_enabled))
+        self._detectors.sort(key=lambda d: d.priority)
+        self.stats.setdefault(name, StageStats())
+
+    def unregister(self, name: str):
+        self._detectors = [d for d in self._detectors if d.name != name]
+
+    @property
+    def detectors(self) -> List[str]:
+        return [d.name for d in self._detectors]
+
+    async def dispatch(self, message: discord.Message):
+        """on_message listener registered by the bot."""
+        if message.guild is None or message.author.bot:
+            return
+        guild_id = message.guild.id
+        active = [d for d in self._detectors if d.is_enabled(guild_id)]
+        if not active:
+            self.skipped += 1
+            return
+
+        started = time.perf_counter_ns()
+        parsed = ParsedMessage(message)
+        for detector in active:
+            stage_start = time.perf_counter_ns()
+            try:
+                consumed = await detector.handler(parsed)
+            except Exception:
+                logger.exception("Detector %s failed on message %s", detector.name, message.id)
+                consumed = False
+            stage = self.stats[detector.name]
+            stage.add(time.perf_counter_ns() - stage_start)
+            if consumed:
+                stage.consumed += 1
+                break
+        self.stats["dispatch"].add(time.perf_counter_ns() - started)
@@ -0,0 +1,131 @@
+# core/prefetch.py
+"""Background-filled buffers of items from slow third-party APIs.
+
+A PrefetchPool keeps up to `size` items in memory and tops itself up in the
+background with batched requests once it drops below `low_water`, so a
+command normally just pops an item and never waits on the network. Items
+served recently (by key) are skipped when refilling. Only when the pool is
+completely empty does a caller wait, and then it joins the refill already in
+flight instead of starting its own request.
+
+    pool = PrefetchPool("meme", fetch_batch, key=lambda m: m["postLink"])
+    item = await pool.get()   # None if the source is unreachable
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Generic, Hashable, List, Optional, Set, TypeVar
+
+logger = logging.getLogger("bot.prefetch")
+
+T = TypeVar("T")
+
+MAX_EMPTY_BATCHES = 3  # refill gives up after this many batches with nothing new
+
+
+class PrefetchPool(Generic[T]):
+    """Bounded deque of pre-fetched items with single-flight async refills."""
+
+    def __init__(self, name: str, fetch_batch: Callable[[int], Awaitable[List[T]]],
+                 key: Callable[[T], Hashable], *, size: int = 20, low_water: int = 5,
+                 batch: int = 10, recent: int = 200):
+        self.name = name
+        self._fetch_batch = fetch_batch
+        self._key = key
+        self.size = size
+        self.low_water = low_water
+        self.batch = batch
+        self._items: Deque[T] = deque(maxlen=size)
+        self._buffered: Set[Hashable] = set()
+        # keys served lately, oldest first; the set mirrors it for O(1) checks
+        self._recent: Deque[Hashable] = deque(maxlen=recent)
+        self._recent_keys: Set[Hashable] = set()
+        self._available = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def start(self):
+        """Begin filling the pool in the background."""
+        self._schedule_refill()
+
+    def close(self):
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+
+    async def get(self) -> Optional[T]:
+        """Pop a buffered item, waiting on a refill only if the pool is empty."""
+        if self._items:
+            self.hits += 1
+        else:
+            self.misses += 1
+            # join the refill in flight and return as soon as its first batch lands
+            refill = self._schedule_refill()
+            available = asyncio.ensure_future(self._available.wait())
+            try:
+                await asyncio.wait({refill, available}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                available.cancel()
+            if not self._items:
+                return None
+
+        item = self._items.popleft()
+        if not self._items:
+            self._available.clear()
+        key = self._key(item)
+        self._buffered.discard(key)
+        self._mark_served(key)
+        if len(self._items) < self.low_water:
+            self._schedule_refill()
+        return item
+
+    def _mark_served(self, key: Hashable):
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_keys.discard(self._recent[0])
+        self._recent.append(key)
+        self._recent_keys.add(key)
+
+    def _schedule_refill(self) -> asyncio.Task:
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill(), name=f"prefetch-{self.name}")
+        return self._refill_task
+
+    async def _refill(self):
+        empty_batches = 0
+        repeats: List[T] = []
+        while len(self._items) < self.size and empty_batches < MAX_EMPTY_BATCHES:
+            want = min(self.batch, self.size - len(self._items))
+            try:
+                fetched = await self._fetch_batch(want)
+            except Exception as e:
+                logger.warning("Prefetch for %s failed: %s", self.name, e)
+                break
+
+            added = 0
+            for item in fetched:
+                key = self._key(item)
+                if key in self._buffered:
+                    continue
+                if key in self._recent_keys:
+                    repeats.append(item)
+                    continue
+                if len(self._items) >= self.size:
+                    break
+                self._push(item, key)
+                added += 1
+            empty_batches = empty_batches + 1 if not added else 0
+
+        # a small source can run out of unseen items; a repeat beats no answer
+        if not self._items:
+            for item in repeats[:self.low_water or 1]:
+                key = self._key(item)
+                if key not in self._buffered:
+                    self._push(item, key)
+
+    def _push(self, item: T, key: Hashable):
+        self._items.append(item)
+        self._buffered.add(key)
+        self._available.set()
@@ -0,0 +1,197 @@
+# core/reload.py
+"""Hot reload of extensions under cogs/, optionally driven by file changes.
+
+Reloads go through `bot.reload_extension`, so the gateway connection, member
+caches and every bot-level service (scheduler, database, HTTP client, ...)
+stay up. Only the named modules are re-executed. Afterwards the command tree
+is re-synced through the hash-gated CommandSyncer, which makes no API call
+unless a command signature actually changed.
+
+State handoff: before an extension is reloaded, each of its cogs that
+defines `export_state()` is asked for a snapshot. After the reload, the cog
+with the same name receives it through `import_state(state)`. Snapshots
+should be plain data (tuples, dicts, numbers, strings), not instances of the
+module's own classes, because those classes are replaced by the reload.
+State that already lives in a bot-level service, such as reminder jobs in
+the scheduler or guild settings, survives without any handoff.
+
+File watching uses watchfiles (inotify, FSEvents, ...) when it is installed
+and otherwise polls modification times every POLL_INTERVAL seconds.
+"""
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import watchfiles  # optional: native change notifications
+except ImportError:
+    watchfiles = None
+
+logger = logging.getLogger("bot.reload")
+
+POLL_INTERVAL = 1.0  # seconds between mtime scans when watchfiles is unavailable
+
+
+class ReloadResult(NamedTuple):
+    reloaded: List[str]
+    loaded: List[str]
+    unloaded: List[str]
+    failed: Dict[str, str]   # extension -> error
+    synced: bool             # True if the command tree changed and was uploaded
+
+
+class ExtensionReloader:
+    """Reloads changed extensions with cog state handoff; owns the optional file watcher."""
+
+    def __init__(self, bot, base: Path = Path("cogs")):
+        self.bot = bot
+        self.base = base
+        self._lock = asyncio.Lock()
+        self._watcher: Optional[asyncio.Task] = None
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and not self._watcher.done()
+
+    @property
+    def backend(self) -> str:
+        return "watchfiles" if watchfiles is not None else f"polling every {POLL_INTERVAL:g}s"
+
+    def module_for(self, path) -> Optional[str]:
+        """Extension name for a file under the cogs tree (None for anything else)."""
+        path = Path(path)
+        if path.suffix != ".py" or path.name == "__init__.py":
+            return None
+        root = self.base.resolve()
+        try:
+            relative = path.resolve().relative_to(root.parent)
+        except ValueError:
+            return None
+        if relative.parts[0] != root.name:
+            return None
+        return ".".join(relative.with_suffix("").parts)  # e.g. cogs.fun.insult
+
+    def _path_for(self, name: str) -> Path:
+        return self.base.resolve().parent.joinpath(*name.split(".")).with_suffix(".py")
+
+    # --- state handoff ---
+    def _cogs_of(self, name: str) -> List[Any]:
+        return [
+            cog for cog in self.bot.cogs.values()
+            if cog.__module__ == name or cog.__module__.startswith(name + ".")
+        ]
+
+    def _export(self, name: str) -> Dict[str, Any]:
+        states = {}
+        for cog in self._cogs_of(name):
+            export = getattr(cog, "export_state", None)
+            if export is None:
+                continue
+            try:
+                states[cog.qualified_name] = export()
+            except Exception:
+                logger.exception("export_state failed for %s; it will start empty", cog.qualified_name)
+        return states
+
+    def _import(self, name: str, states: Dict[str, Any]):
+        for cog in self._cogs_of(name):
+            state = states.get(cog.qualified_name)
+            restore = getattr(cog, "import_state", None)
+            if state is None or restore is None:
+                continue
+            try:
+                restore(state)
+            except Exception:
+                logger.exception("import_state failed for %s", cog.qualified_name)
+
+    # --- reloading ---
+    async def reload(self, names: Iterable[str]) -> ReloadResult:
+        """Reload (or load/unload, if the file appeared/vanished) each extension, then re-sync if needed."""
+        result = ReloadResult([], [], [], {}, False)
+        async with self._lock:
+            for name in sorted(set(names)):
+                exists = self._path_for(name).exists()
+                try:
+                    if name in self.bot.extensions and exists:
+                        states = self._export(name)
+                        try:
+                            # on failure discord.py restores the previous module, so hand state back either way
+                            await self.bot.reload_extension(name)
+                        finally:
+                            self._import(name, states)
+                        result.reloaded.append(name)
+                    elif exists:
+                        await self.bot.load_extension(name)
+                        result.loaded.append(name)
+                    elif name in self.bot.extensions:
+                        await self.bot.unload_extension(name)
+                        result.unloaded.append(name)
+                    else:
+                        result.failed[name] = "no such extension"
+                        continue
+                    logger.info("🔄 %s", name)
+                except Exception as exc:
+                    cause = exc.__cause__ or exc
+                    result.failed[name] = f"{type(cause).__name__}: {cause}"
+                    logger.exception("❌ Failed to reload %s", name)
+
+            if result.reloaded or result.loaded or result.unloaded:
+                try:
+                    synced = (await self.bot.command_sync.sync()).synced
+                    result = result._replace(synced=synced)
+                except Exception:
+                    logger.exception("❌ Slash command sync error after reload")
+        return result
+
+    # --- file watching ---
+    def start_watching(self):
+        if not self.watching:
+            self._watcher = asyncio.create_task(self._watch())
+            logger.info("Watching %s for changes (%s)", self.base, self.backend)
+
+    async def stop_watching(self):
+        task, self._watcher = self._watcher, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _watch(self):
+        changes = self._changes_watchfiles() if watchfiles is not None else self._changes_polling()
+        async for paths in changes:
+            names = {name for name in map(self.module_for, paths) if name}
+            if not names:
+                continue
+            try:
+                result = await self.reload(names)
+            except Exception:
+                logger.exception("Auto-reload failed")
+                continue
+            if result.failed:
+                logger.warning("Auto-reload errors: %s", result.failed)
+
+    async def _changes_watchfiles(self):
+        async for changes in watchfiles.awatch(self.base, watch_filter=watchfiles.PythonFilter()):
+            yield [path for _, path in changes]
+
+    def _scan(self) -> Dict[str, float]:
+        mtimes = {}
+        for py in self.base.rglob("*.py"):
+            try:
+                mtimes[str(py)] = py.stat().st_mtime
+            except OSError:
+                pass  # deleted between listing and stat
+        return mtimes
+
+    async def _changes_polling(self):
+        before = await asyncio.to_thread(self._scan)
+        while True:
+            await asyncio.sleep(POLL_INTERVAL)
+            after = await asyncio.to_thread(self._scan)
+            changed = [p for p in after.keys() | before.keys() if after.get(p) != before.get(p)]
+            before = after
+            if changed:
+                yield changed
@@ -0,0 +1,347 @@
+# core/scheduler.py
+"""Persistent delayed-job scheduler shared by every cog.
+
+One store, one priority queue and one wakeup task for the whole process.
+Cogs register a handler per job type ("reminder", "timer", ...) and schedule
+jobs against it instead of running their own pollers.
+
+The store is a snapshot (data/jobs.json) plus an append-only journal
+(data/jobs.log) of put/del records. Mutations only append a line; the journal
+is folded into a fresh snapshot every COMPACT_EVERY records and on shutdown.
+Replay is idempotent, so a record that lands in both is harmless.
+"""
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+DATA_DIR = Path("data")
+JOBS_FILE = DATA_DIR / "jobs.json"
+JOURNAL_SUFFIX = ".log"
+COMPACT_EVERY = 1000  # journal records between snapshots
+RETRY_DELAY = 1.0     # first back-off after a failed journal append, doubling
+MAX_RETRY_DELAY = 60.0
+CLOSE_TIMEOUT = 5.0   # how long close() waits for the journal writer before snapshotting
+
+logger = logging.getLogger("bot.scheduler")
+
+Job = Dict[str, Any]  # {id, type, run_at, user_id, channel_id, data}
+JobHandler = Callable[[Job], Awaitable[None]]
+
+
+class JobScheduler:
+    """Min-heap scheduler with an id index and a per-(type, user) index."""
+
+    def __init__(self, bot, path: Path = JOBS_FILE):
+        self.bot = bot
+        self.path = path
+        self.journal_path = path.with_suffix(JOURNAL_SUFFIX)
+        self._jobs: Dict[str, Job] = {}
+        self._by_owner: Dict[Tuple[str, Optional[int]], Set[str]] = {}
+        # (run_at, seq, job_id); cancelled ids are skipped lazily when popped
+        self._heap: List[Tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._handlers: Dict[str, Tuple[JobHandler, Optional[int]]] = {}
+        # due jobs whose type has no handler yet (cog not loaded)
+        self._waiting: Dict[str, List[Job]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # handler runs in flight; referenced here so they aren't garbage-collected mid-run
+        self._running: Set[asyncio.Task] = set()
+        # journal records not yet on disk, drained by a single writer task
+        self._pending: List[Dict[str, Any]] = []
+        self._journal_len = 0
+        self._writer: Optional[asyncio.Task] = None
+        self._loaded = False
+
+    # --- lifecycle ---
+    async def start(self):
+        """Load persisted jobs and start the wakeup loop."""
+        await self._load()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop the wakeup loop and flush pending jobs to disk."""
+        if self._task:
+            self._task.cancel()
+        if not self._loaded:
+            return  # never read the store; don't clobber it with an empty snapshot
+        if self._writer and not self._writer.done():
+            try:
+                await asyncio.wait_for(self._writer, timeout=CLOSE_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass  # still failing; the snapshot below covers every live job anyway
+        await self._compact()
+
+    async def persist(self) -> bool:
+        """Write every job to disk now (a fresh snapshot). True once it is there."""
+        if not self._loaded:
+            return False
+        return await self._compact()
+
+    # --- handlers ---
+    def register(self, job_type: str, handler: JobHandler, max_late: Optional[int] = None):
+        """Register the coroutine that runs jobs of `job_type`.
+
+        Jobs that come due more than `max_late` seconds after their run time
+        (e.g. after a long downtime) are dropped instead of delivered.
+        """
+        self._handlers[job_type] = (handler, max_late)
+        for job in self._waiting.pop(job_type, []):
+            self._spawn(job)
+
+    def unregister(self, job_type: str):
+        self._handlers.pop(job_type, None)
+
+    # --- jobs ---
+    def schedule(self, job_type: str, run_at: int, *, user_id: Optional[int] = None,
+                 channel_id: Optional[int] = None, job_id: Optional[str] = None, **data) -> Job:
+        """Schedule a job and persist it. Returns the stored job dict.
+
+        `job_id` defaults to a random id; an explicit one must not be in use.
+        """
+        if job_id is not None and job_id in self._jobs:
+            raise ValueError(f"Job id {job_id!r} is already scheduled.")
+        job = {
+            "id": job_id or uuid.uuid4().hex[:12],
+            "type": job_type,
+            "run_at": int(run_at),
+            "user_id": user_id,
+            "channel_id": channel_id,
+            "data": data,
+        }
+        self._add(job)
+        self._journal({"op": "put", "job": job})
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a pending job. Returns False if it does not exist."""
+        job = self._remove(job_id)
+        if job is None:
+            return False
+        self._journal({"op": "del", "id": job_id})
+        return True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def jobs_for(self, job_type: str, user_id: Optional[int]) -> List[Job]:
+        """All pending jobs of a type owned by a user, soonest first."""
+        ids = self._by_owner.get((job_type, user_id), ())
+        return sorted((self._jobs[i] for i in ids), key=lambda j: j["run_at"])
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _add(self, job: Job):
+        self._jobs[job["id"]] = job
+        self._by_owner.setdefault((job["type"], job["user_id"]), set()).add(job["id"])
+        heapq.heappush(self._heap, (job["run_at"], next(self._seq), job["id"]))
+        if self._heap[0][2] == job["id"]:
+            self._wakeup.set()
+
+    def _remove(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        key = (job["type"], job["user_id"])
+        owned = self._by_owner.get(key)
+        if owned is not None:
+            owned.discard(job_id)
+            if not owned:
+                del self._by_owner[key]
+        return job
+
+    # --- wakeup loop ---
+    def _peek(self) -> Optional[int]:
+        """Earliest live run time, discarding cancelled heap entries."""
+        while self._heap:
+            run_at, _, job_id = self._heap[0]
+            job = self._jobs.get(job_id)
+            if job is not None and job["run_at"] == run_at:
+                return run_at
+            heapq.heappop(self._heap)
+        return None
+
+    def _pop_due(self) -> List[Job]:
+        now_ts = time.time()
+        due: List[Job] = []
+        while True:
+            run_at = self._peek()
+            if run_at is None or run_at > now_ts:
+                break
+            _, _, job_id = heapq.heappop(self._heap)
+            due.append(self._remove(job_id))
+        return due
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        while True:
+            # clear before peeking so a schedule() racing with the peek still wakes us
+            self._wakeup.clear()
+            next_at = self._peek()
+            if next_at is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = next_at - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue  # woken early: re-peek the heap
+                except asyncio.TimeoutError:
+                    pass
+
+            # each handler runs on its own task, so one slow delivery doesn't hold up the rest
+            for job in self._pop_due():
+                self._spawn(job)
+
+    def _spawn(self, job: Job):
+        task = asyncio.create_task(self._dispatch(job))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _dispatch(self, job: Job):
+        entry = self._handlers.get(job["type"])
+        if entry is None:
+            # keep it (and its journal record) around until the owning cog registers
+            self._waiting.setdefault(job["type"], []).append(job)
+            return
+        self._journal({"op": "del", "id": job["id"]})
+        handler, max_late = entry
+        if max_late is not None and job["run_at"] < time.time() - max_late:
+            return
+        try:
+            await handler(job)
+        except Exception:
+            logger.exception("Job %s (%s) failed", job["id"], job["type"])
+
+    # --- persistence ---
+    async def _load(self):
+        """Rebuild state from the snapshot, then replay the journal on top of it."""
+        loop = asyncio.get_running_loop()
+
+        def read_files():
+            snapshot, records = [], []
+            try:
+                with self.path.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, list):
+                    snapshot = data
+            except Exception:
+                pass
+            try:
+                with self.journal_path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            records.append(json.loads(line))
+                        except ValueError:
+                            continue  # torn tail from a crash mid-append
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.exception("Failed to read %s", self.journal_path)
+            return snapshot, records
+
+        snapshot, records = await loop.run_in_executor(None, read_files)
+        jobs: Dict[str, Job] = {}
+        for item in snapshot:
+            job = self._coerce(item)
+            if job is not None:
+                jobs[job["id"]] = job
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            if record.get("op") == "put":
+                job = self._coerce(record.get("job"))
+                if job is not None:
+                    jobs[job["id"]] = job
+            elif record.get("op") == "del":
+                jobs.pop(str(record.get("id")), None)
+
+        for job in jobs.values():
+            self._add(job)
+        self._journal_len = len(records)
+        self._loaded = True
+
+    @staticmethod
+    def _coerce(item: Any) -> Optional[Job]:
+        try:
+            return {
+                "id": str(item["id"]),
+                "type": str(item["type"]),
+                "run_at": int(item["run_at"]),
+                "user_id": int(item["user_id"]) if item.get("user_id") is not None else None,
+                "channel_id": int(item["channel_id"]) if item.get("channel_id") is not None else None,
+                "data": dict(item.get("data") or {}),
+            }
+        except Exception:
+            return None
+
+    def _journal(self, record: Dict[str, Any]):
+        """Queue a journal record; a burst of mutations is written in one append."""
+        self._pending.append(record)
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        delay = RETRY_DELAY
+        while self._pending:
+            batch, self._pending = self._pending, []
+            lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch)
+
+            def append(lines):
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.journal_path.open("a", encoding="utf-8") as f:
+                    f.write(lines)
+
+            try:
+                await loop.run_in_executor(None, append, lines)
+                self._journal_len += len(batch)
+                delay = RETRY_DELAY
+            except Exception:
+                logger.exception("Failed to append to %s; retrying in %.0fs", self.journal_path, delay)
+                # keep the records (ahead of anything queued since) and try again
+                self._pending[:0] = batch
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                continue
+
+            if self._journal_len >= COMPACT_EVERY:
+                await self._compact()
+
+    async def _compact(self) -> bool:
+        """Write the live job set as a fresh snapshot and truncate the journal."""
+        loop = asyncio.get_running_loop()
+        payload = list(self._jobs.values()) + [j for jobs in self._waiting.values() for j in jobs]
+
+        def write_files(payload):
+            tmp = self.path.with_suffix(".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with tmp.open("w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                tmp.replace(self.path)
+                # the snapshot now covers every record written so far
+                self.journal_path.open("w", encoding="utf-8").close()
+                return True
+            except Exception:
+                try:
+                    if tmp.exists():
+                        tmp.unlink()
+                except Exception:
+                    pass
+                return False
+
+        if await loop.run_in_executor(None, write_files, payload):
+            self._journal_len = 0
+            return True
+        logger.warning("Failed to compact %s", self.path)
+        return False